@@ -4,15 +4,17 @@ Streamlit Web Application for Voter RAG Chatbot
 import streamlit as st
 import os
 import sys
+import uuid
 from typing import List, Dict, Any
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from config import SQL_DUMP_PATH
-from utils.data_loader import load_voters_from_sql, get_statistics
+from config import SQL_DUMP_PATH, SQL_ROW_LIMIT, INGEST_WORKERS, SNAPSHOT_PATH, SESSION_MAX_TURNS
+from utils.snapshot import load_voter_data
 from embeddings.vector_store import VoterVectorStore
-from rag.chain import initialize_rag_system, ConversationManager
+from rag.chain import initialize_rag_system
+from rag.sessions import SessionStore
 
 
 # Page configuration
@@ -70,17 +72,21 @@ st.markdown("""
 def initialize_system():
     """Initialize the RAG system (cached to avoid reloading)."""
     with st.spinner("Loading voter database..."):
-        voters, documents = load_voters_from_sql(SQL_DUMP_PATH)
-        stats = get_statistics(voters)
+        # Memory-mapped from the snapshot unless the dump changed since it was written
+        voters, documents, statistics = load_voter_data(
+            SQL_DUMP_PATH, SNAPSHOT_PATH, limit=SQL_ROW_LIMIT, workers=INGEST_WORKERS
+        )
     
     with st.spinner("Initializing AI search engine..."):
         vector_store = VoterVectorStore()
         vector_store.get_or_create(documents)
     
     with st.spinner("Setting up chatbot..."):
-        rag_chain, conversation_manager = initialize_rag_system(vector_store)
+        rag_chain, _ = initialize_rag_system(vector_store, voters)
+        # Shared by every browser session; each gets its own bounded history
+        sessions = SessionStore(rag_chain)
     
-    return rag_chain, conversation_manager, voters, stats
+    return rag_chain, sessions, voters, statistics
 
 
 def format_voter_card(doc) -> str:
@@ -103,6 +109,26 @@ def format_voter_card(doc) -> str:
     return card
 
 
+# Source cards shown under an answer
+SOURCE_CARDS = 3
+
+
+def remember_message(message: Dict[str, Any]):
+    """
+    Add a message to the chat shown in this browser session.
+    
+    Only the last SESSION_MAX_TURNS exchanges, and the source documents
+    actually shown under each answer, are kept, so the UI state stays as
+    bounded as the session's conversation history.
+    """
+    if message.get("sources"):
+        message["source_count"] = len(message["sources"])
+        message["sources"] = message["sources"][:SOURCE_CARDS]
+    messages = st.session_state.messages
+    messages.append(message)
+    del messages[:-2 * SESSION_MAX_TURNS]
+
+
 def main():
     """Main application function."""
     
@@ -112,7 +138,7 @@ def main():
     
     # Initialize system
     try:
-        rag_chain, conversation_manager, voters, stats = initialize_system()
+        rag_chain, sessions, voters, statistics = initialize_system()
     except Exception as e:
         st.error(f"Error initializing system: {str(e)}")
         st.info("Please make sure voters.sql file exists in the project directory.")
@@ -121,8 +147,12 @@ def main():
     # Initialize session state for chat history
     if "messages" not in st.session_state:
         st.session_state.messages = []
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    conversation_manager = sessions.get(st.session_state.session_id)
     
     # Sidebar
+    stats = statistics.summary()
     with st.sidebar:
         st.header("📊 Database Statistics")
         
@@ -175,7 +205,7 @@ def main():
         # Clear chat button
         if st.button("🗑️ Clear Chat History"):
             st.session_state.messages = []
-            conversation_manager.clear_history()
+            sessions.drop(st.session_state.session_id)
             st.rerun()
     
     # Display chat history
@@ -186,14 +216,15 @@ def main():
             # Display source documents if available
             if message["role"] == "assistant" and "sources" in message:
                 if message["sources"]:
-                    with st.expander(f"📚 View {len(message['sources'])} source(s)"):
-                        for i, doc in enumerate(message["sources"][:3]):
+                    count = message.get("source_count", len(message["sources"]))
+                    with st.expander(f"📚 View {count} source(s)"):
+                        for i, doc in enumerate(message["sources"]):
                             st.markdown(format_voter_card(doc), unsafe_allow_html=True)
     
     # Chat input
     if prompt := st.chat_input("Ask a question about voters... (Bengali or English)"):
         # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        remember_message({"role": "user", "content": prompt})
         
         # Display user message
         with st.chat_message("user"):
@@ -201,35 +232,38 @@ def main():
         
         # Get bot response
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                try:
-                    result = conversation_manager.chat(prompt)
-                    answer = result["answer"]
-                    sources = result["source_documents"]
-                    
-                    # Display answer
-                    st.markdown(answer)
-                    
-                    # Display sources
-                    if sources:
-                        with st.expander(f"📚 View {len(sources)} source(s)"):
-                            for i, doc in enumerate(sources[:3]):
-                                st.markdown(format_voter_card(doc), unsafe_allow_html=True)
-                    
-                    # Add assistant response to chat history
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": answer,
-                        "sources": sources
-                    })
+            try:
+                # Routing and retrieval; the answer itself is streamed below
+                with st.spinner("Searching..."):
+                    stream = conversation_manager.chat_stream(prompt)
+                sources = stream.source_documents
                 
-                except Exception as e:
-                    error_msg = f"Sorry, I encountered an error: {str(e)}"
-                    st.error(error_msg)
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": error_msg
-                    })
+                # Display answer as it is generated
+                answer = st.write_stream(stream)
+                cached = f" · cached ({stream.cached})" if stream.cached else ""
+                st.caption(f"⚡ {stream.route}{cached} · first token {stream.timings['first_token_ms']:.0f} ms"
+                           f" · {stream.timings['total_ms']:.0f} ms")
+                
+                # Display sources
+                if sources:
+                    with st.expander(f"📚 View {len(sources)} source(s)"):
+                        for i, doc in enumerate(sources[:SOURCE_CARDS]):
+                            st.markdown(format_voter_card(doc), unsafe_allow_html=True)
+                
+                # Add assistant response to chat history
+                remember_message({
+                    "role": "assistant",
+                    "content": answer,
+                    "sources": sources
+                })
+            
+            except Exception as e:
+                error_msg = f"Sorry, I encountered an error: {str(e)}"
+                st.error(error_msg)
+                remember_message({
+                    "role": "assistant",
+                    "content": error_msg
+                })
     
     # Footer
     st.divider()
@@ -0,0 +1,134 @@
+"""
+Vector Backend Benchmark
+Compares Chroma with the NumPy backend (exact and IVF) on a synthetic
+voter set: build time, query latency percentiles, top-k agreement with
+exact search and the resident memory a loaded index adds
+
+Runs offline with FakeEmbeddings. Query vectors are embedded up front so
+the latencies are the backends' alone.
+
+Usage:
+    python benchmarks/bench_backends.py [rows] [queries]
+"""
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("EMBEDDING_PROVIDER", "fake")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_dump
+
+
+BACKENDS = {
+    'chroma': ('chroma', None),
+    'numpy': ('numpy', 'exact'),
+    'numpy-ivf': ('numpy', 'ivf'),
+}
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process (Linux), falling back to the peak."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def open_store(name: str, store_path: str):
+    """A VoterVectorStore for one benchmarked backend, without the embedding cache."""
+    import embeddings.vector_store as vector_store_module
+    from embeddings.vector_store import VoterVectorStore
+
+    backend, mode = BACKENDS[name]
+    vector_store_module.EMBEDDING_CACHE_PATH = None
+    if mode:
+        vector_store_module.NUMPY_INDEX_MODE = mode
+    store = VoterVectorStore(backend=backend)
+    store.persist_directory = store_path
+    return store
+
+
+def run_child(phase: str, name: str, dump_path: str, store_path: str, queries: int):
+    """Build or query one backend in this (fresh) process; print a JSON report."""
+    from utils.data_loader import load_voters_from_sql
+
+    voters, documents = load_voters_from_sql(dump_path)
+    store = open_store(name, store_path)
+    if phase == "build":
+        start = time.perf_counter()
+        store.create_from_documents(documents)
+        print(json.dumps({'build_seconds': time.perf_counter() - start}))
+        return
+
+    rng = random.Random(1)
+    texts = [f"{voter['name']} পিতা {voter['father_name']}" for voter in rng.sample(list(voters), queries)]
+    vectors = store.embeddings.embed_documents(texts)
+    del documents
+
+    # Memory attributable to opening the index and serving queries
+    rss_before = current_rss_mb()
+    store.load_existing()
+    store.vector_store.query(vectors[0], 10)
+
+    latencies, results = [], []
+    for vector in vectors:
+        start = time.perf_counter()
+        records = store.vector_store.query(vector, 10)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([record['id'] for record in records])
+    latencies.sort()
+
+    print(json.dumps({
+        'p50_ms': latencies[len(latencies) // 2],
+        'p99_ms': latencies[max(0, int(len(latencies) * 0.99) - 1)],
+        'rss_mb': current_rss_mb() - rss_before,
+        'results': results,
+    }))
+
+
+def main(rows: int = 20000, queries: int = 200):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows)
+        print(f"Synthetic dump: {rows} rows, {queries} queries")
+
+        reports = {}
+        for name in BACKENDS:
+            reports[name] = {}
+            for phase in ("build", "query"):
+                # A fresh interpreter per phase keeps the RSS numbers honest
+                out = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--child", phase, name, path,
+                     os.path.join(tmp, name), str(queries)],
+                    check=True, capture_output=True, text=True
+                ).stdout.strip().splitlines()
+                reports[name].update(json.loads(out[-1]))
+
+        exact = reports['numpy']['results']
+        print(f"\n{'backend':<10} {'build s':>8} {'p50 ms':>7} {'p99 ms':>7} {'RSS MB':>7} {'recall@10':>10}")
+        for name, report in reports.items():
+            overlap = [
+                len(set(found) & set(truth)) / max(1, len(truth))
+                for found, truth in zip(report['results'], exact)
+            ]
+            print(f"{name:<10} {report['build_seconds']:>8.1f} {report['p50_ms']:>7.2f} "
+                  f"{report['p99_ms']:>7.2f} {report['rss_mb']:>7.1f} {sum(overlap) / len(overlap):>10.3f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3], sys.argv[4], sys.argv[5], int(sys.argv[6]))
+    else:
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 200
+        )
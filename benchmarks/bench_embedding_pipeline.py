@@ -0,0 +1,46 @@
+"""
+Embedding Pipeline Benchmark
+Runs the batched embedding pipeline offline against FakeEmbeddings with
+simulated API latency and reports throughput per concurrency level
+
+Usage:
+    python benchmarks/bench_embedding_pipeline.py [rows] [latency_seconds]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_dump
+from embeddings.fake import FakeEmbeddings
+from embeddings.pipeline import EmbeddingPipeline
+from utils.data_loader import load_voters_from_sql
+
+
+def main(rows: int = 5000, latency: float = 0.2):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows)
+        _, documents = load_voters_from_sql(path)
+        documents = list(documents)
+
+    print(f"\n{'concurrency':>11} {'batches':>8} {'seconds':>8} {'docs/sec':>9} {'tokens/sec':>11}")
+    for concurrency in (1, 2, 4, 8):
+        written = []
+        pipeline = EmbeddingPipeline(
+            FakeEmbeddings(latency=latency),
+            sink=lambda batch, vectors: written.extend(vectors),
+            max_concurrency=concurrency
+        )
+        stats = asyncio.run(pipeline.run(documents))
+        assert len(written) == len(documents)
+        print(f"{concurrency:>11} {stats['batches_done']:>8} {stats['elapsed_seconds']:>8.2f} "
+              f"{stats['documents_per_second']:>9.0f} {stats['tokens_per_second']:>11.0f}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    )
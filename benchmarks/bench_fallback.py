@@ -0,0 +1,103 @@
+"""
+Fallback Parser Benchmark
+Compares the old character-by-character fallback parser with the
+index-based scanner on a synthetic dump
+
+Usage:
+    python benchmarks/bench_fallback.py [rows]    # default: 1,000,000 rows
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_dump
+from utils.data_loader import VOTER_COLUMNS, parse_sql_alternative
+
+
+def legacy_parse_record_values(record):
+    """The fallback value parser before the scanner replaced it."""
+    values = []
+    current = ""
+    in_quotes = False
+    for char in record:
+        if char == "'" and not in_quotes:
+            in_quotes = True
+            current += char
+        elif char == "'" and in_quotes:
+            in_quotes = False
+            current += char
+        elif char == ',' and not in_quotes:
+            values.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current:
+        values.append(current.strip())
+    cleaned = []
+    for v in values:
+        v = v.strip()
+        if v.startswith("'") and v.endswith("'"):
+            v = v[1:-1]
+        elif v == 'NULL':
+            v = None
+        cleaned.append(v)
+    return cleaned
+
+
+def legacy_parse_sql_alternative(content, columns):
+    """The line-joining fallback before the scanner replaced it."""
+    voters = []
+    in_values = False
+    current_values = ""
+    for line in content.split('\n'):
+        if 'INSERT INTO' in line and 'voters' in line:
+            in_values = True
+            continue
+        if in_values:
+            current_values += line
+    for record in re.split(r'\),\s*\n?\(', current_values):
+        record = record.strip()
+        if record.startswith('('):
+            record = record[1:]
+        if record.endswith(');'):
+            record = record[:-2]
+        if record.endswith(')'):
+            record = record[:-1]
+        if not record:
+            continue
+        values = legacy_parse_record_values(record)
+        if len(values) >= len(columns):
+            voters.append({
+                col: None if values[i] in ('NULL', None) else str(values[i]).strip("'")
+                for i, col in enumerate(columns)
+            })
+    return voters
+
+
+def timed(parse, content):
+    start = time.perf_counter()
+    voters = parse(content, VOTER_COLUMNS)
+    return len(voters), time.perf_counter() - start
+
+
+def main(rows: int = 1_000_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        # One row per INSERT line matches the layout the old fallback expected
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows, rows_per_insert=rows)
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+
+    print(f"Synthetic dump: {rows} rows, {len(content) / 1e6:.1f}M characters")
+    new_rows, new_time = timed(parse_sql_alternative, content)
+    print(f"scanner:  {new_rows:>9} rows in {new_time:8.2f}s ({new_rows / new_time:,.0f} rows/sec)")
+    old_rows, old_time = timed(legacy_parse_sql_alternative, content)
+    print(f"legacy:   {old_rows:>9} rows in {old_time:8.2f}s ({old_rows / old_time:,.0f} rows/sec)")
+    print(f"speedup:  {old_time / new_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,120 @@
+"""
+Hybrid Retrieval Benchmark
+Compares dense-only and hybrid (BM25 + dense, reciprocal-rank fusion)
+retrieval on a synthetic voter set: hit rate, MRR and query latency for
+serial numbers, dates of birth, Bengali names and English-typed names
+
+Runs offline with FakeEmbeddings.
+
+Usage:
+    python benchmarks/bench_hybrid.py [rows] [queries_per_kind]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("EMBEDDING_PROVIDER", "fake")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import embeddings.vector_store as vector_store_module
+from benchmarks.synthetic import write_synthetic_dump
+from embeddings.query_cache import QueryCache
+from embeddings.vector_store import VoterVectorStore
+from utils.data_loader import load_voters_from_sql
+
+
+# Query kind -> (query template, columns that must match for a hit)
+QUERY_KINDS = {
+    'serial': ("ক্রমিক নং {serial}", ('serial',)),
+    'date_of_birth': ("জন্ম তারিখ {date_of_birth}", ('date_of_birth',)),
+    'bengali_name': ("{name} পিতা {father_name}", ('name', 'father_name')),
+    'english_name': ("{phonetic_name} father {phonetic_father_name}", ('phonetic_name', 'phonetic_father_name')),
+}
+
+
+def build_queries(voters, per_kind: int, seed: int = 1):
+    """Sample voters and turn them into (kind, query, relevant ids) triples."""
+    rng = random.Random(seed)
+    by_key = {}
+    for kind, (_, columns) in QUERY_KINDS.items():
+        groups = {}
+        for voter in voters:
+            key = tuple(voter[column] for column in columns)
+            groups.setdefault(key, set()).add(str(voter['id']))
+        by_key[kind] = groups
+
+    queries = []
+    for kind, (template, columns) in QUERY_KINDS.items():
+        for index in rng.sample(range(len(voters)), per_kind):
+            voter = voters[index]
+            key = tuple(voter[column] for column in columns)
+            queries.append((kind, template.format(**voter.to_dict()), by_key[kind][key]))
+    return queries
+
+
+def evaluate(search, queries, k: int = 10):
+    """Hit@5, MRR@k and latency percentiles per query kind."""
+    results = {}
+    for kind in QUERY_KINDS:
+        hits, reciprocal_ranks, latencies = 0, [], []
+        for query_kind, query, relevant in queries:
+            if query_kind != kind:
+                continue
+            start = time.perf_counter()
+            documents = search(query, k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            ranks = [rank for rank, doc in enumerate(documents, 1) if doc.metadata.get('id') in relevant]
+            hits += bool(ranks and ranks[0] <= 5)
+            reciprocal_ranks.append(1.0 / ranks[0] if ranks else 0.0)
+        latencies.sort()
+        results[kind] = {
+            'hit@5': hits / len(latencies),
+            'mrr@10': statistics.mean(reciprocal_ranks),
+            'p50_ms': latencies[len(latencies) // 2],
+            'p95_ms': latencies[int(len(latencies) * 0.95) - 1],
+        }
+    return results
+
+
+def main(rows: int = 5000, per_kind: int = 100):
+    # Keep the benchmark from touching the real embedding cache
+    vector_store_module.EMBEDDING_CACHE_PATH = None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows)
+        voters, documents = load_voters_from_sql(path)
+
+        store = VoterVectorStore()
+        store.persist_directory = os.path.join(tmp, "chroma_db")
+        # Time every search in full rather than the in-memory query cache
+        store.query_cache = QueryCache(max_results=0, max_embeddings=0)
+        store.create_from_documents(documents)
+        print(f"Keyword index: {store.bm25.nbytes() / len(store.bm25):.0f} bytes/voter, "
+              f"{os.path.getsize(store.bm25_path) / 1e6:.1f} MB on disk")
+
+        queries = build_queries(voters, per_kind)
+        modes = {
+            'dense': store.dense_search,
+            'hybrid': store.hybrid_search,
+        }
+        # Warm up both paths before timing
+        for search in modes.values():
+            search(queries[0][1], 10)
+
+        print(f"\n{'kind':<14} {'mode':<7} {'hit@5':>6} {'mrr@10':>7} {'p50 ms':>7} {'p95 ms':>7}")
+        for name, search in modes.items():
+            for kind, row in evaluate(search, queries).items():
+                print(f"{kind:<14} {name:<7} {row['hit@5']:>6.2f} {row['mrr@10']:>7.3f} "
+                      f"{row['p50_ms']:>7.2f} {row['p95_ms']:>7.2f}")
+
+        store.delete_collection()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    )
@@ -0,0 +1,48 @@
+"""
+Parallel Ingestion Benchmark
+Times load_voters_from_sql with 1/2/4/8 workers and checks every run
+produces exactly the serial output
+
+Usage:
+    python benchmarks/bench_parallel.py [rows]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_dump
+from utils.data_loader import load_voters_from_sql
+
+
+def main(rows: int = 200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows)
+        print(f"Synthetic dump: {rows} rows, {os.path.getsize(path) / 1e6:.1f} MB, {os.cpu_count()} CPUs")
+
+        baseline = None
+        serial_time = None
+        results = []
+        for workers in (1, 2, 4, 8):
+            start = time.perf_counter()
+            voters, documents = load_voters_from_sql(path, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            # JSON rather than pickle: pickle output depends on object identity
+            output = [[row.to_dict() for row in voters], list(documents)]
+            encoded = json.dumps(output, ensure_ascii=False).encode('utf-8')
+            if baseline is None:
+                baseline, serial_time = encoded, elapsed
+            results.append((workers, elapsed, encoded == baseline))
+
+        print(f"\n{'workers':>7} {'seconds':>9} {'rows/sec':>11} {'speedup':>8} {'identical':>10}")
+        for workers, elapsed, identical in results:
+            print(f"{workers:>7} {elapsed:>9.2f} {rows / elapsed:>11.0f} "
+                  f"{serial_time / elapsed:>7.2f}x {str(identical):>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
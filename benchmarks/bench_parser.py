@@ -0,0 +1,80 @@
+"""
+SQL Dump Parser Benchmark
+Compares the streaming parser against the old whole-file regex parser
+
+Usage:
+    python benchmarks/bench_parser.py [rows]
+"""
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import resource
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_dump
+from utils.data_loader import VOTER_COLUMNS, iter_voters
+
+
+# The regex used by parse_sql_dump before the streaming parser replaced it
+LEGACY_PATTERN = r'\((\d+),\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*(NULL|\'[^\']*\'),\s*(NULL|\'[^\']*\'),\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*(NULL|\'[^\']*\'),\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\'\)'
+
+
+def legacy_parse(file_path: str) -> int:
+    """Old path: read everything, findall, build dicts. Returns row count."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    voters = []
+    for match in re.findall(LEGACY_PATTERN, content):
+        voter = {}
+        for col, value in zip(VOTER_COLUMNS, match):
+            if value == 'NULL':
+                voter[col] = None
+            elif value.startswith("'") and value.endswith("'"):
+                voter[col] = value[1:-1]
+            else:
+                voter[col] = value
+        voters.append(voter)
+    return len(voters)
+
+
+def streaming_parse(file_path: str) -> int:
+    """New path: stream rows through the generator without keeping them."""
+    return sum(1 for _ in iter_voters(file_path))
+
+
+def run_child(mode: str, file_path: str):
+    """Run one parser in this (fresh) process and print rows, seconds, peak RSS."""
+    parse = legacy_parse if mode == "regex" else streaming_parse
+    start = time.perf_counter()
+    rows = parse(file_path)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{rows} {elapsed} {peak_kb}")
+
+
+def main(rows: int = 200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"Synthetic dump: {rows} rows, {size_mb:.1f} MB")
+        print(f"{'parser':<10} {'rows':>9} {'seconds':>9} {'rows/sec':>11} {'peak RSS MB':>12}")
+
+        for mode in ("regex", "stream"):
+            # A fresh interpreter per parser keeps the peak RSS numbers honest
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", mode, path],
+                check=True, capture_output=True, text=True
+            ).stdout.split()
+            parsed, elapsed, peak_kb = int(out[0]), float(out[1]), int(out[2])
+            print(f"{mode:<10} {parsed:>9} {elapsed:>9.2f} {parsed / elapsed:>11.0f} {peak_kb / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,88 @@
+"""
+Quantized Vector Storage Benchmark
+Builds one NumPy index and scans it at full precision, as per-vector
+scaled int8, as float16 and with truncated dimensions: in-RAM bytes per
+voter, recall@10 against the full-precision result and query latency,
+with and without full-precision re-ranking
+
+Runs offline with FakeEmbeddings at text-embedding-3-small's 1536
+dimensions. Hashed fake vectors are not Matryoshka-trained, so the
+truncated rows understate the recall real embeddings keep.
+
+Usage:
+    python benchmarks/bench_quantization.py [rows] [queries]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_dump
+from embeddings.backends import NumpyBackend
+from embeddings.fake import FakeEmbeddings
+from utils.data_loader import load_voters_from_sql
+
+
+# label -> NumpyBackend options
+CONFIGS = {
+    'float32': {},
+    'int8': {'quantization': 'int8'},
+    'int8 no-rerank': {'quantization': 'int8', 'rerank': 1},
+    'float16': {'quantization': 'float16'},
+    'int8 @512': {'quantization': 'int8', 'dimensions': 512},
+    'int8 @256': {'quantization': 'int8', 'dimensions': 256},
+    'float32 @512': {'dimensions': 512},
+}
+
+
+def main(rows: int = 20000, queries: int = 200, k: int = 10):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows)
+        voters, documents = load_voters_from_sql(path)
+        embeddings = FakeEmbeddings(dimension=1536)
+
+        index_path = os.path.join(tmp, "numpy_index")
+        base = NumpyBackend(index_path, "voters")
+        base.open()
+        for start in range(0, len(documents), 1000):
+            batch = documents[start:start + 1000]
+            base.upsert(
+                [doc['id'] for doc in batch],
+                embeddings.embed_documents([doc['content'] for doc in batch]),
+                [doc['content'] for doc in batch],
+                [doc['metadata'] for doc in batch]
+            )
+        base.flush()
+
+        rng = random.Random(1)
+        texts = [f"{voter['name']} পিতা {voter['father_name']}" for voter in rng.sample(list(voters), queries)]
+        vectors = embeddings.embed_documents(texts)
+        truth = [[record['id'] for record in base.query(vector, k)] for vector in vectors]
+        print(f"{rows} voters, {queries} queries, 1536 dimensions")
+
+        print(f"\n{'storage':<15} {'bytes/voter':>11} {'recall@10':>10} {'p50 ms':>7} {'p95 ms':>7}")
+        for label, options in CONFIGS.items():
+            backend = NumpyBackend(index_path, "voters", **options)
+            backend.open()
+            backend.query(vectors[0], k)
+
+            latencies, recalls = [], []
+            for vector, expected in zip(vectors, truth):
+                start = time.perf_counter()
+                found = [record['id'] for record in backend.query(vector, k)]
+                latencies.append((time.perf_counter() - start) * 1000)
+                recalls.append(len(set(found) & set(expected)) / len(expected))
+            latencies.sort()
+            print(f"{label:<15} {backend.nbytes() / backend.count():>11.0f} "
+                  f"{sum(recalls) / len(recalls):>10.3f} {latencies[len(latencies) // 2]:>7.2f} "
+                  f"{latencies[int(len(latencies) * 0.95) - 1]:>7.2f}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    )
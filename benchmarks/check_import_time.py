@@ -0,0 +1,107 @@
+"""
+Import-Time Budget Check
+Imports each top-level module in a fresh interpreter under
+`python -X importtime` and fails when one takes longer than its budget or
+drags in a heavy dependency that should only load when a code path needs it
+(the OpenAI client, RetrievalQA, ChromaDB, pandas, langsmith)
+
+Usage:
+    python benchmarks/check_import_time.py [scale]
+
+scale multiplies every budget (e.g. 2 on a slow CI machine). Exits with
+status 1 on any violation. tests/test_import_time.py runs the same check
+under pytest.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time allowed per module, in milliseconds. Roughly twice
+# what a warm import takes on a laptop; langchain_core itself is ~100 ms
+# and numpy ~75 ms of that.
+BUDGETS_MS = {
+    'config': 50,
+    'utils.text': 50,
+    'utils.voter_table': 50,
+    'utils.statistics': 50,
+    'utils.data_loader': 100,
+    'utils.snapshot': 100,
+    'search.aggregates': 50,
+    'search.name_index': 50,
+    'search.phonetic': 50,
+    'search.metadata_index': 50,
+    'search.bm25': 200,
+    'embeddings.backends': 250,
+    'embeddings.query_cache': 250,
+    'embeddings.vector_store': 450,
+    'rag.router': 50,
+    'rag.answer_cache': 500,
+    'rag.chain': 500,
+    'rag.sessions': 500,
+}
+
+# Imported only when a code path needs them, never by the modules above
+FORBIDDEN = (
+    'langchain_openai',     # create_embeddings() / create_llm() with OpenAI
+    'openai',
+    'langchain_classic',    # VoterRAGChain.qa_chain
+    'langchain_core.retrievers',  # VoterVectorStore.get_retriever(); pulls in langsmith
+    'langsmith',
+    'langchain_core.embeddings',  # the embedding cache wrapper and fake embeddings
+    'chromadb',             # ChromaBackend.open()
+    'pandas',               # VoterTable.to_dataframe()
+)
+
+RUNS = 3
+
+
+def measure(module: str) -> tuple:
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        (cumulative import time in ms, forbidden modules that got imported)
+    """
+    code = (
+        f"import sys; import {module}; "
+        f"print(' '.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, check=True, capture_output=True, text=True
+    )
+    cumulative = 0
+    for line in out.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative = int(fields[1])
+    return cumulative / 1000, out.stdout.split()
+
+
+def main(scale: float = 1.0) -> int:
+    failures = 0
+    print(f"{'module':<26} {'ms':>7} {'budget':>7}  status")
+    for module, budget in BUDGETS_MS.items():
+        # Best of a few runs, so a cold disk cache does not count against it
+        runs = [measure(module) for _ in range(RUNS)]
+        elapsed = min(ms for ms, _ in runs)
+        leaked = sorted(set().union(*(set(found) for _, found in runs)))
+        limit = budget * scale
+
+        problems = []
+        if elapsed > limit:
+            problems.append("over budget")
+        if leaked:
+            problems.append("imports " + ", ".join(leaked))
+        failures += bool(problems)
+        print(f"{module:<26} {elapsed:>7.1f} {limit:>7.0f}  {'; '.join(problems) or 'ok'}")
+
+    print(f"\n{failures} module(s) failed" if failures else "\nAll modules within budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0))
@@ -0,0 +1,108 @@
+"""
+Async Load Test
+Fires concurrent questions at VoterRAGChain.aanswer in one process and
+reports throughput and latency per concurrency level, next to the
+synchronous answer() loop
+
+Runs offline with FakeEmbeddings and FakeChatModel; the fake LLM sleeps
+for the given latency on every call, like a remote API would.
+
+Usage:
+    python benchmarks/load_test_async.py [questions] [llm_latency_seconds] [rows]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("EMBEDDING_PROVIDER", "fake")
+os.environ.setdefault("LLM_PROVIDER", "fake")
+if len(sys.argv) > 2:
+    os.environ["FAKE_LLM_LATENCY"] = sys.argv[2]
+else:
+    os.environ.setdefault("FAKE_LLM_LATENCY", "2.0")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import embeddings.vector_store as vector_store_module
+from benchmarks.synthetic import write_synthetic_dump
+from embeddings.query_cache import QueryCache
+from embeddings.vector_store import VoterVectorStore
+from rag.chain import VoterRAGChain
+from rag.router import ROUTE_RAG
+from utils.data_loader import load_voters_from_sql
+
+
+def percentile(values, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def run_level(chain: VoterRAGChain, questions, concurrency: int):
+    """Answer every question with at most `concurrency` in flight; (seconds, latencies)."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def ask(question):
+        async with semaphore:
+            start = time.perf_counter()
+            await chain.aanswer(question, route=ROUTE_RAG)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(ask(question) for question in questions))
+    return time.perf_counter() - start, latencies
+
+
+def main(count: int = 200, rows: int = 3000):
+    # Keep the load test from touching the real embedding cache
+    vector_store_module.EMBEDDING_CACHE_PATH = None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows)
+        voters, documents = load_voters_from_sql(path)
+
+        store = VoterVectorStore()
+        store.persist_directory = os.path.join(tmp, "store")
+        # Time every search in full rather than the in-memory query cache
+        store.query_cache = QueryCache(max_results=0, max_embeddings=0)
+        store.create_from_documents(documents)
+        chain = VoterRAGChain(store, voters)
+        # Every level asks the same questions; measure the LLM, not the answer cache
+        chain.answer_cache = None
+
+        questions = [
+            f"{voters[i % len(voters)]['name']} এর পিতা কী করেন?" for i in range(0, count * 7, 7)
+        ]
+        latency = float(os.environ["FAKE_LLM_LATENCY"])
+        print(f"\n{count} questions, fake LLM latency {latency:.1f}s, {rows} voters")
+        print(f"{'mode':<10} {'in flight':>9} {'seconds':>8} {'q/sec':>7} {'p50 s':>6} {'p95 s':>6}")
+
+        # The blocking path, on a slice so it finishes in reasonable time
+        sample = questions[:5]
+        start = time.perf_counter()
+        sync_latencies = []
+        for question in sample:
+            began = time.perf_counter()
+            chain.answer(question, route=ROUTE_RAG)
+            sync_latencies.append(time.perf_counter() - began)
+        elapsed = time.perf_counter() - start
+        print(f"{'sync':<10} {1:>9} {elapsed:>8.2f} {len(sample) / elapsed:>7.2f} "
+              f"{percentile(sync_latencies, 0.5):>6.2f} {percentile(sync_latencies, 0.95):>6.2f}")
+
+        for concurrency in (1, 10, 50, 200):
+            if concurrency > count:
+                break
+            batch = questions if concurrency > 1 else sample
+            elapsed, latencies = asyncio.run(run_level(chain, batch, concurrency))
+            print(f"{'async':<10} {concurrency:>9} {elapsed:>8.2f} {len(batch) / elapsed:>7.2f} "
+                  f"{percentile(latencies, 0.5):>6.2f} {percentile(latencies, 0.95):>6.2f}")
+
+        store.delete_collection()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 3000
+    )
@@ -0,0 +1,164 @@
+"""
+HTTP Service Load Test
+Starts server.py on a synthetic dump with the fake embedding and chat
+models, fires a mix of /query, /search, /filter and /stats requests at it
+over keep-alive connections, and reports throughput and latency per
+concurrency level
+
+Every level sends different questions, so the answer cache only helps
+within a level, the way it would with real traffic.
+
+Usage:
+    python benchmarks/load_test_server.py [requests] [workers] [llm_latency_seconds] [rows]
+"""
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import quote
+
+import aiohttp
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_dump
+from utils.data_loader import load_voters_from_sql
+
+SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server.py")
+LEVELS = (1, 10, 50, 200)
+
+
+def percentile(values, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def build_requests(voters, count: int, offset: int) -> list:
+    """
+    (method, path, json body) for a realistic mix: 40% RAG questions, 20%
+    counts, 20% name searches, 15% ward pages, 5% stats.
+    """
+    requests = []
+    for i in range(offset, offset + count):
+        voter = voters[(i * 7) % len(voters)]
+        kind = i % 20
+        if kind < 8:
+            # The serial keeps questions distinct: synthetic names repeat
+            question = f"{voter['name']} (serial {voter['serial']}) এর পিতা কী করেন?"
+            requests.append(("POST", "/query", {'question': question}))
+        elif kind < 12:
+            requests.append(("POST", "/query", {'question': f"How many voters are in ward {voter['ward']}?"}))
+        elif kind < 16:
+            name = voter['phonetic_name'] or voter['name']
+            requests.append(("GET", f"/search/name?q={quote(name)}&k=5", None))
+        elif kind < 19:
+            requests.append(("GET", f"/filter/ward/{quote(voter['ward'] or '1')}?limit=20", None))
+        else:
+            requests.append(("GET", "/stats", None))
+    return requests
+
+
+async def wait_ready(base_url: str, process: subprocess.Popen, timeout: float = 300.0):
+    """Poll /health until the server answers."""
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited with status {process.returncode}")
+            try:
+                async with session.get(base_url + "/health") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError("server did not start in time")
+
+
+async def run_level(base_url: str, requests: list, concurrency: int):
+    """Send every request with at most `concurrency` in flight; (seconds, latencies, errors)."""
+    latencies, errors = [], 0
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=120)
+    async with aiohttp.ClientSession(base_url, connector=connector, timeout=timeout) as session:
+        queue = list(reversed(requests))
+
+        async def client():
+            nonlocal errors
+            while queue:
+                method, path, body = queue.pop()
+                start = time.perf_counter()
+                try:
+                    async with session.request(method, path, json=body) as response:
+                        await response.read()
+                        errors += response.status != 200
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return time.perf_counter() - start, latencies, errors
+
+
+def main(count: int = 500, workers: int = 2, latency: float = 0.5, rows: int = 3000):
+    with tempfile.TemporaryDirectory() as tmp:
+        # server.py runs in tmp, so the dump, snapshot, index and caches all land there
+        path = write_synthetic_dump(os.path.join(tmp, "voters.sql"), rows)
+        voters, _ = load_voters_from_sql(path)
+
+        env = dict(os.environ)
+        env.update({
+            'EMBEDDING_PROVIDER': "fake",
+            'LLM_PROVIDER': "fake",
+            'FAKE_LLM_LATENCY': str(latency),
+            'OPENAI_API_KEY': env.get('OPENAI_API_KEY') or "unused",
+        })
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        with open(os.path.join(tmp, "server.log"), "w") as log:
+            process = subprocess.Popen(
+                [sys.executable, SERVER, str(workers), str(port)],
+                cwd=tmp, env=env, stdout=log, stderr=subprocess.STDOUT
+            )
+            try:
+                start = time.perf_counter()
+                asyncio.run(wait_ready(base_url, process))
+                # /health answers once the first worker is up; give the others a moment
+                time.sleep(2.0 if workers > 1 else 0.0)
+                print(f"\n{count} requests per level, {workers} worker(s), fake LLM latency "
+                      f"{latency:.1f}s, {rows} voters (server up in {time.perf_counter() - start:.1f}s)")
+                print(f"{'in flight':>9} {'seconds':>8} {'req/sec':>8} {'p50 ms':>7} {'p95 ms':>7} "
+                      f"{'p99 ms':>7} {'errors':>6}")
+
+                for level, concurrency in enumerate(LEVELS):
+                    requests = build_requests(voters, count, offset=level * count)
+                    elapsed, latencies, errors = asyncio.run(run_level(base_url, requests, concurrency))
+                    print(f"{concurrency:>9} {elapsed:>8.2f} {len(requests) / elapsed:>8.1f} "
+                          f"{percentile(latencies, 0.5) * 1000:>7.0f} {percentile(latencies, 0.95) * 1000:>7.0f} "
+                          f"{percentile(latencies, 0.99) * 1000:>7.0f} {errors:>6}")
+            finally:
+                process.send_signal(signal.SIGTERM)
+                try:
+                    process.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 0.5,
+        int(sys.argv[4]) if len(sys.argv) > 4 else 3000
+    )
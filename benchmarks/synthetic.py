@@ -0,0 +1,100 @@
+"""
+Synthetic Voter Dump Module
+Generates fake voters.sql dumps for benchmarks
+"""
+import random
+from typing import Iterator, List, Optional
+
+
+FIRST_NAMES = [
+    ("মোঃ সাইফুল", "saiful"), ("মোছাঃ রহিমা", "rahima"), ("আব্দুল করিম", "abdul karim"),
+    ("মোঃ সিরাজুল", "sirajul"), ("ফাতেমা", "fatema"), ("নাসরিন", "nasrin"),
+    ("মোঃ রফিকুল", "rafiqul"), ("শাহানা", "shahana"), ("মোঃ জাহিদুল", "jahidul"),
+    ("আয়েশা", "ayesha"), ("মোঃ হাবিবুর", "habibur"), ("রাশিদা", "rashida"),
+]
+LAST_NAMES = [
+    ("ইসলাম", "islam"), ("মোল্যা", "molla"), ("শেখ", "sheikh"), ("খাতুন", "khatun"),
+    ("বেগম", "begum"), ("রহমান", "rahman"), ("হোসেন", "hossain"), ("বিশ্বাস", "biswas"),
+]
+OCCUPATIONS = ["কৃষক", "গৃহিণী", "ব্যবসা", "ছাত্র/ছাত্রী", "চাকুরী", "শ্রমিক", "বেকার"]
+VILLAGES = ["বাবরা", "হাচলা", "পুরুলিয়া", "চাঁচুড়ী", "বাঐসোনা"]
+BN_DIGITS = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+
+
+def _quote(value: Optional[str]) -> str:
+    """Render a value as an SQL literal."""
+    if value is None:
+        return "NULL"
+    return "'" + value.replace("'", "''") + "'"
+
+
+def synthetic_rows(count: int, seed: int = 0) -> Iterator[List[Optional[str]]]:
+    """
+    Yield synthetic voter rows in voters table column order.
+
+    Args:
+        count: Number of rows to generate
+        seed: Random seed, so every run produces the same dump
+
+    Yields:
+        Lists of 23 column values (strings or None)
+    """
+    rng = random.Random(seed)
+    for i in range(1, count + 1):
+        first, first_ph = rng.choice(FIRST_NAMES)
+        last, last_ph = rng.choice(LAST_NAMES)
+        father, father_ph = rng.choice(FIRST_NAMES)
+        father_last, father_last_ph = rng.choice(LAST_NAMES)
+        mother, _ = rng.choice(FIRST_NAMES)
+        ward = str(rng.randint(1, 9))
+        serial = str(i)
+        voter_id = str(rng.randint(10 ** 9, 10 ** 10 - 1)) if rng.random() > 0.1 else None
+        name = f"{first} {last}"
+        father_name = f"{father} {father_last}"
+        dob = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1940, 2005)}"
+        gender = "মহিলা" if first.startswith(("মোছাঃ", "ফাতেমা", "নাসরিন", "শাহানা", "আয়েশা", "রাশিদা")) else "পুরুষ"
+        # Sprinkle in quotes so the escape handling gets exercised
+        address = f"গ্রাম: {rng.choice(VILLAGES)}, ডাকঘর: বাবরা{'' if rng.random() > 0.02 else chr(39) + 'এ'}"
+        yield [
+            str(i), serial.translate(BN_DIGITS), serial, name, name.replace("মোঃ ", "").replace("মোছাঃ ", ""),
+            voter_id.translate(BN_DIGITS) if voter_id else None, voter_id,
+            father_name, father_name.replace("মোঃ ", "").replace("মোছাঃ ", ""),
+            f"{mother} বেগম", rng.choice(OCCUPATIONS) if rng.random() > 0.05 else None, dob, address,
+            "০০১", "001", "বাবরা", ward.translate(BN_DIGITS), ward, gender,
+            "2024-01-01 00:00:00", "2024-01-01 00:00:00",
+            f"{first_ph} {last_ph}", f"{father_ph} {father_last_ph}",
+        ]
+
+
+def write_synthetic_dump(
+    file_path: str,
+    count: int,
+    rows_per_insert: int = 500,
+    seed: int = 0
+) -> str:
+    """
+    Write a synthetic voters.sql dump with multi-row INSERT statements.
+
+    Args:
+        file_path: Where to write the dump
+        count: Number of voter rows
+        rows_per_insert: Rows per INSERT statement
+        seed: Random seed
+
+    Returns:
+        The file path
+    """
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write("-- Synthetic voters dump\n")
+        f.write("CREATE TABLE public.voters (id integer NOT NULL, serial_bn text, name text);\n\n")
+        batch = []
+        for row in synthetic_rows(count, seed=seed):
+            batch.append("(" + ", ".join(
+                v if i == 0 else _quote(v) for i, v in enumerate(row)
+            ) + ")")
+            if len(batch) == rows_per_insert:
+                f.write("INSERT INTO public.voters VALUES " + ",\n".join(batch) + ";\n")
+                batch = []
+        if batch:
+            f.write("INSERT INTO public.voters VALUES " + ",\n".join(batch) + ";\n")
+    return file_path
@@ -11,20 +11,79 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 EMBEDDING_MODEL = "text-embedding-3-small"
 LLM_MODEL = "gpt-4o-mini"  # Cost-effective and fast
+EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "openai")  # "openai" or "fake" (offline)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")  # "openai" or "fake" (offline)
+FAKE_LLM_LATENCY = float(os.getenv("FAKE_LLM_LATENCY", "0"))  # Seconds per fake LLM call
+
+# Embedding Pipeline Configuration
+EMBEDDING_BATCH_TOKENS = 20000  # Estimated token budget per embedding request
+EMBEDDING_BATCH_SIZE = 256  # Maximum documents per embedding request
+EMBEDDING_MAX_CONCURRENCY = 4  # Embedding requests in flight at once
+EMBEDDING_MAX_RETRIES = 5  # Retries per batch (rate limits, timeouts)
+
+# Embedding Cache Configuration (kept outside CHROMA_DB_PATH so rebuilds reuse it)
+EMBEDDING_CACHE_PATH = "./embedding_cache.sqlite"  # None disables the cache
+EMBEDDING_CACHE_MAX_ENTRIES = 2_000_000  # Least recently used vectors are evicted past this
+QUERY_CACHE_MAX_RESULTS = 1024  # Search results kept in memory, LRU (0 disables)
+QUERY_CACHE_MAX_EMBEDDINGS = 4096  # Query embeddings kept in memory, LRU (0 disables)
 
 # ChromaDB Configuration
 CHROMA_DB_PATH = "./chroma_db"
 COLLECTION_NAME = "voters"
+VECTOR_STORE_SYNC = True  # Upsert/delete only changed voters when the store already exists
+RETRIEVAL_MODE = "hybrid"  # "dense" or "hybrid" (BM25 + dense, reciprocal-rank fusion)
+HYBRID_CANDIDATES = 20  # BM25 results fused with the dense top-k
+RRF_K = 60  # Reciprocal-rank fusion damping constant
+
+# Vector Backend Configuration
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "chroma")  # "chroma" or "numpy" (memory-mapped matrix)
+NUMPY_INDEX_PATH = "./numpy_index"
+NUMPY_INDEX_MODE = "exact"  # "exact" (full scan) or "ivf" (clustered, for large districts)
+IVF_NLIST = None  # IVF clusters (None = ~sqrt(number of voters))
+IVF_NPROBE = 8  # IVF clusters scanned per query
+NUMPY_QUANTIZATION = None  # None, "int8" or "float16": compact in-RAM copy scanned per query
+                           # (float16 halves memory but NumPy scans it ~10x slower than int8)
+NUMPY_DIMENSIONS = None  # Leading dimensions kept in that copy (None = all)
+NUMPY_RERANK = 4  # Shortlist re-scored in full precision, as a multiple of k
 
 # Data Source
 SQL_DUMP_PATH = "./voters.sql"
+SQL_ROW_LIMIT = None  # Cap on voters loaded from the dump (None = all)
+INGEST_WORKERS = 1  # Processes used to parse the dump (1 = serial)
+SNAPSHOT_PATH = "./voters.snapshot"  # Parsed voters, documents and stats for fast restarts (None = off)
 
 # RAG Configuration
 TOP_K_RESULTS = 5  # Number of similar documents to retrieve
 CHUNK_SIZE = 1000
 CHUNK_OVERLAP = 200
+QUERY_ROUTING = True  # Send lookups, filters and counts past the LLM when possible
+LIST_RESULT_LIMIT = 20  # Voters shown for lookup and "list all" answers
+LLM_MAX_CONCURRENCY = 8  # LLM calls in flight at once in query_batch
+
+# Chat Session Configuration
+SESSION_MAX_TURNS = 20  # Exchanges remembered per browser session
+SESSION_IDLE_TTL = 2 * 3600  # Seconds of inactivity before a session is forgotten
+SESSION_MAX_SESSIONS = 500  # Sessions kept at once; least recently used go first
+SESSION_MEMORY_BUDGET = 32 * 1024 * 1024  # Bytes of chat history across all sessions
+
+# Answer Cache Configuration
+ANSWER_CACHE = True  # Reuse LLM answers for repeated and near-duplicate questions
+ANSWER_CACHE_PATH = "./answer_cache.sqlite"  # None keeps the cache in memory only
+ANSWER_CACHE_MAX_ENTRIES = 1000  # Least recently used answers are evicted past this
+ANSWER_CACHE_TTL = 24 * 3600  # Seconds an answer stays valid (None = until re-index)
+ANSWER_CACHE_SIMILARITY = 0.95  # Cosine similarity for a near-duplicate hit (None = exact only)
+
+# HTTP Service Configuration (server.py)
+SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8080"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))  # Processes sharing the port (SO_REUSEPORT)
+SERVER_REQUEST_TIMEOUT = 60.0  # Seconds before a request is answered with 504
+SERVER_THREADS = 16  # Threads per worker for blocking work (index lookups, SQLite, batches)
+SERVER_KEEPALIVE_TIMEOUT = 75.0  # Seconds an idle keep-alive connection stays open
+SERVER_MAX_RESULTS = 500  # Cap on k / limit accepted by the search and filter endpoints
+SERVER_MAX_BATCH = 100  # Questions accepted by one /query/batch request
+
 
-# System Prompt for bilingual responses
 SYSTEM_PROMPT = """You are a helpful assistant that answers questions about voter information from a Bangladesh voter database.
 
 IMPORTANT RULES:
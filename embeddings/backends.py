@@ -0,0 +1,638 @@
+"""
+Vector Backends Module
+Storage and nearest-neighbour search behind VoterVectorStore
+"""
+import json
+import os
+import sqlite3
+import threading
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
+
+
+# A stored record as returned by query() and get():
+# {'id', 'content', 'metadata'} plus 'distance' (lower is closer) for query()
+Record = Dict[str, Any]
+
+
+class VectorBackend:
+    """
+    Interface every vector backend implements.
+
+    VoterVectorStore embeds texts itself and hands the backend plain
+    vectors, so a backend only has to store, delete, fetch and rank.
+    Filters use Chroma's syntax: {"field": value} or
+    {"$and": [{"field": value}, ...]}.
+    """
+
+    name = "base"
+
+    def __init__(self, persist_directory: str, collection_name: str):
+        self.persist_directory = persist_directory
+        self.collection_name = collection_name
+
+    def exists(self) -> bool:
+        """Whether a persisted index is present on disk."""
+        raise NotImplementedError
+
+    def open(self):
+        """Open (or create) the persisted index."""
+        raise NotImplementedError
+
+    def upsert(
+        self,
+        ids: List[str],
+        vectors: List[List[float]],
+        contents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ):
+        """Insert or replace records by id."""
+        raise NotImplementedError
+
+    def delete(self, ids: List[str]):
+        """Remove records by id; unknown ids are ignored."""
+        raise NotImplementedError
+
+    def flush(self):
+        """Make pending writes durable and visible to queries."""
+
+    def count(self) -> int:
+        """Number of stored records."""
+        raise NotImplementedError
+
+    def ids(self) -> List[str]:
+        """Every stored id."""
+        raise NotImplementedError
+
+    def query(
+        self,
+        vector: Sequence[float],
+        k: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[Record]:
+        """The k records closest to a query vector, closest first."""
+        raise NotImplementedError
+
+    def query_batch(
+        self,
+        vectors: Sequence[Sequence[float]],
+        k: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[List[Record]]:
+        """query() for several vectors; one result list per vector, in order."""
+        return [self.query(vector, k, where) for vector in vectors]
+
+    def get(self, ids: List[str], where: Optional[Dict[str, Any]] = None) -> List[Record]:
+        """Records by id (those passing the filter, if given)."""
+        raise NotImplementedError
+
+    def destroy(self):
+        """Delete the index and its files."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release open handles and loaded data; the files stay on disk."""
+
+
+class ChromaBackend(VectorBackend):
+    """Persistent ChromaDB collection (HNSW index in SQLite + binary segments)."""
+
+    name = "chroma"
+
+    def __init__(self, persist_directory: str, collection_name: str):
+        super().__init__(persist_directory, collection_name)
+        self.client = None
+        self.collection = None
+
+    def exists(self) -> bool:
+        return os.path.exists(os.path.join(self.persist_directory, "chroma.sqlite3"))
+
+    def open(self):
+        import chromadb
+
+        self.client = chromadb.PersistentClient(path=self.persist_directory)
+        self.collection = self.client.get_or_create_collection(self.collection_name)
+
+    def upsert(self, ids, vectors, contents, metadatas):
+        self.collection.upsert(ids=ids, embeddings=vectors, documents=contents, metadatas=metadatas)
+
+    def delete(self, ids):
+        if ids:
+            self.collection.delete(ids=ids)
+
+    def count(self) -> int:
+        return self.collection.count()
+
+    def ids(self) -> List[str]:
+        return self.collection.get(include=[])['ids']
+
+    def query(self, vector, k, where=None) -> List[Record]:
+        return self.query_batch([vector], k, where)[0]
+
+    def query_batch(self, vectors, k, where=None) -> List[List[Record]]:
+        if not len(vectors):
+            return []
+        result = self.collection.query(
+            query_embeddings=[list(vector) for vector in vectors],
+            n_results=k,
+            where=where or None,
+            include=["documents", "metadatas", "distances"]
+        )
+        return [
+            [
+                {'id': doc_id, 'content': content, 'metadata': metadata or {}, 'distance': distance}
+                for doc_id, content, metadata, distance in zip(ids, contents, metadatas, distances)
+            ]
+            for ids, contents, metadatas, distances in zip(
+                result['ids'], result['documents'], result['metadatas'], result['distances']
+            )
+        ]
+
+    def get(self, ids, where=None) -> List[Record]:
+        if not ids:
+            return []
+        result = self.collection.get(ids=ids, where=where or None, include=["documents", "metadatas"])
+        return [
+            {'id': doc_id, 'content': content, 'metadata': metadata or {}}
+            for doc_id, content, metadata in zip(result['ids'], result['documents'], result['metadatas'])
+        ]
+
+    def destroy(self):
+        if self.client is not None:
+            try:
+                self.client.delete_collection(self.collection_name)
+            except Exception:
+                pass
+        self.client = self.collection = None
+        # Drop Chroma's cached client so a rebuild in this process gets a fresh database
+        from chromadb.api.client import SharedSystemClient
+        SharedSystemClient.clear_system_cache()
+
+    def close(self):
+        self.client = self.collection = None
+        # Chroma caches the client (and its loaded segments) per path
+        from chromadb.api.client import SharedSystemClient
+        SharedSystemClient.clear_system_cache()
+
+
+def _where_pairs(where: Optional[Dict[str, Any]]) -> List[tuple]:
+    """Flatten a Chroma-style equality filter into (field, value) pairs."""
+    if not where:
+        return []
+    if set(where) == {"$and"}:
+        pairs = []
+        for clause in where["$and"]:
+            pairs.extend(_where_pairs(clause))
+        return pairs
+    pairs = []
+    for field, value in where.items():
+        if field.startswith("$"):
+            raise ValueError(f"Unsupported filter operator: {field}")
+        if isinstance(value, dict):
+            if set(value) != {"$eq"}:
+                raise ValueError(f"Unsupported filter on {field}: {value}")
+            value = value["$eq"]
+        pairs.append((field, value))
+    return pairs
+
+
+class NumpyBackend(VectorBackend):
+    """
+    Brute-force (or IVF) search over an L2-normalized float32 matrix.
+
+    Vectors live in a memory-mapped vectors.npy, one row per record; ids
+    in ids.json give the row order. Contents and metadata sit in a small
+    SQLite table, read only for the records a query returns or for
+    filters. Writes are buffered and applied by flush(), which rewrites
+    the matrix and, in IVF mode, re-clusters it.
+
+    Exact mode scores every row with one matrix-vector product and picks
+    the top k with argpartition. IVF mode clusters rows around
+    ~sqrt(n) k-means centroids and scores only the nprobe closest lists,
+    for district-sized indexes where a full scan gets slow.
+
+    With quantization ("int8": per-vector scaled codes, "float16") and/or
+    truncated dimensions, a compact copy of the matrix is held in RAM and
+    scanned instead; the best k * rerank rows are then re-scored against
+    the full-precision memory-mapped vectors, so only those rows of
+    vectors.npy are ever paged in.
+    """
+
+    name = "numpy"
+
+    def __init__(
+        self,
+        persist_directory: str,
+        collection_name: str,
+        mode: str = "exact",
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        quantization: Optional[str] = None,
+        dimensions: Optional[int] = None,
+        rerank: int = 4
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            persist_directory: Directory holding the index files
+            collection_name: Name recorded with the index
+            mode: "exact" or "ivf"
+            nlist: IVF lists (None picks ~sqrt(n))
+            nprobe: IVF lists scanned per query
+            quantization: None, "int8" or "float16" for the in-memory scan copy
+            dimensions: Leading dimensions kept in the scan copy (None = all);
+                meant for Matryoshka-trained models like text-embedding-3
+            rerank: Candidates re-scored in full precision, as a multiple of k
+        """
+        super().__init__(persist_directory, collection_name)
+        if mode not in ("exact", "ivf"):
+            raise ValueError(f"Unknown numpy index mode: {mode}")
+        if quantization not in (None, "int8", "float16"):
+            raise ValueError(f"Unknown quantization: {quantization}")
+        self.mode = mode
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.quantization = quantization
+        self.dimensions = dimensions
+        self.rerank = max(1, rerank)
+        self.vectors: Optional[np.ndarray] = None
+        # Compact scan copy (and per-row int8 scales) when quantizing or truncating
+        self._codes: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._pending: Dict[str, Optional[np.ndarray]] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        # One SQLite connection shared by every thread serving queries
+        self._db_lock = threading.Lock()
+        self._centroids: Optional[np.ndarray] = None
+        self._list_rows: Optional[np.ndarray] = None
+        self._list_offsets: Optional[np.ndarray] = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.persist_directory, name)
+
+    @property
+    def _codes_name(self) -> Optional[str]:
+        """File of the scan copy; named by its settings so a config change rebuilds it."""
+        if self.quantization is None and self.dimensions is None:
+            return None
+        return f"codes-{self.quantization or 'float32'}-{self.dimensions or 'full'}.npz"
+
+    def exists(self) -> bool:
+        return os.path.exists(self._path("vectors.npy"))
+
+    def open(self):
+        os.makedirs(self.persist_directory, exist_ok=True)
+        self._db = sqlite3.connect(self._path("records.sqlite"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            " id TEXT PRIMARY KEY, content TEXT NOT NULL, metadata TEXT NOT NULL)"
+        )
+        self._db.commit()
+        self._load_arrays()
+
+    def _load_arrays(self):
+        """Map the persisted matrix and IVF lists."""
+        if not self.exists():
+            self.vectors, self._ids, self._rows = None, [], {}
+            return
+        self.vectors = np.load(self._path("vectors.npy"), mmap_mode="r")
+        with open(self._path("ids.json"), "r", encoding="utf-8") as f:
+            self._ids = json.load(f)
+        self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}
+
+        self._centroids = self._list_rows = self._list_offsets = None
+        if self.mode == "ivf" and os.path.exists(self._path("ivf.npz")):
+            with np.load(self._path("ivf.npz")) as ivf:
+                self._centroids = ivf["centroids"]
+                self._list_rows = ivf["rows"]
+                self._list_offsets = ivf["offsets"]
+
+        self._codes = self._scales = None
+        if self._codes_name is not None:
+            if not os.path.exists(self._path(self._codes_name)):
+                self._build_codes(self.vectors)
+            # Loaded fully: the scan copy is what is meant to stay in RAM
+            with np.load(self._path(self._codes_name)) as codes:
+                self._codes = codes["codes"]
+                self._scales = codes["scales"] if "scales" in codes else None
+
+    # ------------------------------------------------------------------
+    # Writes
+
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def upsert(self, ids, vectors, contents, metadatas):
+        matrix = self._normalize(vectors)
+        for doc_id, vector in zip(ids, matrix):
+            self._pending[doc_id] = vector
+        rows = [
+            (doc_id, content, json.dumps(metadata, ensure_ascii=False))
+            for doc_id, content, metadata in zip(ids, contents, metadatas)
+        ]
+        with self._db_lock:
+            self._db.executemany("INSERT OR REPLACE INTO records (id, content, metadata) VALUES (?, ?, ?)", rows)
+            self._db.commit()
+
+    def delete(self, ids):
+        for doc_id in ids:
+            self._pending[doc_id] = None
+        with self._db_lock:
+            self._db.executemany("DELETE FROM records WHERE id = ?", [(doc_id,) for doc_id in ids])
+            self._db.commit()
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        if self.vectors is None and all(vector is None for vector in self._pending.values()):
+            self._pending.clear()
+            return
+
+        kept = [doc_id for doc_id in self._ids if self._pending.get(doc_id, True) is not None]
+        added = [doc_id for doc_id, vector in self._pending.items()
+                 if vector is not None and doc_id not in self._rows]
+        new_ids = kept + added
+
+        if self.vectors is not None:
+            dimension = self.vectors.shape[1]
+        else:
+            dimension = next(len(v) for v in self._pending.values() if v is not None)
+        tmp_path = self._path("vectors.npy.tmp")
+        matrix = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=np.float32, shape=(len(new_ids), dimension)
+        )
+        for row, doc_id in enumerate(new_ids):
+            vector = self._pending.get(doc_id)
+            matrix[row] = vector if vector is not None else self.vectors[self._rows[doc_id]]
+        matrix.flush()
+        del matrix
+
+        if self.mode == "ivf":
+            self._build_ivf(np.load(tmp_path, mmap_mode="r"))
+        if self._codes_name is not None:
+            self._build_codes(np.load(tmp_path, mmap_mode="r"))
+        ids_tmp = self._path("ids.json.tmp")
+        with open(ids_tmp, "w", encoding="utf-8") as f:
+            json.dump(new_ids, f)
+
+        self.vectors = None
+        os.replace(tmp_path, self._path("vectors.npy"))
+        os.replace(ids_tmp, self._path("ids.json"))
+        self._pending.clear()
+        self._load_arrays()
+
+    def _build_ivf(self, vectors: np.ndarray, iterations: int = 10, seed: int = 0):
+        """Spherical k-means over the rows, saved as centroids plus inverted lists."""
+        count = len(vectors)
+        nlist = max(1, min(self.nlist or int(np.sqrt(count)), count))
+        rng = np.random.default_rng(seed)
+
+        # Train on a sample; assign everything afterwards
+        sample = vectors[np.sort(rng.choice(count, size=min(count, nlist * 64), replace=False))]
+        if len(sample):
+            centroids = np.array(sample[rng.choice(len(sample), size=nlist, replace=False)])
+        else:
+            centroids = np.zeros((1, vectors.shape[1]), dtype=np.float32)
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(len(centroids)):
+                members = sample[assignment == cluster]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    centroids[cluster] = centroid / (np.linalg.norm(centroid) or 1.0)
+
+        assignment = np.empty(count, dtype=np.int32)
+        for start in range(0, count, 65536):
+            chunk = vectors[start:start + 65536]
+            assignment[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+        rows = np.argsort(assignment, kind="stable").astype(np.int32)
+        offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=len(centroids)), out=offsets[1:])
+
+        tmp_path = self._path("ivf.tmp.npz")
+        np.savez(tmp_path, centroids=centroids.astype(np.float32), rows=rows, offsets=offsets)
+        os.replace(tmp_path, self._path("ivf.npz"))
+
+    def _build_codes(self, vectors: np.ndarray, chunk: int = 65536):
+        """Write the truncated and/or quantized scan copy of the matrix."""
+        dimensions = min(self.dimensions or vectors.shape[1], vectors.shape[1])
+        dtype = {"int8": np.int8, "float16": np.float16}.get(self.quantization, np.float32)
+        codes = np.empty((len(vectors), dimensions), dtype=dtype)
+        scales = np.empty(len(vectors), dtype=np.float32) if self.quantization == "int8" else None
+        for start in range(0, len(vectors), chunk):
+            # Truncated vectors are re-normalized so cosine ranking still holds
+            block = self._normalize(vectors[start:start + chunk, :dimensions])
+            if scales is None:
+                codes[start:start + len(block)] = block
+                continue
+            peaks = np.abs(block).max(axis=1)
+            peaks[peaks == 0] = 1.0
+            codes[start:start + len(block)] = np.rint(block * (127.0 / peaks[:, None]))
+            scales[start:start + len(block)] = peaks / 127.0
+
+        tmp_path = self._path("codes.tmp.npz")
+        arrays = {'codes': codes} if scales is None else {'codes': codes, 'scales': scales}
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, self._path(self._codes_name))
+
+    # ------------------------------------------------------------------
+    # Reads
+
+    def count(self) -> int:
+        return len(self._ids)
+
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    def nbytes(self) -> int:
+        """Size of the matrix a query scans: the scan copy if there is one, else the vectors."""
+        if self._codes is not None:
+            return self._codes.nbytes + (self._scales.nbytes if self._scales is not None else 0)
+        return self.vectors.nbytes if self.vectors is not None else 0
+
+    def _filter_rows(self, where: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Rows passing a filter, or None when there is no filter."""
+        pairs = _where_pairs(where)
+        if not pairs:
+            return None
+        clauses = " AND ".join("json_extract(metadata, ?) = ?" for _ in pairs)
+        params = []
+        for field, value in pairs:
+            params.extend([f'$."{field}"', value])
+        with self._db_lock:
+            matched = self._db.execute(f"SELECT id FROM records WHERE {clauses}", params).fetchall()
+        rows = [self._rows[doc_id] for (doc_id,) in matched if doc_id in self._rows]
+        return np.array(sorted(rows), dtype=np.int64)
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows in the IVF lists nearest the query (None in exact mode)."""
+        if self.mode != "ivf" or self._centroids is None:
+            return None
+        nprobe = min(self.nprobe, len(self._centroids))
+        lists = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        return np.concatenate([
+            self._list_rows[self._list_offsets[i]:self._list_offsets[i + 1]] for i in lists
+        ])
+
+    def _approximate_scores(self, queries: np.ndarray, rows: Optional[np.ndarray], chunk: int = 128) -> np.ndarray:
+        """
+        Scores of queries (one per row of `queries`) against the scan copy.
+
+        Codes are decoded a cache-sized block at a time and each decoded
+        block is scored against every query at once.
+
+        Returns:
+            Matrix of shape (rows scanned, queries)
+        """
+        codes = self._codes if rows is None else self._codes[rows]
+        scales = None if self._scales is None else (self._scales if rows is None else self._scales[rows])
+        queries = self._normalize(queries[:, :codes.shape[1]]).T
+
+        if codes.dtype == np.float32:
+            scores = codes @ queries
+        else:
+            scores = np.empty((len(codes), queries.shape[1]), dtype=np.float32)
+            block = np.empty((chunk, codes.shape[1]), dtype=np.float32)
+            for start in range(0, len(codes), chunk):
+                count = min(chunk, len(codes) - start)
+                np.copyto(block[:count], codes[start:start + count], casting="unsafe")
+                np.matmul(block[:count], queries, out=scores[start:start + count])
+        if scales is not None:
+            scores *= scales[:, None]
+        return scores
+
+    @staticmethod
+    def _top(scores: np.ndarray, k: int) -> np.ndarray:
+        """Positions of the k highest scores, best first."""
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top], kind="stable")]
+
+    def _rank(self, queries: np.ndarray, rows: Optional[np.ndarray], k: int) -> List[List[tuple]]:
+        """(row, cosine) of the k best rows for each query, searching `rows` (None = all)."""
+        if rows is not None and not len(rows):
+            return [[] for _ in queries]
+
+        if self._codes is None:
+            scores = (self.vectors if rows is None else self.vectors[rows]) @ queries.T
+            positions = [self._top(scores[:, i], k) for i in range(len(queries))]
+            return [
+                [(int(rows[p]) if rows is not None else int(p), float(scores[p, i])) for p in top]
+                for i, top in enumerate(positions)
+            ]
+
+        # Shortlist from the scan copy, then re-score in full precision
+        approximate = self._approximate_scores(queries, rows)
+        hits = []
+        for i, query in enumerate(queries):
+            shortlist = self._top(approximate[:, i], k * self.rerank)
+            candidates = np.sort(shortlist if rows is None else rows[shortlist])
+            exact = self.vectors[candidates] @ query
+            hits.append([(int(candidates[p]), float(exact[p])) for p in self._top(exact, k)])
+        return hits
+
+    def query(self, vector, k, where=None) -> List[Record]:
+        return self.query_batch([vector], k, where)[0]
+
+    def query_batch(self, vectors, k, where=None, batch_size: int = 64) -> List[List[Record]]:
+        """
+        Like query() for many vectors at once.
+
+        Without IVF, queries are scored in blocks of batch_size with one
+        matrix-matrix product (or one pass over the scan copy) per block,
+        and the records for every hit are read in a single lookup.
+        """
+        if self.vectors is None or not len(self._ids) or k <= 0 or not len(vectors):
+            return [[] for _ in vectors]
+        queries = self._normalize(vectors)
+        allowed = self._filter_rows(where)
+        if allowed is not None and not len(allowed):
+            return [[] for _ in vectors]
+
+        hits: List[List[tuple]] = []
+        if self.mode == "ivf" and self._centroids is not None:
+            for query in queries:
+                rows = self._candidate_rows(query)
+                if allowed is not None:
+                    rows = np.intersect1d(allowed, rows)
+                hits.extend(self._rank(query[None, :], np.sort(rows), k))
+        else:
+            for start in range(0, len(queries), batch_size):
+                hits.extend(self._rank(queries[start:start + batch_size], allowed, k))
+
+        wanted = list(dict.fromkeys(self._ids[row] for query_hits in hits for row, _ in query_hits))
+        records = {record['id']: record for record in self.get(wanted)}
+        results = []
+        for query_hits in hits:
+            matched = []
+            for row, score in query_hits:
+                record = records.get(self._ids[row])
+                if record is not None:
+                    # Squared L2 between unit vectors, the same scale Chroma reports
+                    matched.append({**record, 'distance': 2.0 - 2.0 * score})
+            results.append(matched)
+        return results
+
+    def get(self, ids, where=None) -> List[Record]:
+        if not ids:
+            return []
+        allowed = None
+        if where:
+            allowed = {self._ids[row] for row in self._filter_rows(where)}
+        found = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._db_lock:
+                fetched = self._db.execute(
+                    f"SELECT id, content, metadata FROM records WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+            for doc_id, content, metadata in fetched:
+                if allowed is None or doc_id in allowed:
+                    found[doc_id] = {'id': doc_id, 'content': content, 'metadata': json.loads(metadata)}
+        return [found[doc_id] for doc_id in ids if doc_id in found]
+
+    def destroy(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self.vectors = self._codes = self._scales = None
+        self._ids, self._rows, self._pending = [], {}, {}
+        for name in os.listdir(self.persist_directory) if os.path.isdir(self.persist_directory) else []:
+            if name in ("vectors.npy", "ids.json", "records.sqlite", "ivf.npz") or name.startswith("codes-"):
+                os.remove(self._path(name))
+
+
+def create_backend(
+    name: str,
+    persist_directory: str,
+    collection_name: str,
+    **options
+) -> VectorBackend:
+    """
+    Instantiate a backend by name.
+
+    Args:
+        name: "chroma" or "numpy"
+        persist_directory: Directory holding the index
+        collection_name: Collection name
+        **options: Backend-specific options (NumpyBackend: mode, nlist,
+            nprobe, quantization, dimensions, rerank)
+
+    Returns:
+        Unopened backend
+    """
+    if name == "chroma":
+        return ChromaBackend(persist_directory, collection_name)
+    if name == "numpy":
+        return NumpyBackend(persist_directory, collection_name, **options)
+    raise ValueError(f"Unknown vector backend: {name}")
@@ -0,0 +1,230 @@
+"""
+Embedding Cache Module
+Persistent, content-addressed cache of embedding vectors
+"""
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from typing import List, Dict, Any, Optional
+
+from langchain_core.embeddings import Embeddings
+
+
+# SQLite limits the number of bound parameters per statement
+_SQL_BATCH = 500
+
+
+def text_hash(text: str) -> bytes:
+    """Content address of a text: its SHA-256 digest."""
+    return hashlib.sha256(text.encode('utf-8')).digest()
+
+
+class EmbeddingCache:
+    """
+    SQLite table mapping (embedding model, sha256 of text) to a float32 vector.
+
+    Entries carry a last-used tick; once the cache holds more than
+    max_entries, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int = 2_000_000):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite database file
+            max_entries: Entries kept before LRU eviction kicks in
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " text_hash BLOB NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " last_used INTEGER NOT NULL,"
+            " PRIMARY KEY (model, text_hash)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+        )
+        self._conn.commit()
+
+        row = self._conn.execute("SELECT COUNT(*), MAX(last_used) FROM embeddings").fetchone()
+        self._size = row[0]
+        self._tick = row[1] or 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up cached vectors.
+
+        Args:
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            One vector (or None on a miss) per text, in order
+        """
+        hashes = [text_hash(text) for text in texts]
+        found: Dict[bytes, List[float]] = {}
+
+        with self._lock:
+            for start in range(0, len(hashes), _SQL_BATCH):
+                chunk = list(set(hashes[start:start + _SQL_BATCH]))
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *chunk]
+                ).fetchall()
+                for digest, blob in rows:
+                    vector = array('f')
+                    vector.frombytes(blob)
+                    found[digest] = vector.tolist()
+
+            if found:
+                self._tick += 1
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                    [(self._tick, model, digest) for digest in found]
+                )
+                self._conn.commit()
+
+            results = [found.get(digest) for digest in hashes]
+            hits = sum(1 for vector in results if vector is not None)
+            self.hits += hits
+            self.misses += len(results) - hits
+
+        return results
+
+    def put_many(self, model: str, texts: List[str], vectors: List[List[float]]):
+        """
+        Store vectors, evicting the least recently used entries if over capacity.
+
+        Args:
+            model: Embedding model name
+            texts: Texts that were embedded
+            vectors: Their vectors, in the same order
+        """
+        with self._lock:
+            self._tick += 1
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (model, text_hash, vector, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (model, text_hash(text), array('f', vector).tobytes(), self._tick)
+                    for text, vector in zip(texts, vectors)
+                ]
+            )
+            self._size += self._conn.total_changes - before
+
+            excess = self._size - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE (model, text_hash) IN ("
+                    " SELECT model, text_hash FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (excess,)
+                )
+                self._size -= excess
+                self.evictions += excess
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': self._size,
+            'max_entries': self.max_entries,
+            'evictions': self.evictions,
+        }
+
+    def clear(self):
+        """Remove every cached vector."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._size = 0
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that serves repeated texts from an EmbeddingCache.
+
+    Only texts missing from the cache are sent to the wrapped embeddings,
+    so re-embedding an unchanged dump makes no API calls at all.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, model: str):
+        """
+        Initialize the wrapper.
+
+        Args:
+            embeddings: Embeddings to call on cache misses
+            cache: Vector cache
+            model: Model name used as part of the cache key
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = model
+
+    def _missing(self, texts: List[str], cached: List[Optional[List[float]]]) -> List[str]:
+        """Distinct texts that were not in the cache, in first-seen order."""
+        return list(dict.fromkeys(
+            text for text, vector in zip(texts, cached) if vector is None
+        ))
+
+    @staticmethod
+    def _merge(texts, cached, missing, vectors) -> List[List[float]]:
+        fresh = dict(zip(missing, vectors))
+        return [vector if vector is not None else fresh[text] for text, vector in zip(texts, cached)]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, calling the wrapped embeddings only for cache misses."""
+        cached = self.cache.get_many(self.model, texts)
+        missing = self._missing(texts, cached)
+        vectors: List[List[float]] = []
+        if missing:
+            vectors = self.embeddings.embed_documents(missing)
+            self.cache.put_many(self.model, missing, vectors)
+        return self._merge(texts, cached, missing, vectors)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query through the cache."""
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Async variant of embed_documents; cache I/O runs in a worker thread."""
+        cached = await asyncio.to_thread(self.cache.get_many, self.model, texts)
+        missing = self._missing(texts, cached)
+        vectors: List[List[float]] = []
+        if missing:
+            vectors = await self.embeddings.aembed_documents(missing)
+            await asyncio.to_thread(self.cache.put_many, self.model, missing, vectors)
+        return self._merge(texts, cached, missing, vectors)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Async variant of embed_query."""
+        return (await self.aembed_documents([text]))[0]
@@ -0,0 +1,77 @@
+"""
+Fake Embeddings Module
+Deterministic, offline stand-in for OpenAIEmbeddings used by tests and benchmarks
+"""
+import asyncio
+import math
+import re
+import time
+import zlib
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Feature-hashing embeddings: words and character trigrams are hashed
+    into a fixed number of signed buckets and the result is L2-normalized.
+
+    The same text always gives the same vector, and texts sharing words
+    or spellings end up close together, so retrieval behaves sensibly
+    without any network calls.
+    """
+
+    def __init__(self, dimension: int = 256, latency: float = 0.0):
+        """
+        Initialize the fake embedder.
+
+        Args:
+            dimension: Vector size
+            latency: Seconds to sleep per call, to mimic a remote API
+        """
+        self.dimension = dimension
+        self.latency = latency
+        self.calls = 0
+        self.texts_embedded = 0
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimension
+        for word in _WORD_RE.findall(text.lower()):
+            features = [word]
+            padded = f"#{word}#"
+            features.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+            for feature in features:
+                digest = zlib.crc32(feature.encode('utf-8'))
+                sign = 1.0 if digest & 1 else -1.0
+                vector[(digest >> 1) % self.dimension] += sign
+
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts."""
+        self.calls += 1
+        self.texts_embedded += len(texts)
+        if self.latency:
+            time.sleep(self.latency)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query."""
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts without blocking the event loop on latency."""
+        self.calls += 1
+        self.texts_embedded += len(texts)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [self._embed(text) for text in texts]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Embed a single query asynchronously."""
+        return (await self.aembed_documents([text]))[0]
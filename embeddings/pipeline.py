@@ -0,0 +1,206 @@
+"""
+Embedding Pipeline Module
+Batched, concurrent, retrying embedding of voter documents
+"""
+import asyncio
+import random
+import time
+from typing import List, Dict, Any, Callable, Optional
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap, conservative token estimate for batching.
+
+    Bengali text costs roughly one token per UTF-8 byte pair with the
+    OpenAI tokenizers, and English about four characters per token;
+    counting UTF-8 bytes / 2 stays on the safe side for both without
+    loading a tokenizer.
+    """
+    return len(text.encode('utf-8')) // 2 + 1
+
+
+def make_batches(
+    documents: List[Dict[str, Any]],
+    token_budget: int,
+    max_batch_size: int,
+    token_counter: Callable[[str], int] = estimate_tokens
+) -> List[List[Dict[str, Any]]]:
+    """
+    Group documents into batches that fit a token budget.
+
+    Args:
+        documents: Documents with a 'content' field
+        token_budget: Maximum estimated tokens per batch
+        max_batch_size: Maximum documents per batch
+        token_counter: Function estimating tokens for a text
+
+    Returns:
+        List of document batches, in input order
+    """
+    batches = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+
+    for doc in documents:
+        tokens = token_counter(doc['content'])
+        if current and (current_tokens + tokens > token_budget or len(current) >= max_batch_size):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(doc)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+class EmbeddingPipeline:
+    """
+    Embeds documents in token-budgeted batches with bounded concurrency.
+
+    Each finished batch is handed to the sink (e.g. a Chroma upsert) as
+    soon as it is embedded, so a large rebuild makes steady progress and
+    a failure late in the run does not lose the batches already written.
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        sink: Callable[[List[Dict[str, Any]], List[List[float]]], None],
+        batch_tokens: int = 20000,
+        max_batch_size: int = 256,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        retry_base_delay: float = 1.0,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        token_counter: Callable[[str], int] = estimate_tokens
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            embeddings: LangChain embeddings object (embed_documents/aembed_documents)
+            sink: Called with (documents, vectors) for every finished batch
+            batch_tokens: Estimated token budget per embedding request
+            max_batch_size: Maximum documents per embedding request
+            max_concurrency: Embedding requests in flight at once
+            max_retries: Retries per batch before giving up
+            retry_base_delay: First retry delay in seconds, doubled per attempt
+            progress_callback: Called with get_stats() after every batch
+            token_counter: Function estimating tokens for a text
+        """
+        self.embeddings = embeddings
+        self.sink = sink
+        self.batch_tokens = batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.progress_callback = progress_callback
+        self.token_counter = token_counter
+        self._reset_stats(0, 0)
+
+    def _reset_stats(self, documents_total: int, batches_total: int):
+        self.documents_total = documents_total
+        self.batches_total = batches_total
+        self.documents_done = 0
+        self.batches_done = 0
+        self.tokens_done = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Progress and throughput of the current (or last) run."""
+        if self.started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+
+        return {
+            'documents_total': self.documents_total,
+            'documents_done': self.documents_done,
+            'batches_total': self.batches_total,
+            'batches_done': self.batches_done,
+            'tokens_done': self.tokens_done,
+            'retries': self.retries,
+            'in_flight': self.in_flight,
+            'elapsed_seconds': elapsed,
+            'documents_per_second': self.documents_done / elapsed if elapsed else 0.0,
+            'tokens_per_second': self.tokens_done / elapsed if elapsed else 0.0,
+        }
+
+    async def _embed_with_retry(self, texts: List[str]) -> List[List[float]]:
+        """Embed one batch, backing off exponentially on errors such as rate limits."""
+        attempt = 0
+        while True:
+            try:
+                return await self.embeddings.aembed_documents(texts)
+            except Exception:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_base_delay * (2 ** attempt)
+                self.retries += 1
+                attempt += 1
+                # Jitter keeps concurrent batches from retrying in lockstep
+                await asyncio.sleep(delay * (0.5 + random.random()))
+
+    async def _process(
+        self,
+        batch: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+        sink_lock: asyncio.Lock
+    ):
+        async with semaphore:
+            texts = [doc['content'] for doc in batch]
+            self.in_flight += 1
+            try:
+                vectors = await self._embed_with_retry(texts)
+            finally:
+                self.in_flight -= 1
+
+        # Writes are serialized and run off the event loop
+        async with sink_lock:
+            await asyncio.to_thread(self.sink, batch, vectors)
+
+        self.documents_done += len(batch)
+        self.batches_done += 1
+        self.tokens_done += sum(self.token_counter(text) for text in texts)
+        if self.progress_callback:
+            self.progress_callback(self.get_stats())
+
+    async def run(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Embed all documents and write them through the sink.
+
+        Args:
+            documents: Documents with 'content' (and whatever the sink needs)
+
+        Returns:
+            Final statistics (see get_stats)
+        """
+        batches = make_batches(
+            documents, self.batch_tokens, self.max_batch_size, self.token_counter
+        )
+        self._reset_stats(sum(len(batch) for batch in batches), len(batches))
+        self.started_at = time.perf_counter()
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        sink_lock = asyncio.Lock()
+        tasks = [
+            asyncio.create_task(self._process(batch, semaphore, sink_lock))
+            for batch in batches
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            self.finished_at = time.perf_counter()
+
+        return self.get_stats()
@@ -0,0 +1,157 @@
+"""
+Query Cache Module
+In-process LRU caches of query embeddings and retrieval results
+"""
+import json
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+from langchain_core.documents import Document
+
+
+def filter_key(filter_dict: Optional[Dict[str, Any]]) -> str:
+    """Canonical, hashable form of a metadata filter (key order ignored)."""
+    if not filter_dict:
+        return ""
+    return json.dumps(filter_dict, sort_keys=True, ensure_ascii=False)
+
+
+class QueryCache:
+    """
+    Bounded LRU caches in front of VoterVectorStore searches.
+
+    One maps query text to its embedding, the other (query, k, filter,
+    retrieval mode) to the documents found. Results are tagged with a
+    generation counter that the store bumps on every write, sync or
+    rebuild: bumping drops all cached results, and a search that was
+    running while the index changed is not cached. Embeddings only depend
+    on the model and survive invalidation.
+
+    Every entry remembers how long it took to compute, so hits add up to
+    the latency they saved.
+    """
+
+    def __init__(self, max_results: int = 1024, max_embeddings: int = 4096):
+        """
+        Create empty caches.
+
+        Args:
+            max_results: Search results kept (0 disables result caching)
+            max_embeddings: Query embeddings kept (0 disables them)
+        """
+        self.max_results = max_results
+        self.max_embeddings = max_embeddings
+        self.generation = 0
+
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[tuple, Tuple[List[Document], float]]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, Tuple[List[float], float]]" = OrderedDict()
+
+        self.result_hits = 0
+        self.result_misses = 0
+        self.embedding_hits = 0
+        self.embedding_misses = 0
+        self.saved_seconds = 0.0
+
+    def invalidate(self):
+        """Start a new generation: cached results no longer match the index."""
+        with self._lock:
+            self.generation += 1
+            self._results.clear()
+
+    @staticmethod
+    def _get(entries: OrderedDict, key) -> Optional[tuple]:
+        entry = entries.get(key)
+        if entry is not None:
+            entries.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def _put(entries: OrderedDict, key, value: tuple, limit: int):
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > limit:
+            entries.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Search results
+
+    def get_results(self, key: tuple) -> Optional[List[Document]]:
+        """
+        Cached documents for a search key, or None (counted as a miss).
+
+        Args:
+            key: (query, k, filter_key(filter), retrieval mode)
+        """
+        if not self.max_results:
+            return None
+        with self._lock:
+            entry = self._get(self._results, key)
+            if entry is None:
+                self.result_misses += 1
+                return None
+            self.result_hits += 1
+            self.saved_seconds += entry[1]
+            return list(entry[0])
+
+    def put_results(self, key: tuple, documents: List[Document], seconds: float, generation: int):
+        """
+        Cache search results computed in `generation`.
+
+        Args:
+            key: Same key as get_results()
+            documents: Documents found
+            seconds: Time the search took
+            generation: self.generation read before searching; results
+                from an older generation are discarded
+        """
+        if not self.max_results:
+            return
+        with self._lock:
+            if generation == self.generation:
+                self._put(self._results, key, (list(documents), seconds), self.max_results)
+
+    # ------------------------------------------------------------------
+    # Query embeddings
+
+    def get_embedding(self, query: str) -> Optional[List[float]]:
+        """Cached embedding of a query text, or None (counted as a miss)."""
+        if not self.max_embeddings:
+            return None
+        with self._lock:
+            entry = self._get(self._embeddings, query)
+            if entry is None:
+                self.embedding_misses += 1
+                return None
+            self.embedding_hits += 1
+            self.saved_seconds += entry[1]
+            return entry[0]
+
+    def put_embedding(self, query: str, vector: List[float], seconds: float):
+        """Cache a query embedding that took `seconds` to compute."""
+        if self.max_embeddings:
+            with self._lock:
+                self._put(self._embeddings, query, (vector, seconds), self.max_embeddings)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, sizes and total latency saved."""
+        lookups = self.result_hits + self.result_misses
+        return {
+            'result_hits': self.result_hits,
+            'result_misses': self.result_misses,
+            'result_hit_rate': self.result_hits / lookups if lookups else 0.0,
+            'embedding_hits': self.embedding_hits,
+            'embedding_misses': self.embedding_misses,
+            'results': len(self._results),
+            'embeddings': len(self._embeddings),
+            'generation': self.generation,
+            'saved_ms': self.saved_seconds * 1000,
+        }
+
+    def clear(self):
+        """Drop every cached result and embedding."""
+        with self._lock:
+            self.generation += 1
+            self._results.clear()
+            self._embeddings.clear()
@@ -0,0 +1,27 @@
+"""
+Retriever Module
+LangChain retriever over VoterVectorStore
+"""
+from typing import List, Any
+
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import TOP_K_RESULTS
+
+
+class VoterRetriever(BaseRetriever):
+    """LangChain retriever that searches through VoterVectorStore.similarity_search."""
+    
+    store: Any
+    k: int = TOP_K_RESULTS
+    
+    def _get_relevant_documents(self, query: str, *, run_manager=None) -> List[Document]:
+        return self.store.similarity_search(query, k=self.k)
+    
+    async def _aget_relevant_documents(self, query: str, *, run_manager=None) -> List[Document]:
+        return await self.store.asimilarity_search(query, k=self.k)
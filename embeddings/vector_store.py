@@ -1,14 +1,15 @@
 """
 Vector Store Module
-Handles ChromaDB setup and embedding operations
+Handles vector backend setup and embedding operations
 """
 import os
-import chromadb
-from chromadb.config import Settings
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import time
 from langchain_core.documents import Document
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,28 +17,157 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     OPENAI_API_KEY,
     EMBEDDING_MODEL,
+    EMBEDDING_PROVIDER,
+    EMBEDDING_BATCH_TOKENS,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_CONCURRENCY,
+    EMBEDDING_MAX_RETRIES,
+    EMBEDDING_CACHE_PATH,
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    QUERY_CACHE_MAX_RESULTS,
+    QUERY_CACHE_MAX_EMBEDDINGS,
     CHROMA_DB_PATH,
     COLLECTION_NAME,
+    VECTOR_BACKEND,
+    NUMPY_INDEX_PATH,
+    NUMPY_INDEX_MODE,
+    IVF_NLIST,
+    IVF_NPROBE,
+    NUMPY_QUANTIZATION,
+    NUMPY_DIMENSIONS,
+    NUMPY_RERANK,
+    VECTOR_STORE_SYNC,
+    RETRIEVAL_MODE,
+    HYBRID_CANDIDATES,
+    RRF_K,
     TOP_K_RESULTS
 )
+from embeddings.backends import VectorBackend, create_backend
+from embeddings.pipeline import EmbeddingPipeline
+from embeddings.query_cache import QueryCache, filter_key
+from search.bm25 import BM25Index, reciprocal_rank_fusion
+from utils.data_loader import VoterDocuments, document_hash
 
 
-class VoterVectorStore:
-    """
-    Vector store for voter documents using ChromaDB and OpenAI embeddings.
+def create_embeddings():
     """
+    Create the embeddings client selected by EMBEDDING_PROVIDER.
     
-    def __init__(self):
-        """Initialize the vector store with OpenAI embeddings."""
-        self.embeddings = OpenAIEmbeddings(
+    Unless EMBEDDING_CACHE_PATH is None, the client is wrapped in the
+    persistent embedding cache so unchanged texts are never re-embedded.
+    """
+    if EMBEDDING_PROVIDER == "fake":
+        from embeddings.fake import FakeEmbeddings
+        embeddings = FakeEmbeddings()
+        model = f"fake-{embeddings.dimension}"
+    else:
+        # Imported here: langchain_openai (and openai) take over a second to import
+        from langchain_openai import OpenAIEmbeddings
+        embeddings = OpenAIEmbeddings(
             model=EMBEDDING_MODEL,
             openai_api_key=OPENAI_API_KEY
         )
-        self.vector_store: Optional[Chroma] = None
+        model = EMBEDDING_MODEL
+    
+    if EMBEDDING_CACHE_PATH is None:
+        return embeddings
+    from embeddings.cache import EmbeddingCache, CachedEmbeddings
+    cache = EmbeddingCache(EMBEDDING_CACHE_PATH, max_entries=EMBEDDING_CACHE_MAX_ENTRIES)
+    return CachedEmbeddings(embeddings, cache, model)
+
+
+def document_fingerprints(documents: Sequence[Dict[str, Any]]) -> List[tuple]:
+    """
+    (id, document_hash) of every document, in order.
+    
+    VoterDocuments supply both without building the documents, and
+    without hashing at all when they were loaded from a snapshot.
+    """
+    if isinstance(documents, VoterDocuments):
+        return list(zip(documents.ids(), documents.hashes()))
+    return [(doc['id'], document_hash(doc)) for doc in documents]
+
+
+def _is_equality_filter(filter_dict: Dict[str, Any]) -> bool:
+    """Whether a metadata filter is a plain {field: value} conjunction."""
+    return all(not key.startswith('$') and not isinstance(value, dict) for key, value in filter_dict.items())
+
+
+def run_sync(coro):
+    """Run a coroutine to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside an event loop: run on a private loop in a worker thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class VoterVectorStore:
+    """
+    Vector store for voter documents.
+    
+    Texts are embedded here and the vectors handed to a pluggable
+    backend (see embeddings/backends.py) selected by VECTOR_BACKEND:
+    ChromaDB, or a memory-mapped NumPy matrix.
+    """
+    
+    def __init__(self, backend: str = VECTOR_BACKEND):
+        """
+        Initialize the vector store with the configured embeddings.
+        
+        Args:
+            backend: "chroma" or "numpy"
+        """
+        # Created on first use, so opening a store does not import the client
+        self._embeddings = None
+        self.backend_name = backend
+        self.vector_store: Optional[VectorBackend] = None
         self.collection_name = COLLECTION_NAME
-        self.persist_directory = CHROMA_DB_PATH
+        self.persist_directory = CHROMA_DB_PATH if backend == "chroma" else NUMPY_INDEX_PATH
+        self.build_stats: Dict[str, Any] = {}
+        self.last_sync: Dict[str, Any] = {}
+        self.retrieval_mode = RETRIEVAL_MODE
+        self.bm25: Optional[BM25Index] = None
+        # Documents the keyword index was built from, in build order; lets
+        # hybrid search skip a backend round trip for keyword-only hits
+        self._keyword_documents: Optional[List[Dict[str, Any]]] = None
+        self._index_version = (None, None)
+        # Repeated searches (e.g. the fixed filter queries) skip embedding and ranking
+        self.query_cache = QueryCache(QUERY_CACHE_MAX_RESULTS, QUERY_CACHE_MAX_EMBEDDINGS)
         
-    def create_from_documents(self, documents: List[Dict[str, Any]]) -> Chroma:
+    @property
+    def embeddings(self):
+        """Embeddings client (see create_embeddings), created on first use."""
+        if self._embeddings is None:
+            self._embeddings = create_embeddings()
+        return self._embeddings
+    
+    @embeddings.setter
+    def embeddings(self, embeddings):
+        self._embeddings = embeddings
+    
+    def _open_backend(self) -> VectorBackend:
+        """Create and open the backend in persist_directory."""
+        options = {}
+        if self.backend_name == "numpy":
+            options = {
+                'mode': NUMPY_INDEX_MODE,
+                'nlist': IVF_NLIST,
+                'nprobe': IVF_NPROBE,
+                'quantization': NUMPY_QUANTIZATION,
+                'dimensions': NUMPY_DIMENSIONS,
+                'rerank': NUMPY_RERANK,
+            }
+        self.vector_store = create_backend(
+            self.backend_name, self.persist_directory, self.collection_name, **options
+        )
+        self.vector_store.open()
+        self.query_cache.invalidate()
+        return self.vector_store
+    
+    def create_from_documents(self, documents: List[Dict[str, Any]]) -> VectorBackend:
         """
         Create a new vector store from voter documents.
         
@@ -45,68 +175,291 @@ class VoterVectorStore:
             documents: List of document dictionaries with 'content' and 'metadata'
             
         Returns:
-            Chroma vector store instance
+            Vector backend instance
+        """
+        return run_sync(self.acreate_from_documents(documents))
+    
+    async def acreate_from_documents(self, documents: List[Dict[str, Any]]) -> VectorBackend:
         """
-        print(f"Creating vector store with {len(documents)} documents...")
+        Create a new vector store from voter documents, embedding batches concurrently.
         
-        # Convert to LangChain Document objects
-        langchain_docs = []
-        for doc in documents:
-            langchain_doc = Document(
-                page_content=doc['content'],
-                metadata=doc['metadata']
-            )
-            langchain_docs.append(langchain_doc)
-        
-        # Create ChromaDB vector store
-        self.vector_store = Chroma.from_documents(
-            documents=langchain_docs,
-            embedding=self.embeddings,
-            collection_name=self.collection_name,
-            persist_directory=self.persist_directory
-        )
+        Documents are embedded in token-budgeted batches and each batch is
+        written to the backend as soon as it is ready. Progress is printed as
+        batches finish and the final numbers are kept in build_stats.
         
-        print(f"Vector store created and persisted to {self.persist_directory}")
+        Args:
+            documents: List of document dictionaries with 'content' and 'metadata'
+            
+        Returns:
+            Vector backend instance
+        """
+        print(f"Creating {self.backend_name} vector store with {len(documents)} documents...")
+        
+        self._open_backend()
+        self.build_stats = await self._embed_and_write(documents)
+        self.vector_store.flush()
+        self._save_manifest(dict(document_fingerprints(documents)))
+        self.build_keyword_index(documents)
+        
+        print(f"Vector store created and persisted to {self.persist_directory} "
+              f"({self.build_stats['documents_per_second']:.0f} docs/s)")
+        cache_stats = self.embedding_cache_stats()
+        if cache_stats:
+            print(f"Embedding cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
         return self.vector_store
     
-    def load_existing(self) -> Optional[Chroma]:
+    async def _embed_and_write(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run documents through the embedding pipeline into the collection."""
+        pipeline = EmbeddingPipeline(
+            self.embeddings,
+            sink=self._write_batch,
+            batch_tokens=EMBEDDING_BATCH_TOKENS,
+            max_batch_size=EMBEDDING_BATCH_SIZE,
+            max_concurrency=EMBEDDING_MAX_CONCURRENCY,
+            max_retries=EMBEDDING_MAX_RETRIES,
+            progress_callback=self._print_progress
+        )
+        return await pipeline.run(documents)
+    
+    def _write_batch(self, documents: List[Dict[str, Any]], vectors: List[List[float]]):
+        """Upsert one embedded batch into the backend."""
+        self.query_cache.invalidate()
+        self.vector_store.upsert(
+            [doc['id'] for doc in documents],
+            vectors,
+            [doc['content'] for doc in documents],
+            [doc['metadata'] for doc in documents]
+        )
+    
+    @staticmethod
+    def _print_progress(stats: Dict[str, Any]):
+        """Print embedding progress every few batches."""
+        if stats['batches_done'] % 10 == 0 or stats['batches_done'] == stats['batches_total']:
+            print(f"Embedded {stats['documents_done']}/{stats['documents_total']} documents "
+                  f"({stats['documents_per_second']:.0f} docs/s, {stats['retries']} retries)")
+    
+    def load_existing(self) -> Optional[VectorBackend]:
         """
         Load an existing vector store from disk.
         
         Returns:
-            Chroma vector store instance or None if not found
+            Vector backend instance or None if not found
         """
         if os.path.exists(self.persist_directory):
             print(f"Loading existing vector store from {self.persist_directory}...")
-            self.vector_store = Chroma(
-                collection_name=self.collection_name,
-                embedding_function=self.embeddings,
-                persist_directory=self.persist_directory
-            )
+            self._open_backend()
+            self.bm25 = BM25Index.load(self.bm25_path)
+            self.query_cache.invalidate()
             return self.vector_store
         return None
     
-    def get_or_create(self, documents: Optional[List[Dict[str, Any]]] = None) -> Chroma:
+    def open_existing(self) -> VectorBackend:
+        """
+        Open a store built by get_or_create() without writing to it.
+        
+        Used by server workers, which must never build or sync: any
+        missing artifact is an error rather than a rebuild.
+        
+        Returns:
+            Vector backend instance
+            
+        Raises:
+            FileNotFoundError: If the store is missing or empty, or its
+                BM25 keyword index is missing
+        """
+        # Checked first: the keyword index is written last, and opening a
+        # Chroma directory without a collection would create one
+        if not os.path.exists(self.bm25_path):
+            raise FileNotFoundError(f"No keyword index at {self.bm25_path}")
+        backend = self.load_existing()
+        if backend is None or backend.count() == 0:
+            raise FileNotFoundError(f"No vector store in {self.persist_directory}")
+        if self.bm25 is None:
+            raise FileNotFoundError(f"Keyword index at {self.bm25_path} is from another version")
+        return backend
+    
+    def close(self):
+        """Release the backend and the keyword index; the files stay on disk."""
+        if self.vector_store is not None:
+            self.vector_store.close()
+        self.vector_store = None
+        self.bm25 = None
+        self._keyword_documents = None
+        self.query_cache.invalidate()
+    
+    @property
+    def manifest_path(self) -> str:
+        """File recording the id and content hash of every indexed document."""
+        return os.path.join(self.persist_directory, "manifest.json")
+    
+    @property
+    def index_version(self) -> Optional[str]:
+        """
+        Fingerprint of the indexed documents (a hash of the manifest).
+        
+        Changes whenever a build or sync changes what is indexed, so
+        caches of answers derived from the store can tell they are stale.
+        None when there is no manifest.
+        """
+        try:
+            stat = os.stat(self.manifest_path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._index_version[0] != signature:
+            with open(self.manifest_path, 'rb') as f:
+                self._index_version = (signature, hashlib.sha256(f.read()).hexdigest()[:16])
+        return self._index_version[1]
+    
+    @property
+    def bm25_path(self) -> str:
+        """File holding the BM25 keyword index, kept with the collection."""
+        return os.path.join(self.persist_directory, "bm25.pkl")
+    
+    def build_keyword_index(self, documents: List[Dict[str, Any]]) -> BM25Index:
+        """
+        (Re)build and persist the BM25 index over document content.
+        
+        Args:
+            documents: The full list of voter documents in the store
+            
+        Returns:
+            The new index
+        """
+        start = time.perf_counter()
+        self.bm25 = BM25Index.build(documents)
+        self.bm25.save(self.bm25_path)
+        self._keyword_documents = documents
+        self.query_cache.invalidate()
+        print(f"Built keyword index over {len(self.bm25)} documents "
+              f"({self.bm25.nbytes() / 1e6:.1f} MB, {time.perf_counter() - start:.1f}s)")
+        return self.bm25
+    
+    def _load_manifest(self) -> Optional[Dict[str, str]]:
+        """Read the {id: document hash} manifest, or None if there is none."""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)['documents']
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def _save_manifest(self, hashes: Dict[str, str]):
+        """Atomically replace the manifest."""
+        os.makedirs(self.persist_directory, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'documents': hashes}, f)
+        os.replace(tmp_path, self.manifest_path)
+    
+    def update_from_documents(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Bring the existing store in line with a new set of documents.
+        
+        Args:
+            documents: The full, current list of voter documents
+            
+        Returns:
+            Report with added/updated/deleted/unchanged counts and timing
+        """
+        return run_sync(self.aupdate_from_documents(documents))
+    
+    async def aupdate_from_documents(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Incrementally sync the store with a new set of documents.
+        
+        Each document is fingerprinted and compared with the manifest
+        saved by the previous build or sync. Only new or changed documents
+        are embedded and upserted by id; ids that disappeared from the
+        dump are deleted. Without a manifest (a store built before syncing
+        existed) every document is upserted and stray ids are removed.
+        
+        Args:
+            documents: The full, current list of voter documents
+            
+        Returns:
+            Report with added/updated/deleted/unchanged counts and timing
+        """
+        if self.vector_store is None:
+            raise ValueError("Vector store not initialized")
+        
+        start = time.perf_counter()
+        stored = self._load_manifest()
+        if stored is None:
+            existing_ids = self.vector_store.ids()
+            stored = dict.fromkeys(existing_ids, "")
+        
+        # Later duplicates of an id win, matching upsert semantics
+        current: Dict[str, tuple] = {}
+        for position, (doc_id, digest) in enumerate(document_fingerprints(documents)):
+            current[doc_id] = (digest, position)
+        
+        changed = [
+            documents[position] for doc_id, (digest, position) in current.items()
+            if stored.get(doc_id) != digest
+        ]
+        added = sum(1 for doc in changed if doc['id'] not in stored)
+        removed = [doc_id for doc_id in stored if doc_id not in current]
+        
+        for i in range(0, len(removed), EMBEDDING_BATCH_SIZE):
+            self.vector_store.delete(removed[i:i + EMBEDDING_BATCH_SIZE])
+        if changed:
+            await self._embed_and_write(changed)
+        self.vector_store.flush()
+        if changed or removed:
+            self.query_cache.invalidate()
+        self._save_manifest({doc_id: digest for doc_id, (digest, _) in current.items()})
+        unique = documents if len(current) == len(documents) else [
+            documents[position] for _, position in current.values()
+        ]
+        # BM25 hits are positions in build order, so a loaded index is only
+        # reused when the documents come in the same order
+        if changed or removed or self.bm25 is None or self.bm25.ids != list(current):
+            self.build_keyword_index(unique)
+        elif self._keyword_documents is None:
+            self._keyword_documents = unique
+        
+        self.last_sync = {
+            'added': added,
+            'updated': len(changed) - added,
+            'deleted': len(removed),
+            'unchanged': len(current) - len(changed),
+            'elapsed_seconds': time.perf_counter() - start,
+        }
+        print(f"Synced vector store: {self.last_sync['added']} added, "
+              f"{self.last_sync['updated']} updated, {self.last_sync['deleted']} deleted, "
+              f"{self.last_sync['unchanged']} unchanged ({self.last_sync['elapsed_seconds']:.1f}s)")
+        return self.last_sync
+    
+    def get_or_create(
+        self,
+        documents: Optional[List[Dict[str, Any]]] = None,
+        sync: bool = VECTOR_STORE_SYNC
+    ) -> VectorBackend:
         """
         Get existing vector store or create new one.
         
         Args:
             documents: Documents to use if creating new store
+            sync: Incrementally sync an existing store with the documents
             
         Returns:
-            Chroma vector store instance
+            Vector backend instance
         """
         # Try to load existing
         existing = self.load_existing()
         if existing is not None:
             # Check if it has documents
             try:
-                count = existing._collection.count()
-                if count > 0:
-                    print(f"Loaded existing vector store with {count} documents")
-                    return existing
-            except:
-                pass
+                count = existing.count()
+            except Exception:
+                count = 0
+            if count > 0:
+                print(f"Loaded existing vector store with {count} documents")
+                if documents and sync:
+                    self.update_from_documents(documents)
+                elif documents and self.bm25 is None:
+                    self.build_keyword_index(documents)
+                return existing
         
         # Create new if documents provided
         if documents:
@@ -123,6 +476,11 @@ class VoterVectorStore:
         """
         Search for similar documents.
         
+        Uses hybrid BM25 + dense retrieval when RETRIEVAL_MODE is "hybrid"
+        and a keyword index exists, plain dense search otherwise. Results
+        are served from query_cache when the same search ran before on
+        the current index.
+        
         Args:
             query: Search query
             k: Number of results to return
@@ -131,42 +489,338 @@ class VoterVectorStore:
         Returns:
             List of matching documents
         """
-        if self.vector_store is None:
-            raise ValueError("Vector store not initialized")
+        key = self._cache_key(query, k, filter_dict)
+        cached = self.query_cache.get_results(key)
+        if cached is not None:
+            return cached
+        
+        generation = self.query_cache.generation
+        start = time.perf_counter()
+        if self.retrieval_mode == "hybrid" and self.bm25 is not None:
+            documents = self.hybrid_search(query, k=k, filter_dict=filter_dict)
+        else:
+            documents = self.dense_search(query, k=k, filter_dict=filter_dict)
+        self.query_cache.put_results(key, documents, time.perf_counter() - start, generation)
+        return documents
+    
+    def _cache_key(self, query: str, k: int, filter_dict: Optional[Dict[str, Any]]) -> tuple:
+        """query_cache key of a similarity_search() call."""
+        hybrid = self.retrieval_mode == "hybrid" and self.bm25 is not None
+        return (query, k, filter_key(filter_dict), "hybrid" if hybrid else "dense")
+    
+    def embed_query(self, query: str) -> List[float]:
+        """Embedding of a search query, through query_cache."""
+        vector = self.query_cache.get_embedding(query)
+        if vector is None:
+            start = time.perf_counter()
+            vector = self.embeddings.embed_query(query)
+            self.query_cache.put_embedding(query, vector, time.perf_counter() - start)
+        return vector
+    
+    async def aembed_query(self, query: str) -> List[float]:
+        """Async embed_query()."""
+        vector = self.query_cache.get_embedding(query)
+        if vector is None:
+            start = time.perf_counter()
+            vector = await self.embeddings.aembed_query(query)
+            self.query_cache.put_embedding(query, vector, time.perf_counter() - start)
+        return vector
+    
+    def dense_search(
+        self,
+        query: str,
+        k: int = TOP_K_RESULTS,
+        filter_dict: Optional[Dict[str, str]] = None
+    ) -> List[Document]:
+        """
+        Embedding similarity search only.
+        
+        Args:
+            query: Search query
+            k: Number of results to return
+            filter_dict: Optional metadata filters
+            
+        Returns:
+            List of matching documents
+        """
+        return [doc for doc, _ in self.similarity_search_with_score(query, k=k, filter_dict=filter_dict)]
+    
+    def hybrid_search(
+        self,
+        query: str,
+        k: int = TOP_K_RESULTS,
+        filter_dict: Optional[Dict[str, str]] = None,
+        candidates: int = HYBRID_CANDIDATES,
+        dense: Optional[List[Document]] = None
+    ) -> List[Document]:
+        """
+        BM25 and dense search merged with reciprocal-rank fusion.
+        
+        Keyword matching catches exact Bengali names, serials and dates
+        that embeddings blur; the dense side still covers paraphrases.
+        
+        Args:
+            query: Search query
+            k: Number of results to return
+            filter_dict: Optional metadata filters (applied to both sides)
+            candidates: Keyword results fused with the dense top-k; BM25
+                hits are cheap, dense ones cost a vector search
+            dense: Dense top-k already retrieved for the query (search_batch)
+            
+        Returns:
+            List of matching documents, best first
+        """
+        if self.bm25 is None:
+            raise ValueError("Keyword index not built")
+        
+        candidates = max(candidates, k)
+        if dense is None:
+            dense = self.dense_search(query, k=k, filter_dict=filter_dict)
+        dense_ids = [doc.metadata.get('id') for doc in dense]
+        by_id = dict(zip(dense_ids, dense))
         
         if filter_dict:
-            results = self.vector_store.similarity_search(
-                query=query,
-                k=k,
-                filter=filter_dict
-            )
+            # Over-fetch keyword hits and keep those that pass the filter
+            keyword = self.bm25.top(query, k=candidates * 4)
+            by_id.update(self._keyword_hits(keyword, by_id, filter_dict))
+            keyword_ids = [self.bm25.ids[number] for number, _ in keyword]
+            keyword_ids = [doc_id for doc_id in keyword_ids if doc_id in by_id][:candidates]
         else:
-            results = self.vector_store.similarity_search(
-                query=query,
-                k=k
+            keyword = self.bm25.top(query, k=candidates)
+            keyword_ids = [self.bm25.ids[number] for number, _ in keyword]
+        
+        fused = [doc_id for doc_id, _ in reciprocal_rank_fusion([dense_ids, keyword_ids], k=RRF_K)[:k]]
+        if not filter_dict:
+            # Only the winners that dense search did not return need loading
+            winners = set(fused)
+            by_id.update(self._keyword_hits(
+                [hit for hit in keyword if self.bm25.ids[hit[0]] in winners], by_id
+            ))
+        return [by_id[doc_id] for doc_id in fused if doc_id in by_id]
+    
+    def search_batch(
+        self,
+        queries: List[str],
+        k: int = TOP_K_RESULTS,
+        filter_dict: Optional[Dict[str, str]] = None
+    ) -> List[List[Document]]:
+        """
+        similarity_search() for many queries at once.
+        
+        Queries found in query_cache are answered from it; the rest are
+        embedded in one batched request (through the embedding cache) and
+        ranked with one vectorized backend call; in hybrid mode each dense
+        result is then fused with BM25.
+        
+        Args:
+            queries: Search queries
+            k: Number of results per query
+            filter_dict: Optional metadata filters, shared by every query
+            
+        Returns:
+            One list of documents per query, in input order
+        """
+        if self.vector_store is None:
+            raise ValueError("Vector store not initialized")
+        if not queries:
+            return []
+        
+        results, missing, keys = self._cached_batch(queries, k, filter_dict)
+        if missing:
+            generation = self.query_cache.generation
+            vectors, unknown = self._cached_embeddings(missing)
+            if unknown:
+                start = time.perf_counter()
+                embedded = self.embeddings.embed_documents(unknown)
+                self._store_embeddings(vectors, unknown, embedded, time.perf_counter() - start)
+            start = time.perf_counter()
+            ranked = self._rank_batch(missing, [vectors[query] for query in missing], k, filter_dict)
+            self._store_batch(results, keys, missing, ranked, time.perf_counter() - start, generation)
+        return [results[query] for query in queries]
+    
+    def _cached_batch(
+        self,
+        queries: List[str],
+        k: int,
+        filter_dict: Optional[Dict[str, str]]
+    ) -> tuple:
+        """Split a batch into cached results and the distinct queries still to search."""
+        results: Dict[str, List[Document]] = {}
+        keys: Dict[str, tuple] = {}
+        for query in queries:
+            if query not in keys:
+                keys[query] = self._cache_key(query, k, filter_dict)
+                cached = self.query_cache.get_results(keys[query])
+                if cached is not None:
+                    results[query] = cached
+        return results, [query for query in keys if query not in results], keys
+    
+    def _cached_embeddings(self, queries: List[str]) -> tuple:
+        """Query embeddings found in query_cache, and the queries still to embed."""
+        vectors = {}
+        for query in queries:
+            vector = self.query_cache.get_embedding(query)
+            if vector is not None:
+                vectors[query] = vector
+        return vectors, [query for query in queries if query not in vectors]
+    
+    def _store_embeddings(
+        self,
+        vectors: Dict[str, List[float]],
+        queries: List[str],
+        embedded: List[List[float]],
+        seconds: float
+    ):
+        """Add freshly embedded queries to vectors and query_cache, splitting the time evenly."""
+        for query, vector in zip(queries, embedded):
+            vectors[query] = vector
+            self.query_cache.put_embedding(query, vector, seconds / len(queries))
+    
+    def _store_batch(
+        self,
+        results: Dict[str, List[Document]],
+        keys: Dict[str, tuple],
+        queries: List[str],
+        ranked: List[List[Document]],
+        seconds: float,
+        generation: int
+    ):
+        """Add searched queries to results and query_cache, splitting the time evenly."""
+        for query, documents in zip(queries, ranked):
+            results[query] = documents
+            self.query_cache.put_results(keys[query], documents, seconds / len(queries), generation)
+    
+    def _rank_batch(
+        self,
+        queries: List[str],
+        vectors: List[List[float]],
+        k: int,
+        filter_dict: Optional[Dict[str, str]]
+    ) -> List[List[Document]]:
+        """Dense top-k for embedded queries, fused with BM25 in hybrid mode."""
+        dense = [
+            [Document(page_content=record['content'], metadata=record['metadata']) for record in records]
+            for records in self.vector_store.query_batch(vectors, k, where=filter_dict)
+        ]
+        if self.retrieval_mode != "hybrid" or self.bm25 is None:
+            return dense
+        return [
+            self.hybrid_search(query, k=k, filter_dict=filter_dict, dense=documents)
+            for query, documents in zip(queries, dense)
+        ]
+    
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = TOP_K_RESULTS,
+        filter_dict: Optional[Dict[str, str]] = None
+    ) -> List[Document]:
+        """
+        Async similarity_search().
+        
+        The query is embedded without blocking the event loop, and the
+        CPU-bound ranking (vector scan, BM25, fusion) runs in a worker thread.
+        
+        Args:
+            query: Search query
+            k: Number of results to return
+            filter_dict: Optional metadata filters
+            
+        Returns:
+            List of matching documents
+        """
+        return (await self.asearch_batch([query], k=k, filter_dict=filter_dict))[0]
+    
+    async def asearch_batch(
+        self,
+        queries: List[str],
+        k: int = TOP_K_RESULTS,
+        filter_dict: Optional[Dict[str, str]] = None
+    ) -> List[List[Document]]:
+        """Async search_batch(); ranking runs in a worker thread."""
+        if self.vector_store is None:
+            raise ValueError("Vector store not initialized")
+        if not queries:
+            return []
+        
+        results, missing, keys = self._cached_batch(queries, k, filter_dict)
+        if missing:
+            generation = self.query_cache.generation
+            vectors, unknown = self._cached_embeddings(missing)
+            if unknown:
+                start = time.perf_counter()
+                embedded = await self.embeddings.aembed_documents(unknown)
+                self._store_embeddings(vectors, unknown, embedded, time.perf_counter() - start)
+            start = time.perf_counter()
+            ranked = await asyncio.to_thread(
+                self._rank_batch, missing, [vectors[query] for query in missing], k, filter_dict
             )
+            self._store_batch(results, keys, missing, ranked, time.perf_counter() - start, generation)
+        return [results[query] for query in queries]
+    
+    def _keyword_hits(
+        self,
+        hits: List[tuple],
+        known: Dict[str, Document],
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Document]:
+        """
+        Documents for BM25 hits that are not loaded yet.
+        
+        Served from the documents the index was built from when they are
+        still in memory, otherwise fetched from the backend.
+        """
+        numbers = [number for number, _ in hits if self.bm25.ids[number] not in known]
+        if self._keyword_documents is None or (filter_dict and not _is_equality_filter(filter_dict)):
+            return self._fetch_documents([self.bm25.ids[number] for number in numbers], where=filter_dict)
         
-        return results
+        found = {}
+        for number in numbers:
+            doc = self._keyword_documents[number]
+            metadata = doc['metadata']
+            if filter_dict and any(metadata.get(key) != value for key, value in filter_dict.items()):
+                continue
+            found[doc['id']] = Document(page_content=doc['content'], metadata=metadata)
+        return found
+    
+    def _fetch_documents(
+        self,
+        ids: List[str],
+        where: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Document]:
+        """Load stored documents by id, optionally only those matching a filter."""
+        if not ids:
+            return {}
+        return {
+            record['id']: Document(page_content=record['content'], metadata=record['metadata'])
+            for record in self.vector_store.get(ids, where=where)
+        }
     
     def similarity_search_with_score(
         self, 
         query: str, 
-        k: int = TOP_K_RESULTS
+        k: int = TOP_K_RESULTS,
+        filter_dict: Optional[Dict[str, str]] = None
     ) -> List[tuple[Document, float]]:
         """
-        Search for similar documents with relevance scores.
+        Search for similar documents with distances (lower is closer).
         
         Args:
             query: Search query
             k: Number of results to return
+            filter_dict: Optional metadata filters
             
         Returns:
-            List of (document, score) tuples
+            List of (document, distance) tuples
         """
         if self.vector_store is None:
             raise ValueError("Vector store not initialized")
         
-        return self.vector_store.similarity_search_with_score(query=query, k=k)
+        vector = self.embed_query(query)
+        return [
+            (Document(page_content=record['content'], metadata=record['metadata']), record['distance'])
+            for record in self.vector_store.query(vector, k, where=filter_dict)
+        ]
     
     def get_retriever(self, k: int = TOP_K_RESULTS):
         """
@@ -181,13 +835,40 @@ class VoterVectorStore:
         if self.vector_store is None:
             raise ValueError("Vector store not initialized")
         
-        return self.vector_store.as_retriever(
-            search_type="similarity",
-            search_kwargs={"k": k}
-        )
+        # Imported here: langchain_core.retrievers pulls in langsmith
+        from embeddings.retriever import VoterRetriever
+        return VoterRetriever(store=self, k=k)
+    
+    def embedding_cache_stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters of the embedding cache.
+        
+        Returns:
+            Cache statistics, or an empty dict when the cache is disabled
+        """
+        if self._embeddings is None:
+            return {}
+        from embeddings.cache import CachedEmbeddings
+        if isinstance(self._embeddings, CachedEmbeddings):
+            return self._embeddings.cache.stats()
+        return {}
+    
+    def query_cache_stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters and latency saved by the in-memory query cache.
+        
+        Returns:
+            Cache statistics (see QueryCache.stats)
+        """
+        return self.query_cache.stats()
     
     def delete_collection(self):
         """Delete the vector store collection."""
+        if self.vector_store is not None:
+            self.vector_store.destroy()
+            self.vector_store = None
+        self.query_cache.invalidate()
+        
         if os.path.exists(self.persist_directory):
             import shutil
             shutil.rmtree(self.persist_directory)
@@ -0,0 +1,325 @@
+"""
+Answer Cache Module
+Two-level (exact, then semantic) cache of generated answers
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+from utils.text import tokenize
+
+
+# Question and function words that may differ between two phrasings of
+# the same question; every other word (names, fields, numbers) must match
+_QUESTION_WORDS = frozenset(unicodedata.normalize('NFC', word) for word in (
+    'a', 'an', 'the', 'of', 'is', 'are', 'was', 'what', 'whats', 'who', 'whose', 'which',
+    'where', 'when', 'how', 'do', 'does', 'did', 'can', 'could', 'you', 'me', 'i', 'tell',
+    'please', 'about', 'give', 'show', 'find', 'for', 'to', 'in', 'and', 's', 'there',
+    'কি', 'কী', 'কে', 'কার', 'এর', 'র', 'কোথায়', 'কোন', 'আছে', 'হয়', 'হল', 'হলো', 'বলুন',
+    'বলো', 'বলেন', 'দাও', 'দিন', 'জানাও', 'জানান', 'আমাকে', 'একটু', 'দয়া', 'করে', 'ও', 'এবং',
+))
+
+
+def normalize_question(question: str) -> str:
+    """
+    Exact-match key of a question: Bengali digits folded to ASCII, case
+    folded, punctuation dropped and whitespace collapsed.
+    """
+    return " ".join(tokenize(question))
+
+
+def _content_words(key: str) -> frozenset:
+    """Names, fields and numbers of a normalized question."""
+    return frozenset(word for word in key.split() if word not in _QUESTION_WORDS)
+
+
+class AnswerCache:
+    """
+    LRU + TTL cache of answers from the LLM.
+
+    Level one matches the normalized question text exactly. Level two
+    compares the question embedding with those of cached questions and
+    accepts the closest one above a cosine threshold, provided both
+    use the same words apart from question words, so "ward 1" never
+    answers "ward 2" and Karima's address never answers Rahima's.
+
+    Entries are tagged with the vector store's index version; when the
+    store is rebuilt or synced with changes the whole cache is dropped.
+    With a path the entries are mirrored to SQLite and survive restarts.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 1000,
+        ttl_seconds: Optional[float] = 86400,
+        similarity: float = 0.95
+    ):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite file to persist entries to (None keeps them in memory)
+            max_entries: Entries kept before LRU eviction
+            ttl_seconds: Age after which an entry is discarded (None = never)
+            similarity: Minimum cosine similarity for a semantic hit
+                (None disables the semantic level)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity = similarity
+        self.version: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Question embeddings, one row per entry that has one
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors: Optional[np.ndarray] = None
+
+        self.exact_hits = 0
+        self.exact_misses = 0
+        self.semantic_hits = 0
+        self.semantic_misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            # Server workers share the file; WAL lets them read while one writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                " key TEXT PRIMARY KEY, entry TEXT NOT NULL, vector BLOB, created REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            self._conn.commit()
+            self._load()
+
+    def _load(self):
+        """Read persisted entries, oldest first so the LRU order roughly survives."""
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        self.version = row[0] if row else None
+        for key, entry, blob, created in self._conn.execute(
+            "SELECT key, entry, vector, created FROM answers ORDER BY created"
+        ):
+            entry = json.loads(entry)
+            entry['created'] = created
+            self._entries[key] = entry
+            if blob is not None:
+                self._add_vector(key, np.frombuffer(blob, dtype=np.float32))
+
+    # ------------------------------------------------------------------
+    # Embedding rows
+
+    def _add_vector(self, key: str, vector: np.ndarray):
+        if self._vectors is None:
+            self._vectors = np.empty((max(16, self.max_entries), len(vector)), dtype=np.float32)
+        elif len(self._keys) == len(self._vectors):
+            self._vectors = np.concatenate([self._vectors, np.empty_like(self._vectors)])
+        self._rows[key] = len(self._keys)
+        self._vectors[len(self._keys)] = vector
+        self._keys.append(key)
+
+    def _remove_vector(self, key: str):
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        last = self._keys.pop()
+        if last != key:
+            # Move the last row into the freed slot
+            self._vectors[row] = self._vectors[len(self._keys)]
+            self._keys[row] = last
+            self._rows[last] = row
+
+    @staticmethod
+    def _unit(vector: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    # ------------------------------------------------------------------
+    # Cache operations
+
+    def validate(self, version: Optional[str]):
+        """Drop every entry if the index version changed since they were cached."""
+        if version == self.version:
+            return
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._keys, self._rows, self._vectors = [], {}, None
+            self.version = version
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM answers")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)", (version,)
+                )
+                self._conn.commit()
+
+    def _expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry['created'] > self.ttl_seconds
+
+    def _drop(self, key: str):
+        self._entries.pop(key, None)
+        self._remove_vector(key)
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def get_exact(self, question: str) -> Optional[Dict[str, Any]]:
+        """
+        Level one: the cached answer for the same normalized question.
+
+        Returns:
+            Result dictionary ('answer', 'source_documents', 'route') or None
+        """
+        key = normalize_question(question)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, time.time()):
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.exact_misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.exact_hits += 1
+            return self._result(entry)
+
+    def get_semantic(self, question: str, vector: Sequence[float]) -> Optional[Dict[str, Any]]:
+        """
+        Level two: the cached answer whose question embedding is closest,
+        if it clears the similarity threshold. Counts a miss otherwise.
+
+        Args:
+            question: The question (its names and numbers must match the cached one's)
+            vector: The question's embedding
+
+        Returns:
+            Result dictionary or None
+        """
+        with self._lock:
+            if self.similarity is None or not self._keys:
+                self.semantic_misses += 1
+                return None
+            scores = self._vectors[:len(self._keys)] @ self._unit(vector)
+            words = _content_words(normalize_question(question))
+            now = time.time()
+            for row in np.argsort(-scores):
+                if scores[row] < self.similarity:
+                    break
+                key = self._keys[row]
+                entry = self._entries[key]
+                if self._expired(entry, now) or _content_words(key) != words:
+                    continue
+                self._entries.move_to_end(key)
+                self.semantic_hits += 1
+                return self._result(entry)
+            self.semantic_misses += 1
+            return None
+
+    def put(self, question: str, result: Dict[str, Any], vector: Optional[Sequence[float]] = None):
+        """
+        Cache an answer, evicting the least recently used entries if over capacity.
+
+        Args:
+            question: The question that was answered
+            result: Dictionary with 'answer', 'source_documents' and 'route'
+            vector: The question's embedding, for semantic matching
+        """
+        key = normalize_question(question)
+        entry = {
+            'answer': result['answer'],
+            'route': result.get('route'),
+            'sources': [
+                {'content': doc.page_content, 'metadata': doc.metadata}
+                for doc in result.get('source_documents', [])
+            ],
+            'created': time.time(),
+        }
+        unit = self._unit(vector) if vector is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove_vector(key)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if unit is not None:
+                self._add_vector(key, unit)
+
+            evicted = []
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._remove_vector(old_key)
+                evicted.append((old_key,))
+            self.evictions += len(evicted)
+
+            if self._conn is not None:
+                stored = {name: value for name, value in entry.items() if name != 'created'}
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO answers (key, entry, vector, created) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(stored, ensure_ascii=False),
+                     unit.tobytes() if unit is not None else None, entry['created'])
+                )
+                self._conn.executemany("DELETE FROM answers WHERE key = ?", evicted)
+                self._conn.commit()
+
+    @staticmethod
+    def _result(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'answer': entry['answer'],
+            'source_documents': [
+                Document(page_content=source['content'], metadata=source['metadata'])
+                for source in entry['sources']
+            ],
+            'route': entry['route'],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters and size.
+
+        Every lookup starts at the exact level, so the hit rate is taken
+        over exact_hits + exact_misses; 'misses' counts the questions
+        neither level answered, including those routed past the LLM
+        that never reached the semantic level.
+        """
+        hits = self.exact_hits + self.semantic_hits
+        lookups = self.exact_hits + self.exact_misses
+        return {
+            'exact_hits': self.exact_hits,
+            'exact_misses': self.exact_misses,
+            'semantic_hits': self.semantic_hits,
+            'semantic_misses': self.semantic_misses,
+            'misses': lookups - hits,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+        }
+
+    def clear(self):
+        """Remove every cached answer."""
+        with self._lock:
+            self._entries.clear()
+            self._keys, self._rows, self._vectors = [], {}, None
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM answers")
+                self._conn.commit()
@@ -2,24 +2,64 @@
 RAG Chain Module
 Implements the Retrieval-Augmented Generation pipeline for voter queries
 """
+import asyncio
 import os
 import sys
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import deque
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from langchain_openai import ChatOpenAI
-from langchain_classic.chains import RetrievalQA
-from langchain_core.prompts import PromptTemplate
 from langchain_core.documents import Document
 
 from config import (
     OPENAI_API_KEY,
     LLM_MODEL,
     SYSTEM_PROMPT,
-    TOP_K_RESULTS
+    TOP_K_RESULTS,
+    QUERY_ROUTING,
+    LIST_RESULT_LIMIT,
+    LLM_MAX_CONCURRENCY,
+    LLM_PROVIDER,
+    FAKE_LLM_LATENCY,
+    ANSWER_CACHE,
+    ANSWER_CACHE_PATH,
+    ANSWER_CACHE_MAX_ENTRIES,
+    ANSWER_CACHE_TTL,
+    ANSWER_CACHE_SIMILARITY
 )
 from embeddings.vector_store import VoterVectorStore
+from rag.answer_cache import AnswerCache
+from search.aggregates import AggregateEngine
+from search.metadata_index import MetadataIndex
+from search.name_index import NameIndex
+from search.phonetic import PhoneticIndex
+from rag.router import QueryRouter, ROUTE_LOOKUP, ROUTE_FILTER, ROUTE_AGGREGATE, ROUTE_RAG
+from utils.data_loader import build_voter_document
+from utils.text import is_latin
+from utils.voter_table import VoterTable
+
+
+# Vector search queries used when the name indexes find nothing
+_NAME_QUERIES = {
+    'name': "নাম {0} name {0}",
+    'father_name': "পিতার নাম {0} father {0}",
+}
+
+
+def create_llm():
+    """Create the chat model selected by LLM_PROVIDER."""
+    if LLM_PROVIDER == "fake":
+        from rag.fake import FakeChatModel
+        return FakeChatModel(latency=FAKE_LLM_LATENCY)
+    # Imported here: langchain_openai (and openai) take over a second to import
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(
+        model=LLM_MODEL,
+        temperature=0.3
+    )
 
 
 class VoterRAGChain:
@@ -27,25 +67,57 @@ class VoterRAGChain:
     RAG chain for answering questions about voter information.
     """
     
-    def __init__(self, vector_store: VoterVectorStore):
+    def __init__(self, vector_store: VoterVectorStore, voters: Optional[VoterTable] = None):
         """
         Initialize the RAG chain.
         
         Args:
             vector_store: Initialized VoterVectorStore instance
+            voters: Loaded voter table; enables exact name and voter id lookups
         """
         self.vector_store = vector_store
-        self.llm = ChatOpenAI(
-            model=LLM_MODEL,
-            temperature=0.3
-        )
-        self.retriever = vector_store.get_retriever(k=TOP_K_RESULTS)
-        self.qa_chain = self._create_qa_chain()
-        
-    def _create_qa_chain(self):
-        """Create the QA chain with custom prompt."""
+        self.voters = voters
+        self.name_index = NameIndex(voters) if voters is not None else None
+        self.phonetic_index = PhoneticIndex(voters) if voters is not None else None
+        self.aggregates = AggregateEngine(voters) if voters is not None else None
+        self.metadata_index = MetadataIndex(voters) if voters is not None else None
+        self.router = QueryRouter(self.aggregates) if voters is not None and QUERY_ROUTING else None
+        if vector_store.vector_store is None:
+            raise ValueError("Vector store not initialized")
+        # The LLM client, retriever and RetrievalQA chain are created on first use
+        self._llm = None
+        self._qa_chain = None
+        self.answer_cache = AnswerCache(
+            ANSWER_CACHE_PATH,
+            max_entries=ANSWER_CACHE_MAX_ENTRIES,
+            ttl_seconds=ANSWER_CACHE_TTL,
+            similarity=ANSWER_CACHE_SIMILARITY
+        ) if ANSWER_CACHE else None
+        self.prompt = self._create_prompt()
+    
+    @property
+    def llm(self):
+        """Chat model (see create_llm), created on first use."""
+        if self._llm is None:
+            self._llm = create_llm()
+        return self._llm
+    
+    @llm.setter
+    def llm(self, llm):
+        self._llm = llm
+        self._qa_chain = None
+    
+    @property
+    def qa_chain(self):
+        """RetrievalQA chain behind query(), created on first use."""
+        if self._qa_chain is None:
+            self._qa_chain = self._create_qa_chain()
+        return self._qa_chain
+    
+    def _create_prompt(self):
+        """Custom prompt template for bilingual responses."""
+        from langchain_core.prompts import PromptTemplate
         
-        # Custom prompt template for bilingual responses
         prompt_template = """
 {system_prompt}
 
@@ -56,18 +128,22 @@ Question: {question}
 
 Answer (respond in the same language as the question):"""
 
-        PROMPT = PromptTemplate(
+        return PromptTemplate(
             template=prompt_template,
             input_variables=["context", "question"],
             partial_variables={"system_prompt": SYSTEM_PROMPT}
         )
+    
+    def _create_qa_chain(self):
+        """Create the QA chain with custom prompt."""
+        from langchain_classic.chains import RetrievalQA
         
         chain = RetrievalQA.from_chain_type(
             llm=self.llm,
             chain_type="stuff",
-            retriever=self.retriever,
+            retriever=self.vector_store.get_retriever(k=TOP_K_RESULTS),
             return_source_documents=True,
-            chain_type_kwargs={"prompt": PROMPT}
+            chain_type_kwargs={"prompt": self.prompt}
         )
         
         return chain
@@ -89,10 +165,334 @@ Answer (respond in the same language as the question):"""
             "source_documents": result["source_documents"]
         }
     
+    async def aquery(self, question: str) -> Dict[str, Any]:
+        """
+        Async query(): awaits embedding, retrieval and generation.
+        
+        Retrieval ranking runs in a worker thread, so the event loop keeps
+        serving other questions while this one waits on the APIs.
+        
+        Args:
+            question: User's question
+            
+        Returns:
+            Dictionary with 'answer' and 'source_documents'
+        """
+        documents = await self.vector_store.asimilarity_search(question, k=TOP_K_RESULTS)
+        reply = await self.llm.ainvoke(self._format_prompt(question, documents))
+        return {
+            "answer": reply.content,
+            "source_documents": documents
+        }
+    
+    def _format_prompt(self, question: str, documents: List[Document]) -> str:
+        """The QA prompt, filled the way the "stuff" chain fills it."""
+        context = "\n\n".join(doc.page_content for doc in documents)
+        return self.prompt.format(context=context, question=question)
+    
+    def classify(self, question: str) -> Dict[str, Any]:
+        """Route decision for a question (always RAG without a voter table)."""
+        if self.router is None:
+            return {'route': ROUTE_RAG, 'params': {}}
+        return self.router.classify(question)
+    
+    def answer(self, question: str, route: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Answer a question through the cheapest route that can handle it.
+        
+        Voter id and name lookups, "list all" filters and counts are
+        answered from the in-memory indexes; everything else (and any
+        lookup that finds nothing) goes through the RAG chain, unless the
+        answer cache already holds an answer for the same or a
+        near-identical question.
+        
+        Args:
+            question: User's question
+            route: Force the RAG route (ROUTE_RAG); lookups, filters and
+                counts need the router's parameters and cannot be forced
+            
+        Returns:
+            Dictionary with 'answer', 'source_documents', 'route',
+            'cached' (None, "exact" or "semantic") and 'timings'
+            (classify_ms, execute_ms, total_ms)
+        """
+        started = time.perf_counter()
+        result = self._cached_exact(question)
+        if result is not None:
+            return _with_timings(result, started, started)
+        
+        if route is None:
+            decision = self.classify(question)
+        else:
+            decision = _forced_decision(route)
+        classified = time.perf_counter()
+        
+        result = self._answer_routed(question, decision)
+        if result is not None:
+            result["route"] = decision['route']
+            result["cached"] = None
+            return _with_timings(result, started, classified)
+        
+        if self.answer_cache is None:
+            return _with_timings(self._fresh(self.query(question)), started, classified)
+        vector = self.vector_store.embed_query(question)
+        result = self.answer_cache.get_semantic(question, vector)
+        if result is not None:
+            result["cached"] = "semantic"
+            return _with_timings(result, started, classified)
+        result = self._fresh(self.query(question))
+        self.answer_cache.put(question, result, vector)
+        return _with_timings(result, started, classified)
+    
+    def _cached_exact(self, question: str) -> Optional[Dict[str, Any]]:
+        """Level-one answer cache lookup, after dropping answers from an older index."""
+        if self.answer_cache is None:
+            return None
+        self.answer_cache.validate(self.vector_store.index_version)
+        result = self.answer_cache.get_exact(question)
+        if result is not None:
+            result["cached"] = "exact"
+        return result
+    
+    @staticmethod
+    def _fresh(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark a result the LLM just generated."""
+        result["route"] = ROUTE_RAG
+        result["cached"] = None
+        return result
+    
+    async def aanswer(self, question: str, route: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async answer(). Answer cache reads and writes (SQLite), routing
+        and index lookups run in worker threads.
+        
+        Args:
+            question: User's question
+            route: Force the RAG route (ROUTE_RAG); lookups, filters and
+                counts need the router's parameters and cannot be forced
+            
+        Returns:
+            Dictionary with 'answer', 'source_documents', 'route', 'cached'
+            and 'timings'
+        """
+        started = time.perf_counter()
+        result = await asyncio.to_thread(self._cached_exact, question)
+        if result is not None:
+            return _with_timings(result, started, started)
+        
+        if route is None:
+            decision = await asyncio.to_thread(self.classify, question)
+        else:
+            decision = _forced_decision(route)
+        classified = time.perf_counter()
+        
+        if decision['route'] != ROUTE_RAG:
+            result = await asyncio.to_thread(self._answer_routed, question, decision)
+            if result is not None:
+                result["route"] = decision['route']
+                result["cached"] = None
+                return _with_timings(result, started, classified)
+        
+        if self.answer_cache is None:
+            return _with_timings(self._fresh(await self.aquery(question)), started, classified)
+        vector = await self.vector_store.aembed_query(question)
+        result = self.answer_cache.get_semantic(question, vector)
+        if result is not None:
+            result["cached"] = "semantic"
+            return _with_timings(result, started, classified)
+        result = self._fresh(await self.aquery(question))
+        await asyncio.to_thread(self.answer_cache.put, question, result, vector)
+        return _with_timings(result, started, classified)
+    
+    def stream(self, question: str, route: Optional[str] = None) -> 'AnswerStream':
+        """
+        Answer a question as a stream of text chunks.
+        
+        Routing and retrieval happen before this returns, so the source
+        documents and route are available straight away; iterating the
+        stream then yields the answer as the LLM produces it (routed
+        answers arrive as a single chunk).
+        
+        Args:
+            question: User's question
+            route: Force the RAG route (ROUTE_RAG); lookups, filters and
+                counts need the router's parameters and cannot be forced
+            
+        Returns:
+            AnswerStream over the answer text
+        """
+        started = time.perf_counter()
+        result = self._cached_exact(question)
+        if result is not None:
+            return AnswerStream(result["route"], result["source_documents"], [result["answer"]],
+                                started, started, cached="exact")
+        
+        if route is None:
+            decision = self.classify(question)
+        else:
+            decision = _forced_decision(route)
+        classified = time.perf_counter()
+        
+        result = self._answer_routed(question, decision)
+        if result is not None:
+            return AnswerStream(decision['route'], result["source_documents"], [result["answer"]],
+                                started, classified)
+        
+        vector = None
+        if self.answer_cache is not None:
+            vector = self.vector_store.embed_query(question)
+            result = self.answer_cache.get_semantic(question, vector)
+            if result is not None:
+                return AnswerStream(ROUTE_RAG, result["source_documents"], [result["answer"]],
+                                    started, classified, cached="semantic")
+        
+        documents = self.vector_store.similarity_search(question, k=TOP_K_RESULTS)
+        chunks = (chunk.content for chunk in self.llm.stream(self._format_prompt(question, documents)))
+        stream = AnswerStream(ROUTE_RAG, documents, chunks, started, classified)
+        if self.answer_cache is not None:
+            stream.callbacks.append(lambda done: self.answer_cache.put(
+                question, {"answer": done.answer, "source_documents": done.source_documents, "route": ROUTE_RAG},
+                vector
+            ))
+        return stream
+    
+    def _answer_routed(self, question: str, decision: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Answer from the indexes for non-RAG routes; None when the LLM is needed."""
+        if decision['route'] == ROUTE_LOOKUP:
+            return self._answer_lookup(question, decision['params'])
+        if decision['route'] == ROUTE_FILTER:
+            return self._answer_filter(question, decision['params'])
+        if decision['route'] == ROUTE_AGGREGATE:
+            stats = self.aggregates.answer(question, decision['params'])
+            return {"answer": stats["answer"], "source_documents": []}
+        return None
+    
+    def query_batch(
+        self,
+        questions: List[str],
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        route: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Answer many questions in one call.
+        
+        Questions the router can handle are answered from the indexes.
+        The rest are retrieved together (one batched embedding request,
+        one vectorized top-k) and sent to the LLM with at most
+        max_concurrency calls in flight. A failure only affects its own
+        question.
+        
+        Args:
+            questions: Questions to answer
+            max_concurrency: LLM calls in flight at once
+            route: Force the RAG route for every question (ROUTE_RAG)
+            
+        Returns:
+            One dictionary per question, in input order, with 'question',
+            'answer', 'source_documents', 'route' and 'error' (None on success)
+        """
+        forced = _forced_decision(route) if route is not None else None
+        results: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+        pending = []
+        for i, question in enumerate(questions):
+            decision = forced or {'route': ROUTE_RAG, 'params': {}}
+            try:
+                if route is None:
+                    decision = self.classify(question)
+                result = self._answer_routed(question, decision)
+            except Exception as e:
+                results[i] = _batch_error(question, decision['route'], e)
+                continue
+            if result is None:
+                pending.append(i)
+            else:
+                results[i] = {"question": question, **result, "route": decision['route'], "error": None}
+        if not pending:
+            return results
+        
+        try:
+            retrieved = self.vector_store.search_batch([questions[i] for i in pending], k=TOP_K_RESULTS)
+        except Exception:
+            # The batched embedding request failed: retry question by question
+            retrieved = []
+            for i in pending:
+                try:
+                    retrieved.append(self.vector_store.similarity_search(questions[i], k=TOP_K_RESULTS))
+                except Exception as e:
+                    retrieved.append(e)
+        
+        prompts, prompted = [], []
+        for i, documents in zip(pending, retrieved):
+            if isinstance(documents, Exception):
+                results[i] = _batch_error(questions[i], ROUTE_RAG, documents)
+                continue
+            prompts.append(self._format_prompt(questions[i], documents))
+            prompted.append((i, documents))
+        
+        replies = self.llm.batch(prompts, config={"max_concurrency": max_concurrency}, return_exceptions=True)
+        for (i, documents), reply in zip(prompted, replies):
+            if isinstance(reply, Exception):
+                results[i] = _batch_error(questions[i], ROUTE_RAG, reply)
+            else:
+                results[i] = {
+                    "question": questions[i],
+                    "answer": reply.content,
+                    "source_documents": documents,
+                    "route": ROUTE_RAG,
+                    "error": None,
+                }
+        return results
+    
+    def _answer_lookup(self, question: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Voter id or name lookup; None when the indexes find nothing."""
+        if params['field'] == 'voter_id':
+            documents = self.search_by_voter_id(params['value'])
+        else:
+            documents = self._search_indexes(params['field'], params['value'], LIST_RESULT_LIMIT)
+        if not documents:
+            return None
+        return {
+            "answer": format_voter_list(documents, question, len(documents)),
+            "source_documents": documents
+        }
+    
+    def _answer_filter(self, question: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """List voters matching metadata filters, with the exact total."""
+        page = self.filter_voters(
+            params['filters'],
+            birth_year_from=params['birth_year_from'],
+            birth_year_to=params['birth_year_to']
+        )
+        return {
+            "answer": format_voter_list(page["documents"], question, page["total"]),
+            "source_documents": page["documents"]
+        }
+    
+    def _documents_for_rows(self, rows: List[int]) -> List[Document]:
+        """Build LangChain documents for voter table rows."""
+        documents = []
+        for row in rows:
+            doc = build_voter_document(self.voters[row])
+            documents.append(Document(page_content=doc['content'], metadata=doc['metadata']))
+        return documents
+    
+    def _search_indexes(self, field: str, name: str, k: int) -> List[Document]:
+        """Exact index lookup, then phonetic lookup; empty when both miss."""
+        if self.name_index is None:
+            return []
+        rows = self.name_index.search(field, name, limit=k)
+        if not rows:
+            rows = self.phonetic_index.search(field, name, limit=k)
+        return self._documents_for_rows(rows)
+    
     def search_by_name(self, name: str, k: int = 5) -> List[Document]:
         """
         Search for voters by name.
         
+        Tries the exact name index, then the phonetic index, and falls back
+        to vector search only when both miss. Latin-script queries are
+        answered from the indexes alone, without embedding the query.
+        
         Args:
             name: Name to search for
             k: Number of results
@@ -100,13 +500,21 @@ Answer (respond in the same language as the question):"""
         Returns:
             List of matching documents
         """
-        query = f"নাম {name} name {name}"
+        documents = self._search_indexes('name', name, k)
+        if documents or (self.phonetic_index is not None and is_latin(name)):
+            return documents
+        
+        query = _NAME_QUERIES['name'].format(name)
         return self.vector_store.similarity_search(query, k=k)
     
     def search_by_father_name(self, father_name: str, k: int = 5) -> List[Document]:
         """
         Search for voters by father's name.
         
+        Tries the exact name index, then the phonetic index, and falls back
+        to vector search only when both miss. Latin-script queries are
+        answered from the indexes alone, without embedding the query.
+        
         Args:
             father_name: Father's name to search for
             k: Number of results
@@ -114,87 +522,394 @@ Answer (respond in the same language as the question):"""
         Returns:
             List of matching documents
         """
-        query = f"পিতার নাম {father_name} father {father_name}"
+        documents = self._search_indexes('father_name', father_name, k)
+        if documents or (self.phonetic_index is not None and is_latin(father_name)):
+            return documents
+        
+        query = _NAME_QUERIES['father_name'].format(father_name)
         return self.vector_store.similarity_search(query, k=k)
     
-    def filter_by_ward(self, ward: str, k: int = 10) -> List[Document]:
+    async def asearch_by_name(self, name: str, k: int = 5) -> List[Document]:
+        """Async search_by_name()."""
+        return await self._asearch_name_field('name', name, k)
+    
+    async def asearch_by_father_name(self, father_name: str, k: int = 5) -> List[Document]:
+        """Async search_by_father_name()."""
+        return await self._asearch_name_field('father_name', father_name, k)
+    
+    async def _asearch_name_field(self, field: str, name: str, k: int) -> List[Document]:
+        """Index lookup in a worker thread, then an async vector search if it misses."""
+        documents = await asyncio.to_thread(self._search_indexes, field, name, k)
+        if documents or (self.phonetic_index is not None and is_latin(name)):
+            return documents
+        return await self.vector_store.asimilarity_search(_NAME_QUERIES[field].format(name), k=k)
+    
+    def search_batch(self, names: List[str], field: str = "name", k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Search for many voters by name (or father's name) in one call.
+        
+        Each name goes through the exact and phonetic indexes like
+        search_by_name; the misses that need vector search are embedded
+        and ranked together in one batch.
+        
+        Args:
+            names: Names to search for
+            field: "name" or "father_name"
+            k: Number of results per name
+            
+        Returns:
+            One dictionary per name, in input order, with 'query',
+            'documents' and 'error' (None on success)
+        """
+        if field not in _NAME_QUERIES:
+            raise ValueError(f"Cannot search by {field}; choose name or father_name")
+        label = _NAME_QUERIES[field]
+        
+        results = []
+        misses = []
+        for i, name in enumerate(names):
+            result = {"query": name, "documents": [], "error": None}
+            results.append(result)
+            try:
+                result["documents"] = self._search_indexes(field, name, k)
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+                continue
+            if not result["documents"] and not (self.phonetic_index is not None and is_latin(name)):
+                misses.append(i)
+        
+        if misses:
+            try:
+                found = self.vector_store.search_batch([label.format(names[i]) for i in misses], k=k)
+            except Exception as e:
+                for i in misses:
+                    results[i]["error"] = f"{type(e).__name__}: {e}"
+            else:
+                for i, documents in zip(misses, found):
+                    results[i]["documents"] = documents
+        return results
+    
+    def search_by_voter_id(self, voter_id: str) -> List[Document]:
+        """
+        Look up voters by voter id (Bengali or ASCII digits).
+        
+        Args:
+            voter_id: Voter id to look up
+            
+        Returns:
+            List of matching documents (empty when not found or no table is loaded)
+        """
+        if self.name_index is None:
+            return []
+        return self._documents_for_rows(self.name_index.lookup_voter_id(voter_id))
+    
+    def filter_voters(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = LIST_RESULT_LIMIT,
+        cursor: Optional[str] = None,
+        birth_year_from: Optional[int] = None,
+        birth_year_to: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Page through voters matching metadata filters, without vector search.
+        
+        Args:
+            filters: Field -> value (or list of values), all of which must match,
+                e.g. {"ward": "3", "occupation": "কৃষক"}
+            limit: Page size (None returns every match)
+            cursor: next_cursor from the previous page
+            birth_year_from: Earliest birth year, inclusive
+            birth_year_to: Latest birth year, inclusive
+            
+        Returns:
+            Dictionary with 'documents' (ordered by serial), 'total' and
+            'next_cursor' (None on the last page)
+        """
+        if self.metadata_index is None:
+            raise RuntimeError("Metadata filtering needs the voter table; pass voters to VoterRAGChain")
+        
+        page = self.metadata_index.filter(
+            filters, birth_year_from, birth_year_to, limit=limit, cursor=cursor
+        )
+        return {
+            "documents": self._documents_for_rows(page["rows"]),
+            "total": page["total"],
+            "next_cursor": page["next_cursor"]
+        }
+    
+    def filter_by_ward(self, ward: str, k: Optional[int] = None) -> List[Document]:
         """
         Filter voters by ward.
         
         Args:
             ward: Ward number
-            k: Number of results
+            k: Maximum results (None returns every voter in the ward)
             
         Returns:
-            List of matching documents
+            List of matching documents, ordered by serial
         """
+        if self.metadata_index is not None:
+            return self.filter_voters({"ward": ward}, limit=k)["documents"]
+        
         return self.vector_store.similarity_search(
             query=f"ওয়ার্ড {ward} ward {ward}",
-            k=k,
+            k=k or 10,
             filter_dict={"ward": ward}
         )
     
-    def filter_by_occupation(self, occupation: str, k: int = 10) -> List[Document]:
+    def filter_by_occupation(self, occupation: str, k: Optional[int] = None) -> List[Document]:
         """
         Filter voters by occupation.
         
         Args:
             occupation: Occupation to filter by
-            k: Number of results
+            k: Maximum results (None returns every voter with the occupation)
             
         Returns:
-            List of matching documents
+            List of matching documents, ordered by serial
         """
+        if self.metadata_index is not None:
+            return self.filter_voters({"occupation": occupation}, limit=k)["documents"]
+        
         return self.vector_store.similarity_search(
             query=f"পেশা {occupation} occupation {occupation}",
-            k=k,
+            k=k or 10,
             filter_dict={"occupation": occupation}
         )
     
-    def get_statistics_query(self, question: str) -> str:
+    def get_statistics_query(self, question: str, use_llm: bool = False) -> str:
         """
         Handle statistics-based queries.
         
+        Counts come from the aggregate engine over the whole table. With
+        use_llm the computed fact is handed to the LLM to phrase the
+        answer; otherwise it is returned directly. Questions the engine
+        cannot parse go through the regular RAG chain.
+        
         Args:
             question: Statistics question
+            use_llm: Let the LLM word the answer from the computed fact
             
         Returns:
             Answer string
         """
-        # For statistics queries, we'll use the LLM with retrieved context
-        result = self.query(question)
-        return result["answer"]
+        result = self.aggregates.answer(question) if self.aggregates is not None else None
+        if result is None:
+            return self.query(question)["answer"]
+        
+        if not use_llm:
+            return result["answer"]
+        
+        prompt = (
+            f"{SYSTEM_PROMPT}\n\n"
+            f"Exact figures computed from the full voter database:\n{result['fact']}\n\n"
+            f"Question: {question}\n\n"
+            f"Answer (respond in the same language as the question):"
+        )
+        return self.llm.invoke(prompt).content
+
+
+def _with_timings(result: Dict[str, Any], started: float, classified: float) -> Dict[str, Any]:
+    """Attach answer() timings, measured from perf_counter() readings."""
+    finished = time.perf_counter()
+    result["timings"] = {
+        "classify_ms": (classified - started) * 1000,
+        "execute_ms": (finished - classified) * 1000,
+        "total_ms": (finished - started) * 1000,
+    }
+    return result
+
+
+def _forced_decision(route: str) -> Dict[str, Any]:
+    """
+    Route decision for a forced route.
+    
+    Only RAG can be forced: the structured routes need the field, value
+    or filters the router reads from the question.
+    
+    Raises:
+        ValueError: If the route is not ROUTE_RAG
+    """
+    if route != ROUTE_RAG:
+        raise ValueError(f"Only the {ROUTE_RAG!r} route can be forced, not {route!r}")
+    return {'route': ROUTE_RAG, 'params': {}}
+
+
+def _batch_error(question: str, route: str, error: Exception) -> Dict[str, Any]:
+    """query_batch result for a question that failed."""
+    return {
+        "question": question,
+        "answer": None,
+        "source_documents": [],
+        "route": route,
+        "error": f"{type(error).__name__}: {error}",
+    }
+
+
+def format_voter_list(documents: List[Document], question: str, total: int) -> str:
+    """
+    Render voters as an answer, in the language of the question.
+    
+    Args:
+        documents: Voter documents to show
+        question: User's question (decides Bengali or English header)
+        total: Number of voters that matched, which may exceed len(documents)
+        
+    Returns:
+        Answer text in the SYSTEM_PROMPT display format
+    """
+    bengali = any('\u0980' <= char <= '\u09ff' for char in question)
+    if bengali:
+        header = f"মোট {total} জন ভোটার পাওয়া গেছে"
+        if total > len(documents):
+            header += f" (প্রথম {len(documents)} জন দেখানো হলো)"
+    else:
+        header = f"Found {total} voter(s)"
+        if total > len(documents):
+            header += f" (showing the first {len(documents)})"
+    
+    fields = [
+        ("নাম (Name)", "name"),
+        ("পিতার নাম (Father)", "father_name"),
+        ("মাতার নাম (Mother)", "mother_name"),
+        ("পেশা (Occupation)", "occupation"),
+        ("জন্ম তারিখ (DOB)", "date_of_birth"),
+        ("ঠিকানা (Address)", "address"),
+        ("ওয়ার্ড (Ward)", "ward"),
+    ]
+    blocks = [header + ":"]
+    for doc in documents:
+        lines = [f"{label}: {doc.metadata[key]}" for label, key in fields if doc.metadata.get(key)]
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+class AnswerStream:
+    """
+    An answer arriving in chunks.
+    
+    route and source_documents are set on creation. Iterating yields the
+    answer text chunk by chunk (e.g. into st.write_stream); once the
+    stream is exhausted, answer holds the full text and timings the
+    time-to-first-token (first_token_ms) next to the total, and every
+    function in callbacks is called with the stream.
+    """
+    
+    def __init__(
+        self,
+        route: str,
+        source_documents: List[Document],
+        chunks: Iterable[str],
+        started: float,
+        classified: float,
+        cached: Optional[str] = None
+    ):
+        """
+        Initialize the stream.
+        
+        Args:
+            route: Route that produced the answer
+            source_documents: Documents the answer is based on
+            chunks: Answer text chunks, consumed lazily
+            started: perf_counter() when the question came in
+            classified: perf_counter() when routing finished
+            cached: "exact" or "semantic" when served from the answer cache
+        """
+        self.route = route
+        self.source_documents = source_documents
+        self.answer: Optional[str] = None
+        self.timings: Dict[str, float] = {}
+        self.cached = cached
+        self.callbacks: List[Callable[['AnswerStream'], None]] = []
+        self._chunks = chunks
+        self._started = started
+        self._classified = classified
+    
+    def __iter__(self) -> Iterator[str]:
+        parts = []
+        first_token = None
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            if first_token is None:
+                first_token = time.perf_counter()
+            parts.append(chunk)
+            yield chunk
+        finished = time.perf_counter()
+        
+        self.answer = "".join(parts)
+        self.timings = {
+            "classify_ms": (self._classified - self._started) * 1000,
+            "first_token_ms": ((first_token or finished) - self._started) * 1000,
+            "total_ms": (finished - self._started) * 1000,
+        }
+        print(f"Streamed {self.route} answer: first token {self.timings['first_token_ms']:.0f} ms, "
+              f"total {self.timings['total_ms']:.0f} ms")
+        for callback in self.callbacks:
+            callback(self)
+
+
+# Rough per-turn cost of the dict, its keys and the str headers, in bytes
+_TURN_OVERHEAD = 400
 
 
 class ConversationManager:
     """
     Manages conversation history and context for the chatbot.
+    
+    History keeps the last max_turns exchanges; nbytes estimates its
+    memory so a SessionStore can hold many conversations in a fixed budget.
     """
     
-    def __init__(self, rag_chain: VoterRAGChain):
+    def __init__(self, rag_chain: VoterRAGChain, max_turns: Optional[int] = None):
         """
         Initialize conversation manager.
         
         Args:
             rag_chain: VoterRAGChain instance
+            max_turns: Exchanges kept in history (None = unbounded)
         """
         self.rag_chain = rag_chain
-        self.history: List[Dict[str, str]] = []
+        self.max_turns = max_turns
+        self.history: deque = deque(maxlen=max_turns)
+        self.nbytes = 0
+        self.last_used = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _turn_bytes(turn: Dict[str, str]) -> int:
+        return _TURN_OVERHEAD + len(turn["question"].encode('utf-8')) + len(turn["answer"].encode('utf-8'))
     
     def add_to_history(self, question: str, answer: str):
-        """Add Q&A pair to history."""
-        self.history.append({
+        """Add Q&A pair to history, dropping the oldest past max_turns."""
+        turn = {
             "question": question,
             "answer": answer
-        })
+        }
+        with self._lock:
+            if self.max_turns is not None and len(self.history) == self.max_turns:
+                self.nbytes -= self._turn_bytes(self.history[0])
+            self.history.append(turn)
+            self.nbytes += self._turn_bytes(turn)
+            self.last_used = time.monotonic()
+    
+    def trim_history(self, max_bytes: int):
+        """Drop the oldest exchanges until history fits in max_bytes (keeps the last one)."""
+        with self._lock:
+            while len(self.history) > 1 and self.nbytes > max_bytes:
+                self.nbytes -= self._turn_bytes(self.history.popleft())
     
     def get_history(self) -> List[Dict[str, str]]:
         """Get conversation history."""
-        return self.history
+        with self._lock:
+            return list(self.history)
     
     def clear_history(self):
         """Clear conversation history."""
-        self.history = []
+        with self._lock:
+            self.history = deque(maxlen=self.max_turns)
+            self.nbytes = 0
     
     def chat(self, question: str) -> Dict[str, Any]:
         """
@@ -206,23 +921,74 @@ class ConversationManager:
         Returns:
             Response dictionary with answer and sources
         """
-        # Check if this is a follow-up question
-        context_enhanced_question = question
-        
-        if self.history and len(self.history) > 0:
-            # Add context from last exchange if needed
-            last_q = self.history[-1]["question"]
-            if self._is_follow_up(question):
-                context_enhanced_question = f"Previous question: {last_q}\nCurrent question: {question}"
-        
-        # Get response from RAG chain
-        result = self.rag_chain.query(context_enhanced_question)
+        result = self.rag_chain.answer(*self._contextualize(question))
         
         # Add to history
         self.add_to_history(question, result["answer"])
         
         return result
     
+    async def achat(self, question: str) -> Dict[str, Any]:
+        """
+        Async chat(): awaits the chain without blocking the event loop.
+        
+        Args:
+            question: User's question
+            
+        Returns:
+            Response dictionary with answer and sources
+        """
+        result = await self.rag_chain.aanswer(*self._contextualize(question))
+        self.add_to_history(question, result["answer"])
+        return result
+    
+    def chat_stream(self, question: str) -> AnswerStream:
+        """
+        Streaming chat(): sources are available at once, the answer as it is generated.
+        
+        The exchange is added to the history when the stream is exhausted.
+        
+        Args:
+            question: User's question
+            
+        Returns:
+            AnswerStream over the answer text
+        """
+        stream = self.rag_chain.stream(*self._contextualize(question))
+        stream.callbacks.append(lambda done: self.add_to_history(question, done.answer))
+        return stream
+    
+    def _contextualize(self, question: str) -> tuple:
+        """The question to ask and the route to force (None lets the router decide)."""
+        # Check if this is a follow-up question
+        if self._needs_context(question):
+            # Follow-ups need the previous exchange, so they always go to the LLM
+            with self._lock:
+                last_q = self.history[-1]["question"] if self.history else None
+            if last_q is None:
+                return question, None
+            return f"Previous question: {last_q}\nCurrent question: {question}", ROUTE_RAG
+        return question, None
+    
+    def _needs_context(self, question: str) -> bool:
+        """
+        Whether the question only makes sense with the previous exchange.
+        
+        A short follow-up that the router can still answer on its own
+        (e.g. "১ নং ওয়ার্ডে কতজন?") is treated as standalone.
+        """
+        if not self.history or not self._is_follow_up(question):
+            return False
+        
+        decision = self.rag_chain.classify(question)
+        if decision['route'] == ROUTE_RAG:
+            return True
+        if decision['route'] in (ROUTE_AGGREGATE, ROUTE_FILTER):
+            params = decision['params']
+            return not (params['filters'] or params.get('group_by')
+                        or params['birth_year_from'] or params['birth_year_to'])
+        return False
+    
     def _is_follow_up(self, question: str) -> bool:
         """
         Detect if question is a follow-up (uses pronouns or references).
@@ -237,17 +1003,21 @@ class ConversationManager:
         return any(indicator in question_lower for indicator in follow_up_indicators) and len(question.split()) < 5
 
 
-def initialize_rag_system(vector_store: VoterVectorStore) -> tuple[VoterRAGChain, ConversationManager]:
+def initialize_rag_system(
+    vector_store: VoterVectorStore,
+    voters: Optional[VoterTable] = None
+) -> tuple[VoterRAGChain, ConversationManager]:
     """
     Initialize the complete RAG system.
     
     Args:
         vector_store: Initialized VoterVectorStore
+        voters: Loaded voter table for exact lookups (optional)
         
     Returns:
         Tuple of (VoterRAGChain, ConversationManager)
     """
-    rag_chain = VoterRAGChain(vector_store)
+    rag_chain = VoterRAGChain(vector_store, voters)
     conversation_manager = ConversationManager(rag_chain)
     
     return rag_chain, conversation_manager
@@ -267,7 +1037,7 @@ if __name__ == "__main__":
     vector_store = initialize_vector_store(documents)
     
     print("\nInitializing RAG chain...")
-    rag_chain, conversation_manager = initialize_rag_system(vector_store)
+    rag_chain, conversation_manager = initialize_rag_system(vector_store, voters)
     
     # Test queries
     test_questions = [
@@ -0,0 +1,84 @@
+"""
+Fake Chat Model Module
+Deterministic, offline stand-in for ChatOpenAI used by tests, benchmarks and load tests
+"""
+import asyncio
+import re
+import time
+from typing import List, Optional, Any, Iterator
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+# A word and the whitespace after it: the unit streamed as one token
+_TOKEN_RE = re.compile(r'\S+\s*|\s+')
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model that answers with the first voter record of its context.
+
+    Every call can be delayed by a fixed latency (time.sleep for sync
+    calls, asyncio.sleep for async ones) to mimic a remote LLM, so the
+    serving code can be load-tested without network access. Streaming
+    waits `latency` before the first word and `token_delay` between words.
+    """
+
+    latency: float = 0.0
+    token_delay: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-voter-chat"
+
+    @staticmethod
+    def _reply(messages: List[BaseMessage]) -> str:
+        """Quote the first context line of the prompt, if there is one."""
+        prompt = messages[-1].content if messages else ""
+        context = prompt.split("Context from voter database:", 1)[-1].split("Question:", 1)[0]
+        lines = [line.strip() for line in context.splitlines() if line.strip()]
+        if not lines:
+            return "I could not find that in the voter database."
+        return f"Based on the voter records: {lines[0]}"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._reply(messages)))])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._reply(messages)))])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        for i, token in enumerate(_TOKEN_RE.findall(self._reply(messages))):
+            if i and self.token_delay:
+                time.sleep(self.token_delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
@@ -0,0 +1,104 @@
+"""
+Query Router Module
+Rule-based intent classification that keeps simple questions away from the LLM
+"""
+import re
+import unicodedata
+from typing import Dict, Any, Optional
+
+from search.aggregates import AggregateEngine
+from utils.text import normalize_text
+
+
+# Routes, cheapest first
+ROUTE_LOOKUP = "lookup"        # exact voter id / name index lookup
+ROUTE_FILTER = "filter"        # list voters matching metadata filters
+ROUTE_AGGREGATE = "aggregate"  # counts and group-bys
+ROUTE_RAG = "rag"              # retrieval + LLM generation
+
+
+def _pattern(pattern: str) -> re.Pattern:
+    """Compile a pattern in the same normal form as normalize_text output."""
+    return re.compile(unicodedata.normalize('NFC', pattern), re.IGNORECASE)
+
+
+_VOTER_ID_RE = _pattern(r'(?<!\d)(\d{10}|\d{13}|\d{17})(?!\d)')
+_VOTER_ID_HINT_RE = _pattern(r'voter\s*id|nid|\bid\b|ভোটার\s*আইডি|আইডি|এনআইডি|ভোটার\s*নম্বর|ভোটার\s*নং')
+_LIST_RE = _pattern(
+    r'\blist\b|show\s+(?:me\s+)?all|\ball\b|who\s+are|find\s+all'
+    r'|তালিকা|সব|সকল|কারা|দেখাও'
+)
+
+# Name questions: (pattern, field searched). The name is captured as 'name'.
+_NAME_PATTERNS = [
+    (_pattern(r'^(?:who\s+is\s+the\s+)?(?:sons?|daughters?|child(?:ren)?)\s+of\s+(?P<name>.+?)\s*\??$'), 'father_name'),
+    (_pattern(r'^(?P<name>.+?)\s*(?:এর|র)?\s+(?:ছেলে|মেয়ে|সন্তান)(?:রা)?\s*(?:কে|কারা)?\s*[?।]?$'), 'father_name'),
+    (_pattern(r'^(?:who\s+is|who\'s|find|search(?:\s+for)?|show(?:\s+me)?|details\s+(?:of|for)'
+              r'|info(?:rmation)?\s+(?:about|on|of))\s+(?P<name>.+?)\s*\??$'), 'name'),
+    (_pattern(r'^(?P<name>.+?)\s+(?:কে|কি|কী)\s*[?।]?$'), 'name'),
+    (_pattern(r'^(?P<name>.+?)\s*(?:এর|র)?\s+(?:তথ্য|বিস্তারিত)(?:\s+\S+)?\s*[?।]?$'), 'name'),
+]
+_MAX_NAME_WORDS = 5
+# Words that mark a captured "name" as a question about something else
+_NOT_NAME_WORDS = {unicodedata.normalize('NFC', word) for word in (
+    'তার', 'তাদের', 'তিনি', 'সেই', 'ঐ', 'নাম', 'বাবার', 'মায়ের', 'কত', 'কোথায়',
+    'he', 'she', 'his', 'her', 'their', 'they', 'that', 'this', 'it', 'what', 'name',
+)}
+
+
+class QueryRouter:
+    """
+    Classifies questions into lookup, filter, aggregate or full RAG.
+
+    Uses only regular expressions and the aggregate engine's question
+    parser, so classification takes microseconds and never calls a model.
+    """
+
+    def __init__(self, aggregates: Optional[AggregateEngine] = None):
+        """
+        Initialize the router.
+
+        Args:
+            aggregates: Aggregate engine used to recognize statistics and
+                filter questions; without it those routes are disabled
+        """
+        self.aggregates = aggregates
+
+    def classify(self, question: str) -> Dict[str, Any]:
+        """
+        Pick a route for a question.
+
+        Args:
+            question: User's question
+
+        Returns:
+            Dict with 'route' (one of the ROUTE_* constants) and 'params'
+            for that route
+        """
+        text = normalize_text(question).strip()
+
+        voter_id = _VOTER_ID_RE.search(text)
+        if voter_id and (_VOTER_ID_HINT_RE.search(text) or voter_id.group(0) == text):
+            return {'route': ROUTE_LOOKUP, 'params': {'field': 'voter_id', 'value': voter_id.group(1)}}
+
+        if self.aggregates is not None:
+            parsed = self.aggregates.parse(text)
+            if parsed is not None:
+                return {'route': ROUTE_AGGREGATE, 'params': parsed}
+
+            if _LIST_RE.search(text):
+                extracted = self.aggregates.extract_filters(text)
+                if extracted['filters'] or extracted['birth_year_from'] or extracted['birth_year_to']:
+                    return {'route': ROUTE_FILTER, 'params': extracted}
+
+        for pattern, field in _NAME_PATTERNS:
+            match = pattern.match(text)
+            if match:
+                name = match.group('name').strip(' ,.?')
+                words = name.split()
+                if words and len(words) <= _MAX_NAME_WORDS \
+                        and not any(c.isdigit() for c in name) \
+                        and not _NOT_NAME_WORDS.intersection(words):
+                    return {'route': ROUTE_LOOKUP, 'params': {'field': field, 'value': name}}
+
+        return {'route': ROUTE_RAG, 'params': {}}
@@ -0,0 +1,131 @@
+"""
+Session Store Module
+One bounded ConversationManager per chat session
+"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (
+    SESSION_MAX_TURNS,
+    SESSION_IDLE_TTL,
+    SESSION_MAX_SESSIONS,
+    SESSION_MEMORY_BUDGET
+)
+from rag.chain import VoterRAGChain, ConversationManager
+
+
+class SessionStore:
+    """
+    Conversations keyed by session id, sharing one RAG chain.
+
+    Each session keeps at most max_turns exchanges. Sessions idle for
+    longer than idle_ttl are dropped, and past max_sessions or the
+    memory budget the least recently used ones go first, so memory stays
+    flat however many users come and go. Safe to call from concurrent
+    Streamlit script runs.
+    """
+
+    def __init__(
+        self,
+        rag_chain: VoterRAGChain,
+        max_turns: int = SESSION_MAX_TURNS,
+        idle_ttl: Optional[float] = SESSION_IDLE_TTL,
+        max_sessions: int = SESSION_MAX_SESSIONS,
+        max_bytes: int = SESSION_MEMORY_BUDGET
+    ):
+        """
+        Create an empty store.
+
+        Args:
+            rag_chain: Chain every session answers with
+            max_turns: Exchanges kept per session
+            idle_ttl: Seconds without activity before a session is dropped
+                (None = never)
+            max_sessions: Sessions kept at once
+            max_bytes: Estimated history memory across all sessions
+        """
+        self.rag_chain = rag_chain
+        self.max_turns = max_turns
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, ConversationManager]" = OrderedDict()
+        self.expired = 0
+        self.evicted = 0
+
+    def get(self, session_id: str) -> ConversationManager:
+        """
+        The conversation of a session, created on first use.
+
+        Also the point where idle, surplus and over-budget sessions are
+        dropped, so the store needs no background thread.
+
+        Args:
+            session_id: Stable id of the chat session
+
+        Returns:
+            ConversationManager for that session
+        """
+        now = time.monotonic()
+        with self._lock:
+            manager = self._sessions.get(session_id)
+            if manager is None:
+                manager = ConversationManager(self.rag_chain, max_turns=self.max_turns)
+                self._sessions[session_id] = manager
+            else:
+                self._sessions.move_to_end(session_id)
+            manager.last_used = now
+            self._evict(now)
+            return manager
+
+    def _evict(self, now: float):
+        """Drop idle sessions, then the least recently used until within limits."""
+        if self.idle_ttl is not None:
+            for session_id, manager in list(self._sessions.items()):
+                if now - manager.last_used > self.idle_ttl:
+                    del self._sessions[session_id]
+                    self.expired += 1
+
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self.evicted += 1
+
+        total = sum(manager.nbytes for manager in self._sessions.values())
+        while total > self.max_bytes and len(self._sessions) > 1:
+            _, manager = self._sessions.popitem(last=False)
+            total -= manager.nbytes
+            self.evicted += 1
+        if total > self.max_bytes and self._sessions:
+            # A single session larger than the budget keeps only recent turns
+            next(iter(self._sessions.values())).trim_history(self.max_bytes)
+
+    def drop(self, session_id: str):
+        """Forget a session (e.g. when its user clears the chat)."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def nbytes(self) -> int:
+        """Estimated memory held by all conversation histories."""
+        with self._lock:
+            return sum(manager.nbytes for manager in self._sessions.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Session count, memory estimate and eviction counters."""
+        return {
+            'sessions': len(self._sessions),
+            'bytes': self.nbytes(),
+            'max_bytes': self.max_bytes,
+            'expired': self.expired,
+            'evicted': self.evicted,
+        }
+
+    def __len__(self) -> int:
+        return len(self._sessions)
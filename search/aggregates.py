@@ -0,0 +1,416 @@
+"""
+Aggregate Engine Module
+Exact counts and group-bys over the voter table for statistics questions
+"""
+import re
+import unicodedata
+from itertools import combinations, product
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+from utils.text import YEAR_RE, birth_year, normalize_text, normalize_value
+from utils.voter_table import VoterTable
+
+
+# Dimensions that can be filtered and grouped on; all but birth_year are
+# categorical table columns
+CATEGORY_DIMENSIONS = ('ward', 'occupation', 'gender', 'union')
+DIMENSIONS = CATEGORY_DIMENSIONS + ('birth_year',)
+
+# English words for the Bengali occupation and gender values in the dump
+OCCUPATION_ALIASES = {
+    'কৃষক': ('farmer', 'farmers', 'agriculture'),
+    'গৃহিণী': ('housewife', 'housewives', 'homemaker', 'homemakers'),
+    'ব্যবসা': ('business', 'businessman', 'businessmen', 'trader', 'traders'),
+    'ছাত্র/ছাত্রী': ('student', 'students'),
+    'চাকুরী': ('service', 'job', 'jobholder', 'employee', 'employees'),
+    'শ্রমিক': ('worker', 'workers', 'labourer', 'labourers', 'laborer', 'laborers'),
+    'বেকার': ('unemployed',),
+}
+GENDER_ALIASES = {
+    'পুরুষ': ('male', 'males', 'man', 'men'),
+    'মহিলা': ('female', 'females', 'woman', 'women', 'নারী'),
+}
+
+
+def _pattern(pattern: str) -> re.Pattern:
+    """Compile a pattern in the same normal form as normalize_text output."""
+    return re.compile(unicodedata.normalize('NFC', pattern), re.IGNORECASE)
+
+
+_WARD_RE = _pattern(
+    r'(\d+)\s*(?:নং|নম্বর|no\.?)?\s*ওয়ার্ড'
+    r'|ওয়ার্ড[\s:-]*(?:নং|নম্বর|no\.?)?[\s:-]*(\d+)'
+    r'|\bward[\s:-]*(?:no\.?|number|#)?[\s:-]*(\d+)'
+)
+# Any mention of a ward, with or without a number
+_WARD_WORD_RE = _pattern(r'\bwards?\b|ওয়ার্ড')
+_COUNT_RE = _pattern(
+    r'\b(?:how many|count(?:s|ing)?|number of|totals?|statistic(?:s|al)?|breakdown|distribution)\b'
+    r'|কতজন|কত জন|কতো জন|সংখ্যা|মোট|পরিসংখ্যান'
+)
+# Who is being counted; "how many" alone can be about anything
+_SUBJECT_RE = _pattern(
+    r'\b(?:voters?|people|persons?|population|residents?)\b'
+    r'|ভোটার|লোক|মানুষ'
+)
+_GROUP_RE = {
+    'ward': _pattern(r'(?:by|per|each|every|all)\s+wards?|ward[- ]?wise|(?:প্রতিটি|প্রত্যেক|সব)\s*ওয়ার্ড|ওয়ার্ড\s*(?:অনুযায়ী|ভিত্তিক|ভিত্তিতে|ওয়ারী)'),
+    'occupation': _pattern(r'(?:by|per|each|every)\s+(?:occupation|profession)s?|(?:প্রতিটি|প্রত্যেক|সব)\s*পেশা|পেশা\s*(?:অনুযায়ী|ভিত্তিক|ভিত্তিতে)'),
+    'gender': _pattern(r'(?:by|per)\s+(?:gender|sex)|লিঙ্গ\s*(?:অনুযায়ী|ভিত্তিক|ভিত্তিতে)|নারী\s*(?:ও|এবং)\s*পুরুষ|পুরুষ\s*(?:ও|এবং)\s*(?:নারী|মহিলা)'),
+    'union': _pattern(r'(?:by|per|each|every)\s+unions?|(?:প্রতিটি|প্রত্যেক|সব)\s*ইউনিয়ন|ইউনিয়ন\s*(?:অনুযায়ী|ভিত্তিক|ভিত্তিতে)'),
+    'birth_year': _pattern(r'(?:by|per)\s+(?:birth\s*)?year|জন্ম\s*সাল\s*(?:অনুযায়ী|ভিত্তিক|ভিত্তিতে)'),
+}
+_AFTER_RE = _pattern(r'after|since|later than|পরে|পর থেকে')
+_BEFORE_RE = _pattern(r'before|earlier than|আগে|পূর্বে')
+
+
+def _is_bengali(text: str) -> bool:
+    return any('ঀ' <= char <= '৿' for char in text)
+
+
+class AggregateEngine:
+    """
+    Precomputed counts over ward, occupation, gender, union and birth year.
+
+    Single-dimension totals and every two-dimension cross-tab are built
+    once at load time, so the common "how many voters in ward 1" style
+    questions are dictionary lookups. Queries touching three or more
+    dimensions scan a compact cube of distinct value combinations, which
+    is far smaller than the table.
+    """
+
+    def __init__(self, table: VoterTable):
+        """
+        Build the aggregates from a voter table.
+
+        Args:
+            table: Loaded voter table
+        """
+        self.total = len(table)
+        self.categories: Dict[str, List[Optional[str]]] = {
+            dimension: list(table.categories(dimension)) for dimension in CATEGORY_DIMENSIONS
+        }
+        self._keys: Dict[str, Dict[str, int]] = {
+            dimension: {
+                normalize_value(value): code
+                for code, value in enumerate(values) if value is not None
+            }
+            for dimension, values in self.categories.items()
+        }
+
+        columns = [table.codes(dimension) for dimension in CATEGORY_DIMENSIONS]
+        years = [birth_year(value) for value in table.column('date_of_birth')]
+        cube: Dict[Tuple[int, ...], int] = {}
+        for key in zip(*columns, years):
+            cube[key] = cube.get(key, 0) + 1
+        self._cube = cube
+
+        self._marginals: Dict[str, Dict[int, int]] = {dimension: {} for dimension in DIMENSIONS}
+        self._pairs: Dict[Tuple[str, str], Dict[Tuple[int, int], int]] = {
+            pair: {} for pair in combinations(DIMENSIONS, 2)
+        }
+        for key, count in cube.items():
+            for position, dimension in enumerate(DIMENSIONS):
+                marginal = self._marginals[dimension]
+                marginal[key[position]] = marginal.get(key[position], 0) + count
+            for (i, a), (j, b) in combinations(enumerate(DIMENSIONS), 2):
+                tab = self._pairs[(a, b)]
+                cell = (key[i], key[j])
+                tab[cell] = tab.get(cell, 0) + count
+
+    # ------------------------------------------------------------------
+    # Filters
+
+    def _codes(self, dimension: str, values: Any) -> List[int]:
+        """Codes matching one filter value or a list of values."""
+        if isinstance(values, (str, int)):
+            values = [values]
+        keys = self._keys[dimension]
+        return [keys[normalize_value(str(v))] for v in values if normalize_value(str(v)) in keys]
+
+    def _resolve(
+        self,
+        filters: Dict[str, Any],
+        birth_year_from: Optional[int],
+        birth_year_to: Optional[int]
+    ) -> Dict[str, List[int]]:
+        """Turn filter values into per-dimension lists of codes."""
+        resolved = {}
+        for dimension, values in filters.items():
+            if values is None:
+                continue
+            if dimension not in CATEGORY_DIMENSIONS:
+                raise ValueError(f"Unknown dimension: {dimension}")
+            resolved[dimension] = self._codes(dimension, values)
+
+        if birth_year_from is not None or birth_year_to is not None:
+            low = birth_year_from if birth_year_from is not None else 1
+            high = birth_year_to if birth_year_to is not None else 9999
+            resolved['birth_year'] = [
+                year for year in self._marginals['birth_year'] if year and low <= year <= high
+            ]
+        return resolved
+
+    def _pair(self, a: str, b: str) -> Tuple[Dict[Tuple[int, int], int], bool]:
+        """Cross-tab for two dimensions and whether its cells are (b, a)."""
+        if (a, b) in self._pairs:
+            return self._pairs[(a, b)], False
+        return self._pairs[(b, a)], True
+
+    def _scan(self, resolved: Dict[str, List[int]]) -> Iterable[Tuple[Tuple[int, ...], int]]:
+        """Cube cells that pass every filter."""
+        checks = [(DIMENSIONS.index(d), set(codes)) for d, codes in resolved.items()]
+        for key, count in self._cube.items():
+            if all(key[position] in allowed for position, allowed in checks):
+                yield key, count
+
+    # ------------------------------------------------------------------
+    # Queries
+
+    def count(
+        self,
+        birth_year_from: Optional[int] = None,
+        birth_year_to: Optional[int] = None,
+        **filters
+    ) -> int:
+        """
+        Number of voters matching all filters.
+
+        Args:
+            birth_year_from: Earliest birth year, inclusive
+            birth_year_to: Latest birth year, inclusive
+            **filters: ward/occupation/gender/union equal to a value or any of a list
+
+        Returns:
+            Exact voter count
+        """
+        resolved = self._resolve(filters, birth_year_from, birth_year_to)
+        if not resolved:
+            return self.total
+
+        dimensions = list(resolved)
+        if len(dimensions) == 1:
+            marginal = self._marginals[dimensions[0]]
+            return sum(marginal.get(code, 0) for code in resolved[dimensions[0]])
+        if len(dimensions) == 2:
+            tab, swapped = self._pair(*dimensions)
+            cells = product(resolved[dimensions[0]], resolved[dimensions[1]])
+            return sum(tab.get(cell[::-1] if swapped else cell, 0) for cell in cells)
+        return sum(count for _, count in self._scan(resolved))
+
+    def group_by(
+        self,
+        dimension: str,
+        birth_year_from: Optional[int] = None,
+        birth_year_to: Optional[int] = None,
+        **filters
+    ) -> Dict[Any, int]:
+        """
+        Voter counts per value of one dimension, most frequent first.
+
+        Args:
+            dimension: Dimension to group on (see DIMENSIONS)
+            birth_year_from: Earliest birth year, inclusive
+            birth_year_to: Latest birth year, inclusive
+            **filters: Same filters as count()
+
+        Returns:
+            Mapping of value (birth years as ints) to count; missing values omitted
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {dimension}")
+        resolved = self._resolve(filters, birth_year_from, birth_year_to)
+
+        groups: Dict[int, int] = {}
+        if not resolved:
+            groups = dict(self._marginals[dimension])
+        elif len(resolved) == 1 and dimension not in resolved:
+            other, codes = next(iter(resolved.items()))
+            tab, swapped = self._pair(dimension, other)
+            allowed = set(codes)
+            for cell, count in tab.items():
+                mine, theirs = (cell[1], cell[0]) if swapped else cell
+                if theirs in allowed:
+                    groups[mine] = groups.get(mine, 0) + count
+        else:
+            position = DIMENSIONS.index(dimension)
+            for key, count in self._scan(resolved):
+                groups[key[position]] = groups.get(key[position], 0) + count
+
+        if dimension == 'birth_year':
+            labelled = {code: count for code, count in groups.items() if code}
+        else:
+            values = self.categories[dimension]
+            labelled = {values[code]: count for code, count in groups.items() if code}
+        return dict(sorted(labelled.items(), key=lambda item: -item[1]))
+
+    # ------------------------------------------------------------------
+    # Natural-language questions
+
+    def parse(self, question: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract filters and grouping from a statistics question.
+
+        Understands Bengali and English phrasing of ward numbers, known
+        occupations, genders and unions, birth-year ranges and "by ward"
+        style groupings. A counting word alone is not enough: the question
+        must also name voters, a filter or a grouping, so "how many
+        children does X have" is left to retrieval. So is a question that
+        mentions a ward without a ward number it can read, rather than
+        being answered with the count over every ward.
+
+        Args:
+            question: User's question
+
+        Returns:
+            Dict with 'filters', 'birth_year_from', 'birth_year_to' and
+            'group_by', or None when it is not a statistics question
+        """
+        text = normalize_text(question)
+        group_by = next((d for d, pattern in _GROUP_RE.items() if pattern.search(text)), None)
+        if group_by is None and not _COUNT_RE.search(text):
+            return None
+
+        parsed = self.extract_filters(text, group_by)
+        if group_by != 'ward' and 'ward' not in parsed['filters'] and _WARD_WORD_RE.search(text):
+            return None
+        if group_by is None and not parsed['filters'] \
+                and parsed['birth_year_from'] is None and parsed['birth_year_to'] is None \
+                and not _SUBJECT_RE.search(text):
+            return None
+        parsed['group_by'] = group_by
+        return parsed
+
+    def extract_filters(self, question: str, group_by: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Pull ward, occupation, gender, union and birth-year filters out of a question.
+
+        Args:
+            question: User's question
+            group_by: Dimension being grouped on; its values are not treated as filters
+
+        Returns:
+            Dict with 'filters' (dimension -> value), 'birth_year_from' and 'birth_year_to'
+        """
+        text = normalize_text(question)
+        filters: Dict[str, str] = {}
+        ward = _WARD_RE.search(text)
+        if ward:
+            filters['ward'] = next(number for number in ward.groups() if number)
+
+        for dimension, aliases in (('occupation', OCCUPATION_ALIASES), ('gender', GENDER_ALIASES)):
+            if dimension == group_by:
+                continue
+            value = self._match_category(dimension, text, aliases)
+            if value is not None:
+                filters[dimension] = value
+
+        if group_by != 'union':
+            value = self._match_category('union', text, {})
+            if value is not None:
+                filters['union'] = value
+
+        year_from = year_to = None
+        years = [int(year) for year in YEAR_RE.findall(text)]
+        if len(years) >= 2:
+            year_from, year_to = min(years[:2]), max(years[:2])
+        elif len(years) == 1:
+            if _AFTER_RE.search(text):
+                year_from = years[0] + 1
+            elif _BEFORE_RE.search(text):
+                year_to = years[0] - 1
+            else:
+                year_from = year_to = years[0]
+
+        return {
+            'filters': filters,
+            'birth_year_from': year_from,
+            'birth_year_to': year_to,
+        }
+
+    def _match_category(
+        self,
+        dimension: str,
+        text: str,
+        aliases: Dict[str, Tuple[str, ...]]
+    ) -> Optional[str]:
+        """First known value of a dimension mentioned in the text."""
+        for value in self.categories[dimension]:
+            if value is None:
+                continue
+            names = [normalize_text(part) for part in value.split('/')]
+            names.extend(aliases.get(value, ()))
+            for name in names:
+                if _is_bengali(name):
+                    if name in text:
+                        return value
+                elif re.search(rf'\b{re.escape(name)}\b', text):
+                    return value
+        return None
+
+    def answer(self, question: str, parsed: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Answer a statistics question from the aggregates.
+
+        Args:
+            question: User's question
+            parsed: Result of parse() if the caller already has it
+
+        Returns:
+            Dict with 'answer' (ready to show), 'fact' (compact English
+            summary to hand to an LLM), 'count' and 'groups', or None if
+            the question is not a statistics question
+        """
+        if parsed is None:
+            parsed = self.parse(question)
+        if parsed is None:
+            return None
+
+        filters = parsed['filters']
+        year_from, year_to = parsed['birth_year_from'], parsed['birth_year_to']
+        total = self.count(year_from, year_to, **filters)
+        groups = None
+        if parsed['group_by']:
+            groups = self.group_by(parsed['group_by'], year_from, year_to, **filters)
+
+        conditions = [f"{dimension}={value}" for dimension, value in filters.items()]
+        if year_from is not None or year_to is not None:
+            conditions.append(f"birth_year={year_from or ''}..{year_to or ''}")
+        scope = ', '.join(conditions) or 'all voters'
+        fact = f"Voters matching {scope}: {total}"
+        if groups is not None:
+            fact += f"; by {parsed['group_by']}: " + ', '.join(f"{k}: {v}" for k, v in groups.items())
+
+        return {
+            'answer': self._format(question, filters, year_from, year_to, total, parsed['group_by'], groups),
+            'fact': fact,
+            'count': total,
+            'groups': groups,
+            'parsed': parsed,
+        }
+
+    @staticmethod
+    def _format(question, filters, year_from, year_to, total, group_by, groups) -> str:
+        """Human-readable answer in the language of the question."""
+        if _is_bengali(question):
+            labels = {'ward': 'ওয়ার্ড', 'occupation': 'পেশা', 'gender': 'লিঙ্গ',
+                      'union': 'ইউনিয়ন', 'birth_year': 'জন্ম সাল'}
+            parts = [f"{labels[d]}: {v}" for d, v in filters.items()]
+            if year_from is not None or year_to is not None:
+                parts.append(f"জন্ম সাল: {year_from or ''}–{year_to or ''}")
+            scope = f" ({', '.join(parts)})" if parts else ''
+            lines = [f"মোট ভোটার{scope}: {total} জন"]
+            if groups is not None:
+                lines.append(f"{labels[group_by]} অনুযায়ী:")
+                lines.extend(f"- {value}: {count} জন" for value, count in groups.items())
+            return '\n'.join(lines)
+
+        parts = [f"{d.replace('_', ' ')} {v}" for d, v in filters.items()]
+        if year_from is not None or year_to is not None:
+            parts.append(f"born {year_from or ''}–{year_to or ''}")
+        scope = f" ({', '.join(parts)})" if parts else ''
+        lines = [f"Total voters{scope}: {total}"]
+        if groups is not None:
+            lines.append(f"By {group_by.replace('_', ' ')}:")
+            lines.extend(f"- {value}: {count}" for value, count in groups.items())
+        return '\n'.join(lines)
@@ -0,0 +1,211 @@
+"""
+BM25 Index Module
+Compact sparse keyword index over voter documents
+"""
+import math
+import os
+import pickle
+from array import array
+from collections import Counter
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+from utils.text import tokenize
+
+
+INDEX_VERSION = 2
+
+
+class BM25Index:
+    """
+    Okapi BM25 over tokenized document content.
+
+    Postings are stored CSR-style: one flat array of document numbers and
+    one of precomputed BM25 term weights, sliced per term through an
+    offsets array, so the whole index is a handful of typed arrays that
+    pickle compactly and a query only has to add weights up (vectorized
+    through NumPy views of the same buffers).
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, max_df_ratio: float = 0.5):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+            max_df_ratio: Query terms found in more than this share of
+                documents (field labels such as "নাম") are skipped
+        """
+        self.k1 = k1
+        self.b = b
+        self.max_df_ratio = max_df_ratio
+        self.ids: List[str] = []
+        self.terms: Dict[str, int] = {}
+        self.offsets = array('I', [0])
+        self.postings = array('I')
+        self.weights = array('f')
+        self._views: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def build(cls, documents: Iterable[Dict[str, Any]], **kwargs) -> 'BM25Index':
+        """
+        Index documents.
+
+        Args:
+            documents: Documents with 'id' and 'content'
+            **kwargs: BM25 parameters (see __init__)
+
+        Returns:
+            Built index
+        """
+        index = cls(**kwargs)
+        term_postings: Dict[str, Tuple[array, array]] = {}
+        lengths = array('I')
+
+        for number, doc in enumerate(documents):
+            index.ids.append(doc['id'])
+            tokens = tokenize(doc['content'])
+            lengths.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                entry = term_postings.get(token)
+                if entry is None:
+                    entry = term_postings[token] = (array('I'), array('H'))
+                entry[0].append(number)
+                entry[1].append(count)
+
+        k1, b = index.k1, index.b
+        average = (sum(lengths) / len(lengths)) if lengths else 1.0
+        norms = [k1 * (1.0 - b + b * length / average) for length in lengths]
+        n = len(index.ids)
+        for term, (docs, frequencies) in term_postings.items():
+            index.terms[term] = len(index.terms)
+            df = len(docs)
+            idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+            index.postings.extend(docs)
+            index.weights.extend(
+                idf * tf * (k1 + 1.0) / (tf + norms[doc]) for doc, tf in zip(docs, frequencies)
+            )
+            index.offsets.append(len(index.postings))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Top documents for a query.
+
+        Args:
+            query: Free text query
+            k: Number of results
+
+        Returns:
+            List of (document id, score), best first
+        """
+        return [(self.ids[doc], score) for doc, score in self.top(query, k)]
+
+    def top(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Like search(), but returns document numbers (build order) instead of ids.
+        """
+        if not self.ids:
+            return []
+
+        if self._views is None:
+            # Zero-copy views; the index is never appended to after build/load
+            self._views = (
+                np.frombuffer(self.postings, dtype=np.uint32),
+                np.frombuffer(self.weights, dtype=np.float32),
+            )
+        postings, weights = self._views
+
+        max_df = max(1, int(len(self.ids) * self.max_df_ratio))
+        scores = None
+        for token in set(tokenize(query)):
+            term = self.terms.get(token)
+            if term is None:
+                continue
+            start, end = self.offsets[term], self.offsets[term + 1]
+            if end - start > max_df:
+                continue
+            if scores is None:
+                scores = np.zeros(len(self.ids), dtype=np.float32)
+            # A document appears at most once per term, so fancy-index += is safe
+            scores[postings[start:end]] += weights[start:end]
+
+        if scores is None:
+            return []
+        matched = np.flatnonzero(scores)
+        if len(matched) > k:
+            matched = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        matched = matched[np.argsort(-scores[matched], kind='stable')]
+        return [(int(doc), float(scores[doc])) for doc in matched]
+
+    def nbytes(self) -> int:
+        """Approximate size of the posting arrays."""
+        return sum(
+            data.itemsize * len(data)
+            for data in (self.offsets, self.postings, self.weights)
+        )
+
+    def save(self, path: str):
+        """Atomically write the index to a file."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        state = {
+            'version': INDEX_VERSION,
+            'params': (self.k1, self.b, self.max_df_ratio),
+            'ids': self.ids,
+            'terms': list(self.terms),
+            'offsets': self.offsets,
+            'postings': self.postings,
+            'weights': self.weights,
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['BM25Index']:
+        """
+        Read an index written by save().
+
+        Returns:
+            The index, or None if the file is missing or from another version
+        """
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(state, dict) or state.get('version') != INDEX_VERSION:
+            return None
+
+        k1, b, max_df_ratio = state['params']
+        index = cls(k1=k1, b=b, max_df_ratio=max_df_ratio)
+        index.ids = state['ids']
+        index.terms = {term: i for i, term in enumerate(state['terms'])}
+        index.offsets = state['offsets']
+        index.postings = state['postings']
+        index.weights = state['weights']
+        return index
+
+
+def reciprocal_rank_fusion(rankings: Iterable[List[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Merge ranked id lists with reciprocal-rank fusion.
+
+    Args:
+        rankings: Lists of ids, best first
+        k: RRF damping constant
+
+    Returns:
+        List of (id, fused score), best first
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank + 1)
+    return sorted(scores.items(), key=lambda item: -item[1])
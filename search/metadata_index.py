@@ -0,0 +1,174 @@
+"""
+Metadata Index Module
+Exact, non-vector filtering of voters by ward, occupation and other fields
+"""
+from array import array
+from bisect import bisect_right
+from typing import List, Dict, Any, Iterator, Optional
+
+from utils.text import birth_year, normalize_digits, normalize_value
+from utils.voter_table import VoterTable
+
+
+def _serial_key(serial: Optional[str], row: int):
+    """Sort key ordering voters by numeric serial, then by file position."""
+    if serial:
+        serial = normalize_digits(serial).strip()
+        if serial.isdigit():
+            return (0, int(serial), row)
+    return (1, 0, row)
+
+
+class MetadataIndex:
+    """
+    Posting lists for every categorical column and for birth year.
+
+    Rows are numbered by their position in serial order, so every
+    posting list, and every filter result, is already sorted by serial.
+    Filters are conjunctive across fields; a field given several values
+    matches any of them.
+    """
+
+    def __init__(self, table: VoterTable):
+        """
+        Build the index from a voter table.
+
+        Args:
+            table: Loaded voter table
+        """
+        self.table = table
+        serials = table.column('serial')
+        order = sorted(range(len(table)), key=lambda row: _serial_key(serials[row], row))
+        # rank -> table row
+        self._order = array('I', order)
+
+        self._postings: Dict[str, Dict[str, array]] = {}
+        for column in table.columns:
+            if not table.is_categorical(column):
+                continue
+            codes = table.codes(column)
+            by_code: Dict[int, array] = {}
+            for rank, row in enumerate(order):
+                code = codes[row]
+                if code:
+                    by_code.setdefault(code, array('I')).append(rank)
+            categories = table.categories(column)
+            postings: Dict[str, array] = {}
+            for code, ranks in by_code.items():
+                key = normalize_value(categories[code])
+                if key in postings:
+                    # Two spellings of one value ('01' and '1'): merge them
+                    ranks = array('I', sorted(postings[key] + ranks))
+                postings[key] = ranks
+            self._postings[column] = postings
+
+        years = [birth_year(value) for value in table.column('date_of_birth')]
+        self._years: Dict[int, array] = {}
+        for rank, row in enumerate(order):
+            if years[row]:
+                self._years.setdefault(years[row], array('I')).append(rank)
+
+    @property
+    def fields(self) -> List[str]:
+        """Fields that can be filtered on."""
+        return list(self._postings) + ['birth_year']
+
+    def values(self, field: str) -> List[str]:
+        """Distinct normalized values of a field."""
+        if field == 'birth_year':
+            return [str(year) for year in sorted(self._years)]
+        return list(self._postings[field])
+
+    def _matching_ranks(
+        self,
+        filters: Dict[str, Any],
+        birth_year_from: Optional[int],
+        birth_year_to: Optional[int]
+    ) -> List[int]:
+        """Ranks (positions in serial order) of rows passing every filter."""
+        candidates = []
+        for field, values in filters.items():
+            if values is None:
+                continue
+            if field not in self._postings:
+                raise ValueError(f"Cannot filter on {field}; choose from {self.fields}")
+            if isinstance(values, (str, int)):
+                values = [values]
+            postings = self._postings[field]
+            lists = [postings[key] for key in {normalize_value(str(v)) for v in values} if key in postings]
+            candidates.append(lists)
+
+        if birth_year_from is not None or birth_year_to is not None:
+            low = birth_year_from if birth_year_from is not None else 1
+            high = birth_year_to if birth_year_to is not None else 9999
+            candidates.append([ranks for year, ranks in self._years.items() if low <= year <= high])
+
+        if not candidates:
+            return range(len(self._order))
+
+        merged = []
+        for lists in candidates:
+            if not lists:
+                return []
+            merged.append(lists[0] if len(lists) == 1 else sorted(set().union(*lists)))
+
+        merged.sort(key=len)
+        result = merged[0]
+        for other in merged[1:]:
+            allowed = set(other)
+            result = [rank for rank in result if rank in allowed]
+            if not result:
+                break
+        return result
+
+    def filter(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        birth_year_from: Optional[int] = None,
+        birth_year_to: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        One page of voters matching all filters, in serial order.
+
+        Args:
+            filters: Field -> value (or list of values), e.g. {'ward': '3', 'occupation': 'কৃষক'}
+            birth_year_from: Earliest birth year, inclusive
+            birth_year_to: Latest birth year, inclusive
+            limit: Page size (None returns every match)
+            cursor: next_cursor of the previous page
+
+        Returns:
+            Dict with 'rows' (table row numbers), 'total' (all matches)
+            and 'next_cursor' (None on the last page)
+        """
+        ranks = self._matching_ranks(filters or {}, birth_year_from, birth_year_to)
+        start = bisect_right(ranks, int(cursor)) if cursor is not None else 0
+        end = len(ranks) if limit is None else min(start + limit, len(ranks))
+        page = ranks[start:end]
+        return {
+            'rows': [self._order[rank] for rank in page],
+            'total': len(ranks),
+            'next_cursor': str(page[-1]) if page and end < len(ranks) else None,
+        }
+
+    def iter_filter(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        birth_year_from: Optional[int] = None,
+        birth_year_to: Optional[int] = None
+    ) -> Iterator[int]:
+        """Every matching table row, in serial order."""
+        order = self._order
+        for rank in self._matching_ranks(filters or {}, birth_year_from, birth_year_to):
+            yield order[rank]
+
+    def count(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        birth_year_from: Optional[int] = None,
+        birth_year_to: Optional[int] = None
+    ) -> int:
+        """Number of voters matching all filters."""
+        return len(self._matching_ranks(filters or {}, birth_year_from, birth_year_to))
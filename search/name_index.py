@@ -0,0 +1,139 @@
+"""
+Name Index Module
+Exact-match inverted index over voter names, father's names and voter ids
+"""
+from array import array
+from bisect import bisect_left
+from typing import List, Dict, Iterable, Optional
+
+from utils.text import normalize_digits, normalize_name
+from utils.voter_table import VoterTable
+
+
+# Indexed fields and the columns they are read from, best source first
+NAME_FIELDS = {
+    'name': ('name_normalized', 'name'),
+    'father_name': ('father_name_normalized', 'father_name'),
+}
+
+
+def _add(postings: Dict[str, array], key: str, row: int):
+    rows = postings.get(key)
+    if rows is None:
+        rows = postings[key] = array('I')
+    if not rows or rows[-1] != row:
+        rows.append(row)
+
+
+class NameIndex:
+    """
+    In-memory inverted index for exact voter lookups.
+
+    Each name field is indexed twice: by its full normalized form and by
+    each of its words. Voter ids are indexed in both digit scripts.
+    Postings hold table row numbers in file order.
+    """
+
+    def __init__(self, table: VoterTable):
+        """
+        Build the index from a voter table.
+
+        Args:
+            table: Loaded voter table
+        """
+        self.table = table
+        self._full: Dict[str, Dict[str, array]] = {field: {} for field in NAME_FIELDS}
+        self._words: Dict[str, Dict[str, array]] = {field: {} for field in NAME_FIELDS}
+        self._voter_ids: Dict[str, array] = {}
+
+        for field, sources in NAME_FIELDS.items():
+            full, words = self._full[field], self._words[field]
+            columns = [table.column(source) for source in sources]
+            for row, values in enumerate(zip(*columns)):
+                # Index every distinct spelling the dump provides
+                for key in dict.fromkeys(normalize_name(v) for v in values if v):
+                    if not key:
+                        continue
+                    _add(full, key, row)
+                    for word in key.split(' '):
+                        _add(words, word, row)
+
+        for source in ('voter_id', 'voter_id_bn'):
+            for row, value in enumerate(table.column(source)):
+                if value:
+                    _add(self._voter_ids, normalize_digits(value).strip(), row)
+
+        self._sorted_full = {field: sorted(keys) for field, keys in self._full.items()}
+        self._sorted_words = {field: sorted(keys) for field, keys in self._words.items()}
+
+    def lookup(self, field: str, name: str) -> List[int]:
+        """Rows whose whole normalized name equals the query."""
+        return list(self._full[field].get(normalize_name(name), ()))
+
+    def lookup_voter_id(self, voter_id: str) -> List[int]:
+        """Rows with this voter id (Bengali or ASCII digits)."""
+        return list(self._voter_ids.get(normalize_digits(voter_id).strip(), ()))
+
+    def prefix_search(self, field: str, prefix: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Rows whose full name, or any word of it, starts with the prefix.
+
+        Args:
+            field: 'name' or 'father_name'
+            prefix: Typed prefix
+            limit: Maximum rows to return
+
+        Returns:
+            Matching row numbers in file order
+        """
+        prefix = normalize_name(prefix)
+        if not prefix:
+            return []
+
+        rows = set()
+        for keys, postings in (
+            (self._sorted_full[field], self._full[field]),
+            (self._sorted_words[field], self._words[field]),
+        ):
+            for key in self._keys_with_prefix(keys, prefix):
+                rows.update(postings[key])
+        return sorted(rows)[:limit]
+
+    @staticmethod
+    def _keys_with_prefix(keys: List[str], prefix: str) -> Iterable[str]:
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            yield keys[i]
+            i += 1
+
+    def search(self, field: str, name: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Best-effort exact lookup: whole name, then all words, then prefix.
+
+        Args:
+            field: 'name' or 'father_name'
+            name: Name as typed by the user
+            limit: Maximum rows to return
+
+        Returns:
+            Matching row numbers in file order (empty on a miss)
+        """
+        key = normalize_name(name)
+        if not key:
+            return []
+
+        rows = self._full[field].get(key)
+        if rows:
+            return list(rows[:limit] if limit else rows)
+
+        # Every word of the query appears in the name, in any order
+        postings = [self._words[field].get(word) for word in key.split(' ')]
+        if all(postings):
+            postings.sort(key=len)
+            matches = set(postings[0])
+            for other in postings[1:]:
+                matches.intersection_update(other)
+            if matches:
+                return sorted(matches)[:limit]
+
+        return self.prefix_search(field, key, limit)
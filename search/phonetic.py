@@ -0,0 +1,182 @@
+"""
+Phonetic Index Module
+Fuzzy, script-independent name lookup for English-typed Bengali names
+"""
+from array import array
+from typing import List, Dict, Optional, Tuple
+
+from utils.text import phonetic_key
+from utils.voter_table import VoterTable
+
+
+# Indexed fields and the columns their keys are built from; the dump's
+# romanized phonetic columns come first, the Bengali spellings are
+# transliterated as a fallback and to catch alternative romanizations
+PHONETIC_FIELDS = {
+    'name': ('phonetic_name', 'name'),
+    'father_name': ('phonetic_father_name', 'father_name'),
+}
+
+
+def max_distance(word: str) -> int:
+    """Edits tolerated for a query word: more for longer words."""
+    if len(word) <= 2:
+        return 0
+    if len(word) <= 5:
+        return 1
+    return 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance between two strings, giving up past a limit.
+
+    Returns:
+        The distance, or limit + 1 if it exceeds the limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        best = i
+        for j, char_b in enumerate(b, 1):
+            cost = previous[j - 1] + (char_a != char_b)
+            cost = min(cost, previous[j] + 1, current[j - 1] + 1)
+            current.append(cost)
+            best = min(best, cost)
+        if best > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _trigrams(word: str) -> List[str]:
+    padded = f"#{word}#"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class PhoneticIndex:
+    """
+    Word-level index over phonetic keys of voter names.
+
+    Each name is reduced to phonetic words (see utils.text.phonetic_key).
+    Query words find candidate index words through shared character
+    trigrams and are then ranked by edit distance; a voter matches when
+    every query word matches one of their name words.
+    """
+
+    def __init__(self, table: VoterTable):
+        """
+        Build the index from a voter table.
+
+        Args:
+            table: Loaded voter table
+        """
+        self.table = table
+        self._postings: Dict[str, Dict[str, array]] = {}
+        self._grams: Dict[str, Dict[str, List[str]]] = {}
+
+        for field, sources in PHONETIC_FIELDS.items():
+            postings: Dict[str, array] = {}
+            columns = [table.column(source) for source in sources]
+            for row, values in enumerate(zip(*columns)):
+                words = set()
+                for value in values:
+                    if value:
+                        words.update(phonetic_key(value).split(' '))
+                words.discard('')
+                for word in words:
+                    rows = postings.get(word)
+                    if rows is None:
+                        rows = postings[word] = array('I')
+                    rows.append(row)
+
+            grams: Dict[str, List[str]] = {}
+            for word in postings:
+                for gram in set(_trigrams(word)):
+                    grams.setdefault(gram, []).append(word)
+
+            self._postings[field] = postings
+            self._grams[field] = grams
+
+    def match_word(self, field: str, word: str) -> Dict[str, int]:
+        """
+        Index words that sound like a query word.
+
+        Args:
+            field: 'name' or 'father_name'
+            word: One phonetic query word
+
+        Returns:
+            Mapping of matching index word to its edit distance
+        """
+        postings = self._postings[field]
+        if word in postings:
+            return {word: 0}
+
+        limit = max_distance(word)
+        if limit == 0:
+            return {}
+
+        shared: Dict[str, int] = {}
+        for gram in set(_trigrams(word)):
+            for candidate in self._grams[field].get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        # Each edit destroys at most three trigrams
+        needed = len(word) + 2 - 3 * limit
+        matches = {}
+        for candidate, count in shared.items():
+            if count < needed:
+                continue
+            distance = edit_distance(word, candidate, limit)
+            if distance <= limit:
+                matches[candidate] = distance
+        return matches
+
+    def search_with_scores(
+        self,
+        field: str,
+        query: str,
+        limit: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Rows whose name sounds like the query, best first.
+
+        Args:
+            field: 'name' or 'father_name'
+            query: Name in Latin or Bengali script
+            limit: Maximum rows to return
+
+        Returns:
+            List of (row, total edit distance), ordered by distance then row
+        """
+        words = [word for word in phonetic_key(query).split(' ') if word]
+        if not words:
+            return []
+
+        scores: Optional[Dict[int, int]] = None
+        postings = self._postings[field]
+        for word in words:
+            word_scores: Dict[int, int] = {}
+            for candidate, distance in self.match_word(field, word).items():
+                for row in postings[candidate]:
+                    if distance < word_scores.get(row, distance + 1):
+                        word_scores[row] = distance
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {
+                    row: total + word_scores[row]
+                    for row, total in scores.items() if row in word_scores
+                }
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (item[1], item[0]))
+        return ranked[:limit]
+
+    def search(self, field: str, query: str, limit: Optional[int] = None) -> List[int]:
+        """Rows whose name sounds like the query, best first."""
+        return [row for row, _ in self.search_with_scores(field, query, limit)]
@@ -0,0 +1,471 @@
+"""
+HTTP Query Service
+Headless JSON API over the voter RAG system, alongside the Streamlit UI
+
+Every worker process loads the voter snapshot, opens the vector store and
+creates the embedding and LLM clients once at startup, then serves all
+requests from one shared VoterRAGChain. With several workers the processes
+bind the same port with SO_REUSEPORT and the kernel spreads connections
+between them; the parent builds the snapshot, vector store and keyword
+index first and keeps none of it, and the workers only open them.
+
+Endpoints (all JSON):
+    GET  /health
+    POST /query                     {"question": ..., "route": ..., "session_id": ...}
+    POST /query/batch               {"questions": [...], "route": ...}
+    GET  /search/name?q=...&k=5     (also /search/father_name, /search/voter_id)
+    GET  /filter/ward/{ward}?limit=20&cursor=...
+    GET  /filter/occupation/{occupation}?limit=20&cursor=...
+    GET  /filter?ward=...&gender=...&birth_year_from=...&limit=20&cursor=...
+    GET  /stats
+
+Conversation histories (session_id) live in the worker that served the
+request; clients that chat should keep one keep-alive connection open.
+
+Blocking work (index lookups, SQLite caches, batch answers) runs on a pool
+of SERVER_THREADS threads per worker. A request that times out gets its
+504 at once, but work already running in a thread cannot be interrupted
+and finishes in the background; work still queued for the pool is
+dropped. So an overloaded worker never holds more than SERVER_THREADS
+threads.
+
+Usage:
+    python server.py [workers] [port]
+
+Set EMBEDDING_PROVIDER=fake and LLM_PROVIDER=fake to run it offline.
+"""
+import asyncio
+import functools
+import gc
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+
+from aiohttp import web
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import (
+    SQL_DUMP_PATH,
+    SQL_ROW_LIMIT,
+    INGEST_WORKERS,
+    SNAPSHOT_PATH,
+    VECTOR_STORE_SYNC,
+    LIST_RESULT_LIMIT,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_WORKERS,
+    SERVER_REQUEST_TIMEOUT,
+    SERVER_THREADS,
+    SERVER_KEEPALIVE_TIMEOUT,
+    SERVER_MAX_RESULTS,
+    SERVER_MAX_BATCH
+)
+from embeddings.vector_store import VoterVectorStore
+from rag.chain import VoterRAGChain, initialize_rag_system
+from rag.router import ROUTE_RAG
+from rag.sessions import SessionStore
+from utils.snapshot import load_voter_data, open_snapshot
+from utils.statistics import VoterStatistics
+
+
+# Routes a client may force; the structured routes need parameters only the
+# router can read from the question
+ROUTES = (ROUTE_RAG,)
+
+# Query parameters of /filter that are not metadata fields
+_PAGING_PARAMS = ('limit', 'cursor', 'birth_year_from', 'birth_year_to')
+
+RAG_CHAIN = web.AppKey("rag_chain", VoterRAGChain)
+SESSIONS = web.AppKey("sessions", SessionStore)
+STATISTICS = web.AppKey("statistics", VoterStatistics)
+REQUEST_TIMEOUT = web.AppKey("request_timeout", float)
+THREADS = web.AppKey("threads", int)
+
+_dumps = functools.partial(json.dumps, ensure_ascii=False)
+
+
+def _json(data: Any, status: int = 200) -> web.Response:
+    return web.json_response(data, status=status, dumps=_dumps)
+
+
+def _bad_request(message: str) -> web.HTTPBadRequest:
+    return web.HTTPBadRequest(text=_dumps({'error': message}), content_type='application/json')
+
+
+def document_json(doc) -> Dict[str, Any]:
+    """A LangChain Document as JSON."""
+    return {'content': doc.page_content, 'metadata': doc.metadata}
+
+
+def answer_json(result: Dict[str, Any]) -> Dict[str, Any]:
+    """An answer()/query_batch() result with its source documents as JSON."""
+    result = dict(result)
+    result['source_documents'] = [document_json(doc) for doc in result.get('source_documents') or []]
+    return result
+
+
+def _int_param(
+    request: web.Request,
+    name: str,
+    default: Optional[int],
+    minimum: int = 1,
+    maximum: Optional[int] = None
+) -> Optional[int]:
+    """An integer query parameter, clamped to maximum."""
+    value = request.query.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise _bad_request(f"{name} must be an integer")
+    if number < minimum:
+        raise _bad_request(f"{name} must be at least {minimum}")
+    return min(number, maximum) if maximum is not None else number
+
+
+async def _json_body(request: web.Request) -> Dict[str, Any]:
+    try:
+        body = await request.json()
+    except ValueError:
+        raise _bad_request("request body must be JSON")
+    if not isinstance(body, dict):
+        raise _bad_request("request body must be a JSON object")
+    return body
+
+
+def _route_param(body: Dict[str, Any]) -> Optional[str]:
+    route = body.get('route')
+    if route is not None and route not in ROUTES:
+        raise _bad_request(f"route must be one of {list(ROUTES)}")
+    return route
+
+
+@web.middleware
+async def timeout_middleware(request: web.Request, handler):
+    """Answer 504 when a request runs past the timeout, 500 on unexpected errors."""
+    try:
+        return await asyncio.wait_for(handler(request), request.app[REQUEST_TIMEOUT])
+    except asyncio.TimeoutError:
+        return _json({'error': "request timed out"}, status=504)
+    except web.HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error handling {request.method} {request.path}: {type(e).__name__}: {e}")
+        return _json({'error': f"{type(e).__name__}: {e}"}, status=500)
+
+
+async def bounded_executor(app: web.Application):
+    """
+    Cleanup context: make asyncio.to_thread() use a pool of app[THREADS] threads.
+
+    A cancelled to_thread() call whose work has not started yet is removed
+    from the pool's queue, so timed-out requests do not leave work behind.
+    """
+    executor = ThreadPoolExecutor(max_workers=app[THREADS], thread_name_prefix="server")
+    asyncio.get_running_loop().set_default_executor(executor)
+    yield
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def handle_health(request: web.Request) -> web.Response:
+    return _json({'status': 'ok', 'pid': os.getpid()})
+
+
+async def handle_query(request: web.Request) -> web.Response:
+    """Answer one question; with a session_id, in the context of that conversation."""
+    body = await _json_body(request)
+    question = body.get('question')
+    if not isinstance(question, str) or not question.strip():
+        raise _bad_request("question must be a non-empty string")
+    route = _route_param(body)
+    session_id = body.get('session_id')
+
+    if session_id is not None:
+        if route is not None:
+            raise _bad_request("route cannot be forced in a session")
+        conversation = request.app[SESSIONS].get(str(session_id))
+        result = await conversation.achat(question)
+    else:
+        result = await request.app[RAG_CHAIN].aanswer(question, route=route)
+    return _json(answer_json(result))
+
+
+async def handle_query_batch(request: web.Request) -> web.Response:
+    """Answer many questions in one request (see VoterRAGChain.query_batch)."""
+    body = await _json_body(request)
+    questions = body.get('questions')
+    if not isinstance(questions, list) or not all(isinstance(q, str) and q.strip() for q in questions):
+        raise _bad_request("questions must be a list of non-empty strings")
+    if len(questions) > SERVER_MAX_BATCH:
+        raise _bad_request(f"at most {SERVER_MAX_BATCH} questions per batch")
+    route = _route_param(body)
+
+    results = await asyncio.to_thread(request.app[RAG_CHAIN].query_batch, questions, route=route)
+    return _json({'results': [answer_json(result) for result in results]})
+
+
+async def handle_search(request: web.Request) -> web.Response:
+    """Voters by name, father's name or voter id."""
+    field = request.match_info['field']
+    query = request.query.get('q', '').strip()
+    if not query:
+        raise _bad_request("q is required")
+    k = _int_param(request, 'k', 5, maximum=SERVER_MAX_RESULTS)
+    rag_chain = request.app[RAG_CHAIN]
+
+    if field == 'name':
+        documents = await rag_chain.asearch_by_name(query, k=k)
+    elif field == 'father_name':
+        documents = await rag_chain.asearch_by_father_name(query, k=k)
+    elif field == 'voter_id':
+        documents = await asyncio.to_thread(rag_chain.search_by_voter_id, query)
+    else:
+        raise web.HTTPNotFound()
+    return _json({'documents': [document_json(doc) for doc in documents[:k]]})
+
+
+async def handle_filter(request: web.Request) -> web.Response:
+    """
+    One page of voters matching metadata filters, in serial order.
+
+    /filter/{field}/{value} filters on one field; /filter takes every
+    query parameter other than limit, cursor and birth_year_from/to as a
+    field (a field given several times matches any of its values).
+    """
+    if 'field' in request.match_info:
+        filters = {request.match_info['field']: request.match_info['value']}
+    else:
+        filters = {}
+        for field in request.query:
+            if field not in _PAGING_PARAMS and field not in filters:
+                values = request.query.getall(field)
+                filters[field] = values[0] if len(values) == 1 else values
+
+    limit = _int_param(request, 'limit', LIST_RESULT_LIMIT, maximum=SERVER_MAX_RESULTS)
+    cursor = request.query.get('cursor')
+    if cursor is not None and not cursor.isdigit():
+        raise _bad_request("cursor must be a next_cursor from a previous page")
+    year_from = _int_param(request, 'birth_year_from', None, minimum=0)
+    year_to = _int_param(request, 'birth_year_to', None, minimum=0)
+
+    try:
+        page = await asyncio.to_thread(
+            request.app[RAG_CHAIN].filter_voters, filters,
+            limit=limit, cursor=cursor, birth_year_from=year_from, birth_year_to=year_to
+        )
+    except ValueError as e:
+        # Unknown field
+        raise _bad_request(str(e))
+    return _json({
+        'documents': [document_json(doc) for doc in page['documents']],
+        'total': page['total'],
+        'next_cursor': page['next_cursor'],
+    })
+
+
+async def handle_stats(request: web.Request) -> web.Response:
+    """Voter statistics plus this worker's cache and session counters."""
+    rag_chain = request.app[RAG_CHAIN]
+    answer_cache = rag_chain.answer_cache
+    return _json({
+        'voters': request.app[STATISTICS].summary(),
+        'worker': {
+            'pid': os.getpid(),
+            'answer_cache': answer_cache.stats() if answer_cache is not None else {},
+            'query_cache': rag_chain.vector_store.query_cache_stats(),
+            'embedding_cache': rag_chain.vector_store.embedding_cache_stats(),
+            'sessions': request.app[SESSIONS].stats(),
+        },
+    })
+
+
+def create_app(
+    rag_chain: VoterRAGChain,
+    statistics: VoterStatistics,
+    request_timeout: float = SERVER_REQUEST_TIMEOUT,
+    threads: int = SERVER_THREADS
+) -> web.Application:
+    """
+    Build the aiohttp application around a loaded RAG chain.
+
+    Args:
+        rag_chain: Chain every request is answered with
+        statistics: Voter statistics served by /stats
+        request_timeout: Seconds before a request is answered with 504
+        threads: Threads running blocking work, shared by all requests
+
+    Returns:
+        aiohttp Application
+    """
+    app = web.Application(middlewares=[timeout_middleware])
+    app[RAG_CHAIN] = rag_chain
+    app[SESSIONS] = SessionStore(rag_chain)
+    app[STATISTICS] = statistics
+    app[REQUEST_TIMEOUT] = request_timeout
+    app[THREADS] = threads
+    app.cleanup_ctx.append(bounded_executor)
+
+    app.router.add_get('/health', handle_health)
+    app.router.add_post('/query', handle_query)
+    app.router.add_post('/query/batch', handle_query_batch)
+    app.router.add_get('/search/{field}', handle_search)
+    app.router.add_get('/filter', handle_filter)
+    app.router.add_get('/filter/{field:ward|occupation}/{value}', handle_filter)
+    app.router.add_get('/stats', handle_stats)
+    return app
+
+
+def load_data(sync: bool = VECTOR_STORE_SYNC, read_only: bool = False) -> tuple:
+    """
+    Load voters (from the snapshot when fresh) and open or build the vector store.
+
+    Args:
+        sync: Sync an existing vector store with the voters (writes to it)
+        read_only: Only open the snapshot and vector store prepare_data()
+            wrote; a missing one raises FileNotFoundError instead of
+            being rebuilt
+
+    Returns:
+        Tuple of (voter table, vector store, statistics)
+    """
+    if read_only and SNAPSHOT_PATH is not None:
+        snapshot = open_snapshot(SNAPSHOT_PATH)
+        if snapshot is None:
+            raise FileNotFoundError(f"No voter snapshot at {SNAPSHOT_PATH}")
+        voters, documents, statistics = snapshot[1:]
+    else:
+        # Without a snapshot file parsing the dump writes nothing
+        voters, documents, statistics = load_voter_data(
+            SQL_DUMP_PATH, SNAPSHOT_PATH, limit=SQL_ROW_LIMIT, workers=INGEST_WORKERS
+        )
+    vector_store = VoterVectorStore()
+    if read_only:
+        vector_store.open_existing()
+    else:
+        vector_store.get_or_create(documents, sync=sync)
+    return voters, vector_store, statistics
+
+
+def prepare_data(sync: bool = VECTOR_STORE_SYNC):
+    """
+    Build or sync everything the workers open, then let go of it.
+
+    Writes the snapshot, the vector store with its manifest and the BM25
+    keyword index, so that workers started with load_data(read_only=True)
+    never write. Nothing is kept, so the parent does not hold another
+    copy of the data next to the workers'.
+
+    Args:
+        sync: Sync an existing vector store with the voters (writes to it)
+    """
+    voters, vector_store, statistics = load_data(sync)
+    vector_store.close()
+    del voters, vector_store, statistics
+    gc.collect()
+
+
+def load_system(sync: bool = VECTOR_STORE_SYNC, read_only: bool = False) -> tuple:
+    """
+    Load the data and create the RAG chain, ready to serve.
+
+    Args:
+        sync: Sync an existing vector store with the voters (writes to it)
+        read_only: Open what prepare_data() wrote without writing (see load_data)
+
+    Returns:
+        Tuple of (VoterRAGChain, VoterStatistics)
+    """
+    voters, vector_store, statistics = load_data(sync, read_only=read_only)
+    rag_chain, _ = initialize_rag_system(vector_store, voters)
+    # Create the embedding and LLM clients now rather than on the first request
+    vector_store.embeddings
+    rag_chain.llm
+    return rag_chain, statistics
+
+
+def run_worker(host: str, port: int, reuse_port: bool = False):
+    """
+    Load the system and serve until interrupted.
+
+    Args:
+        host: Interface to listen on
+        port: TCP port
+        reuse_port: Share the port with other workers; serve() has then
+            already built and synced the data, which workers only read
+    """
+    start = time.perf_counter()
+    rag_chain, statistics = load_system(read_only=reuse_port)
+    print(f"Worker {os.getpid()} ready ({time.perf_counter() - start:.1f}s)")
+    web.run_app(
+        create_app(rag_chain, statistics),
+        host=host,
+        port=port,
+        reuse_port=reuse_port or None,
+        keepalive_timeout=SERVER_KEEPALIVE_TIMEOUT,
+        access_log=None,
+        print=None if reuse_port else print
+    )
+
+
+def serve(workers: int = SERVER_WORKERS, host: str = SERVER_HOST, port: int = SERVER_PORT):
+    """
+    Run the service with `workers` processes.
+
+    One worker serves in this process. Otherwise the snapshot, vector
+    store and keyword index are built (or synced) here first and released
+    (see prepare_data), so the workers only open them, and each worker is
+    a fresh process bound to the same port.
+
+    Args:
+        workers: Worker processes
+        host: Interface to listen on
+        port: TCP port
+    """
+    if workers > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+        print("SO_REUSEPORT is not available on this platform; running one worker")
+        workers = 1
+    if workers <= 1:
+        run_worker(host, port)
+        return
+
+    print(f"Preparing data for {workers} workers...")
+    prepare_data()
+
+    # Spawned rather than forked: no open SQLite or Chroma handles are inherited
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_worker, args=(host, port, True), name=f"worker-{i}")
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    print(f"======== Running on http://{host}:{port} with {workers} workers ========")
+
+    # SIGTERM stops the workers too instead of orphaning them
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    serve(
+        int(sys.argv[1]) if len(sys.argv) > 1 else SERVER_WORKERS,
+        port=int(sys.argv[2]) if len(sys.argv) > 2 else SERVER_PORT
+    )
@@ -0,0 +1,63 @@
+"""
+Tests for the aggregate engine's counts and question parser
+"""
+import pytest
+
+from search.aggregates import AggregateEngine
+from utils.voter_table import VoterTable
+
+
+VOTERS = [
+    {'id': '1', 'name': 'মোঃ সাইফুল ইসলাম', 'ward': '1', 'occupation': 'কৃষক',
+     'gender': 'পুরুষ', 'union': 'বাবরা', 'date_of_birth': '01/02/1980'},
+    {'id': '2', 'name': 'মোছাঃ রহিমা খাতুন', 'ward': '1', 'occupation': 'গৃহিণী',
+     'gender': 'মহিলা', 'union': 'বাবরা', 'date_of_birth': '03/04/1990'},
+    {'id': '3', 'name': 'আব্দুল করিম', 'ward': '2', 'occupation': 'কৃষক',
+     'gender': 'পুরুষ', 'union': 'হাচলা', 'date_of_birth': '05/06/2001'},
+]
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return AggregateEngine(VoterTable.from_records(VOTERS))
+
+
+def test_counts_and_groups(engine):
+    assert engine.count() == 3
+    assert engine.count(ward='1') == 2
+    assert engine.count(ward='1', occupation='কৃষক') == 1
+    assert engine.count(birth_year_from=1985) == 2
+    assert engine.group_by('ward') == {'1': 2, '2': 1}
+
+
+@pytest.mark.parametrize('question, count', [
+    ('How many voters are there?', 3),
+    ('How many voters in ward 1?', 2),
+    ('How many farmers?', 2),
+    ('Total number of women', 1),
+    ('How many were born after 1985?', 2),
+    ('১ নং ওয়ার্ডে কতজন ভোটার আছে?', 2),
+    ('ওয়ার্ড ২ এ কতজন ভোটার আছে?', 1),
+    ('ওয়ার্ড নং ২ এর মোট ভোটার সংখ্যা', 1),
+    ('How many voters in ward-2?', 1),
+])
+def test_statistics_questions(engine, question, count):
+    assert engine.answer(question)['count'] == count
+
+
+def test_grouping_question(engine):
+    assert engine.answer('Voter count by ward')['groups'] == {'1': 2, '2': 1}
+
+
+@pytest.mark.parametrize('question', [
+    'What is the serial number of Rahima Khatun?',
+    'How many children does Saiful have?',
+    'What is the total of his land?',
+    'সাইফুলের মোট কয়টি জমি?',
+    'সাইফুল ইসলামের কতজন সন্তান?',
+    'Which ward has the most voters?',
+    'ওয়ার্ডে মোট কতজন ভোটার?',
+])
+def test_questions_without_subject_or_filter_are_not_parsed(engine, question):
+    assert engine.parse(question) is None
+    assert engine.answer(question) is None
@@ -0,0 +1,86 @@
+"""
+Tests for the two-level answer cache
+"""
+import pytest
+from langchain_core.documents import Document
+
+from embeddings.fake import FakeEmbeddings
+from rag.answer_cache import AnswerCache
+
+
+EMBEDDINGS = FakeEmbeddings(dimension=64)
+SAME = [1.0, 0.0, 0.0]
+
+
+def result(answer):
+    return {'answer': answer, 'source_documents': [Document(page_content=answer, metadata={'id': '1'})],
+            'route': 'rag'}
+
+
+@pytest.fixture
+def cache():
+    return AnswerCache(similarity=0.95)
+
+
+def test_exact_hit_ignores_case_punctuation_and_digits(cache):
+    cache.put('What is in ward ১?', result('A'))
+    hit = cache.get_exact('what is in WARD 1')
+    assert hit['answer'] == 'A'
+    assert hit['source_documents'][0].page_content == 'A'
+
+
+def test_semantic_hit_needs_the_same_names_and_numbers(cache):
+    cache.put("What is Rahima's address?", result('Rahima'), SAME)
+    assert cache.get_semantic("Tell me the address of Rahima", SAME)['answer'] == 'Rahima'
+    assert cache.get_semantic("What is Karima's address?", SAME) is None
+    assert cache.get_semantic("What is Rahima's occupation?", SAME) is None
+
+    cache.put('How many voters in ward 1?', result('ward 1'), SAME)
+    assert cache.get_semantic('How many voters in ward 2?', SAME) is None
+
+
+def test_semantic_level_uses_embeddings(cache):
+    question = 'What is the address of Rahima Khatun?'
+    cache.put(question, result('R'), EMBEDDINGS.embed_query(question))
+    assert cache.get_semantic('Rahima Khatun address', EMBEDDINGS.embed_query(question))['answer'] == 'R'
+    assert cache.get_semantic('Rahima Khatun address', EMBEDDINGS.embed_query('ward 9 farmers')) is None
+
+
+def test_exact_misses_count_towards_hit_rate(cache):
+    cache.put('q1', result('A'))
+    cache.get_exact('q1')
+    cache.get_exact('q2')
+    cache.get_exact('q3')
+    cache.get_semantic('q3', SAME)
+
+    stats = cache.stats()
+    assert stats['exact_hits'] == 1
+    assert stats['exact_misses'] == 2
+    assert stats['semantic_misses'] == 1
+    assert stats['misses'] == 2
+    assert stats['hit_rate'] == pytest.approx(1 / 3)
+
+
+def test_new_index_version_invalidates(tmp_path):
+    path = str(tmp_path / 'answers.sqlite')
+    cache = AnswerCache(path=path)
+    cache.validate('v1')
+    cache.put('q', result('A'), SAME)
+
+    reopened = AnswerCache(path=path)
+    reopened.validate('v1')
+    assert reopened.get_exact('q')['answer'] == 'A'
+
+    reopened.validate('v2')
+    assert reopened.get_exact('q') is None
+    assert reopened.get_semantic('q', SAME) is None
+    assert reopened.stats()['invalidations'] == 1
+    assert AnswerCache(path=path).get_exact('q') is None
+
+
+def test_expired_entries_are_dropped(cache):
+    cache.ttl_seconds = 0
+    cache.put('q', result('A'), SAME)
+    cache._entries[next(iter(cache._entries))]['created'] -= 1
+    assert cache.get_exact('q') is None
+    assert cache.stats()['expirations'] == 1
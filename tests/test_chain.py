@@ -0,0 +1,51 @@
+"""
+Tests for VoterRAGChain's forced routes
+"""
+import asyncio
+
+import pytest
+
+import rag.chain
+from embeddings.fake import FakeEmbeddings
+from embeddings.vector_store import VoterVectorStore
+from rag.chain import VoterRAGChain
+from rag.router import ROUTE_AGGREGATE, ROUTE_FILTER, ROUTE_LOOKUP
+from utils.data_loader import create_voter_documents
+from utils.voter_table import VoterTable
+
+
+VOTERS = [
+    {'id': '1', 'name': 'মোঃ সাইফুল ইসলাম', 'ward': '1', 'occupation': 'কৃষক', 'serial': '1'},
+    {'id': '2', 'name': 'মোছাঃ রহিমা খাতুন', 'ward': '2', 'occupation': 'গৃহিণী', 'serial': '2'},
+]
+
+STRUCTURED_ROUTES = [ROUTE_LOOKUP, ROUTE_FILTER, ROUTE_AGGREGATE]
+
+
+@pytest.fixture
+def chain(tmp_path, monkeypatch):
+    monkeypatch.setattr(rag.chain, 'ANSWER_CACHE', False)
+    store = VoterVectorStore(backend='numpy')
+    store.persist_directory = str(tmp_path)
+    store.embeddings = FakeEmbeddings(dimension=32)
+    store.create_from_documents(list(create_voter_documents(VOTERS)))
+    return VoterRAGChain(store, VoterTable.from_records(VOTERS))
+
+
+@pytest.mark.parametrize('route', STRUCTURED_ROUTES)
+def test_structured_routes_cannot_be_forced(chain, route):
+    question = 'How many voters in ward 1?'
+    with pytest.raises(ValueError):
+        chain.answer(question, route=route)
+    with pytest.raises(ValueError):
+        asyncio.run(chain.aanswer(question, route=route))
+    with pytest.raises(ValueError):
+        chain.stream(question, route=route)
+    with pytest.raises(ValueError):
+        chain.query_batch([question], route=route)
+
+
+def test_unforced_route_still_uses_router_params(chain):
+    result = chain.answer('How many voters in ward 1?')
+    assert result['route'] == ROUTE_AGGREGATE
+    assert '1' in result['answer']
@@ -0,0 +1,82 @@
+"""
+Tests for the streaming voters.sql parser
+"""
+import io
+
+import pytest
+
+from utils.data_loader import (
+    iter_insert_rows, parse_record_values, parse_sql_alternative, split_statement_ranges
+)
+
+
+def rows(sql, chunk_size=7):
+    """Values of every voters row; a tiny chunk size exercises the chunk boundaries."""
+    return [values for _, values in iter_insert_rows(io.StringIO(sql), chunk_size=chunk_size)]
+
+
+@pytest.mark.parametrize('literal, expected', [
+    ("'plain'", 'plain'),
+    ("'it''s'", "it's"),
+    ("'it\\'s'", "it's"),
+    ("'back\\\\slash'", 'back\\slash'),
+    ("'line\\nbreak'", 'line\nbreak'),
+    ("'comma, (paren)'", 'comma, (paren)'),
+    ("''", ''),
+    ("'গ্রাম: বাবরা''এ'", "গ্রাম: বাবরা'এ"),
+])
+def test_quoted_escapes(literal, expected):
+    sql = f"INSERT INTO `voters` VALUES (1, {literal}, NULL);\n"
+    assert rows(sql) == [['1', expected, None]]
+    assert parse_record_values(f"1, {literal}, NULL") == ['1', expected, None]
+
+
+def test_multi_row_insert_with_column_list():
+    sql = (
+        "INSERT INTO voters (id, name) VALUES (1, 'a'), (2, 'b\\'c'),\n(3, NULL);\n"
+        "INSERT INTO other VALUES (9, 'skip');\n"
+        "insert into public.voters (id, name) values (4, 'd');\n"
+    )
+    parsed = list(iter_insert_rows(io.StringIO(sql), chunk_size=5))
+    assert [values for _, values in parsed] == [['1', 'a'], ['2', "b'c"], ['3', None], ['4', 'd']]
+    assert parsed[0][0] == ['id', 'name']
+
+
+def test_matches_in_memory_parser():
+    sql = "INSERT INTO voters VALUES (1, 'x''y'), (2, 'z');\n"
+    assert rows(sql) == [list(v.values()) for v in parse_sql_alternative(sql, ['id', 'name'])]
+
+
+def test_malformed_row_raises_with_offset():
+    sql = "INSERT INTO voters VALUES (1, 'a'), (2, NOW()), (3, 'c');\n"
+    with pytest.raises(ValueError, match=r'Malformed voters row at byte 36'):
+        rows(sql)
+
+
+def test_truncated_dump_raises():
+    with pytest.raises(ValueError, match='Truncated'):
+        rows("INSERT INTO voters VALUES (1, 'a'), (2, 'unterminated")
+
+
+def test_offset_counts_bytes_not_characters():
+    sql = "INSERT INTO voters VALUES ('বাবরা'), (NOW());\n"
+    with pytest.raises(ValueError, match=f"byte {sql.encode().index(b'(NOW')}"):
+        rows(sql, chunk_size=3)
+
+
+@pytest.mark.parametrize('header', ['INSERT INTO', 'insert into', '  Insert   Into', '\tINSERT\nINTO'])
+def test_split_statement_ranges_any_header_spelling(tmp_path, header):
+    path = tmp_path / 'voters.sql'
+    statements = [f"{header} voters VALUES ({i}, '{'x' * 50}');\n" for i in range(8)]
+    path.write_text('-- dump\n' + ''.join(statements), encoding='utf-8')
+
+    ranges = split_statement_ranges(str(path), 4)
+    assert len(ranges) == 4
+    assert ranges[0][0] == 0 and ranges[-1][1] == path.stat().st_size
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    content = path.read_bytes()
+    parsed = []
+    for start, end in ranges:
+        parsed.extend(rows(content[start:end].decode('utf-8'), chunk_size=1 << 10))
+    assert [values[0] for values in parsed] == [str(i) for i in range(8)]
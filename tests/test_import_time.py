@@ -0,0 +1,26 @@
+"""
+Import-time budgets (see benchmarks/check_import_time.py)
+
+Each module is imported in a fresh interpreter. Set IMPORT_TIME_SCALE to
+multiply every budget on a slow machine.
+"""
+import os
+
+import pytest
+
+from benchmarks.check_import_time import BUDGETS_MS, RUNS, measure
+
+
+SCALE = float(os.getenv("IMPORT_TIME_SCALE", "1"))
+
+
+@pytest.mark.parametrize('module, budget', BUDGETS_MS.items())
+def test_import_time_within_budget(module, budget):
+    elapsed, leaked = measure(module)
+    assert not leaked, f"{module} eagerly imports {', '.join(leaked)}"
+    # Retried a few times, so a cold disk cache does not count against it
+    for _ in range(RUNS - 1):
+        if elapsed <= budget * SCALE:
+            break
+        elapsed = min(elapsed, measure(module)[0])
+    assert elapsed <= budget * SCALE, f"{module} took {elapsed:.1f} ms (budget {budget * SCALE:.0f} ms)"
@@ -0,0 +1,46 @@
+"""
+Tests for the rule-based query router
+"""
+import pytest
+
+from rag.router import QueryRouter, ROUTE_AGGREGATE, ROUTE_FILTER, ROUTE_LOOKUP, ROUTE_RAG
+from search.aggregates import AggregateEngine
+from utils.voter_table import VoterTable
+
+
+VOTERS = [
+    {'id': '1', 'name': 'মোঃ সাইফুল ইসলাম', 'ward': '1', 'occupation': 'কৃষক',
+     'gender': 'পুরুষ', 'union': 'বাবরা', 'date_of_birth': '01/02/1980'},
+    {'id': '2', 'name': 'মোছাঃ রহিমা খাতুন', 'ward': '2', 'occupation': 'গৃহিণী',
+     'gender': 'মহিলা', 'union': 'বাবরা', 'date_of_birth': '03/04/1990'},
+]
+
+
+@pytest.fixture(scope='module')
+def router():
+    return QueryRouter(AggregateEngine(VoterTable.from_records(VOTERS)))
+
+
+@pytest.mark.parametrize('question, route', [
+    ('How many voters in ward 1?', ROUTE_AGGREGATE),
+    ('Count of farmers', ROUTE_AGGREGATE),
+    ('Voter statistics by gender', ROUTE_AGGREGATE),
+    ('১ নং ওয়ার্ডে কতজন ভোটার আছে?', ROUTE_AGGREGATE),
+    ('List all farmers in ward 1', ROUTE_FILTER),
+    ('Voter ID 1234567890', ROUTE_LOOKUP),
+    ('Who is Rahima Khatun?', ROUTE_LOOKUP),
+    ('What is the address of Rahima Khatun?', ROUTE_RAG),
+])
+def test_routes(router, question, route):
+    assert router.classify(question)['route'] == route
+
+
+@pytest.mark.parametrize('question', [
+    'What is the serial number of Rahima Khatun?',
+    'How many children does Saiful have?',
+    'Which country do most voters come from?',
+    'What is the account status of Saiful Islam?',
+    'Is there any discount?',
+])
+def test_counting_words_inside_other_words_go_to_rag(router, question):
+    assert router.classify(question)['route'] == ROUTE_RAG
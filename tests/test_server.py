@@ -0,0 +1,66 @@
+"""
+Tests for the HTTP query service's request validation and worker startup
+"""
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+import server
+from rag.router import ROUTE_AGGREGATE, ROUTE_FILTER, ROUTE_LOOKUP
+from server import create_app
+
+
+class RecordingChain:
+    """Stands in for VoterRAGChain; records the routes it is asked to force."""
+
+    def __init__(self):
+        self.routes = []
+
+    async def aanswer(self, question, route=None):
+        self.routes.append(route)
+        return {'answer': 'ok', 'source_documents': [], 'route': route or 'rag'}
+
+    def query_batch(self, questions, route=None):
+        self.routes.append(route)
+        return [{'question': question, 'answer': 'ok', 'source_documents': [],
+                 'route': route or 'rag', 'error': None} for question in questions]
+
+
+async def post(chain, path, body):
+    async with TestClient(TestServer(create_app(chain, statistics=None))) as client:
+        response = await client.post(path, json=body)
+        return response.status, await response.json()
+
+
+@pytest.mark.parametrize('route', [ROUTE_LOOKUP, ROUTE_FILTER, ROUTE_AGGREGATE, 'bogus'])
+@pytest.mark.parametrize('path, body', [
+    ('/query', {'question': 'How many voters in ward 1?'}),
+    ('/query/batch', {'questions': ['How many voters in ward 1?']}),
+])
+def test_forcing_a_structured_route_is_a_bad_request(route, path, body):
+    chain = RecordingChain()
+    status, payload = asyncio.run(post(chain, path, {**body, 'route': route}))
+    assert status == 400
+    assert 'route' in payload['error']
+    assert chain.routes == []
+
+
+@pytest.mark.parametrize('path, body', [
+    ('/query', {'question': 'Who is Rahima?'}),
+    ('/query/batch', {'questions': ['Who is Rahima?']}),
+])
+def test_forcing_rag_is_passed_to_the_chain(path, body):
+    chain = RecordingChain()
+    status, _ = asyncio.run(post(chain, path, {**body, 'route': 'rag'}))
+    assert status == 200
+    assert chain.routes == ['rag']
+
+
+def test_read_only_load_does_not_build_a_missing_snapshot(tmp_path, monkeypatch):
+    snapshot = tmp_path / 'voters.snapshot'
+    monkeypatch.setattr(server, 'SNAPSHOT_PATH', str(snapshot))
+
+    with pytest.raises(FileNotFoundError):
+        server.load_data(read_only=True)
+    assert not snapshot.exists()
@@ -0,0 +1,66 @@
+"""
+Tests for the memory-mapped voter snapshot
+"""
+import os
+
+import pytest
+
+import utils.snapshot as snapshot
+from benchmarks.synthetic import write_synthetic_dump
+
+
+@pytest.fixture
+def paths(tmp_path):
+    dump = write_synthetic_dump(str(tmp_path / 'voters.sql'), 50, rows_per_insert=20)
+    return dump, str(tmp_path / 'voters.snapshot')
+
+
+@pytest.fixture
+def hashes(monkeypatch):
+    """Count how often the dump is hashed."""
+    calls = []
+    real = snapshot.file_sha256
+
+    def counting(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(snapshot, 'file_sha256', counting)
+    return calls
+
+
+def test_snapshot_round_trip(paths):
+    dump, path = paths
+    voters, documents, statistics = snapshot.load_voter_data(dump, path)
+    loaded = snapshot.load_snapshot(path, dump)
+
+    assert loaded is not None
+    assert list(loaded[0].column('name')) == list(voters.column('name'))
+    assert loaded[1].hashes() == documents.hashes()
+    assert loaded[2].summary() == statistics.summary()
+
+
+def test_touched_dump_is_hashed_once(paths, hashes):
+    dump, path = paths
+    snapshot.load_voter_data(dump, path)
+    hashes.clear()
+
+    stat = os.stat(dump)
+    os.utime(dump, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert snapshot.load_snapshot(path, dump) is not None
+    assert len(hashes) == 1
+
+    source = snapshot.open_snapshot(path)[0]
+    assert source['mtime_ns'] == os.stat(dump).st_mtime_ns
+    assert snapshot.load_snapshot(path, dump) is not None
+    assert len(hashes) == 1
+
+
+def test_changed_dump_is_stale(paths):
+    dump, path = paths
+    snapshot.load_voter_data(dump, path)
+    with open(dump, 'r+b') as f:
+        data = f.read()
+        f.seek(0)
+        f.write(data.replace(b'Synthetic', b'synthetic'))
+    assert snapshot.load_snapshot(path, dump) is None
@@ -0,0 +1,31 @@
+"""
+Tests for incrementally maintained voter statistics
+"""
+from utils.statistics import VoterStatistics
+from utils.voter_table import VoterTable
+
+
+VOTERS = [
+    {'id': '1', 'union': 'হাচলা', 'ward': '1', 'gender': 'পুরুষ', 'date_of_birth': '01/01/1980'},
+    {'id': '2', 'union': 'বাবরা', 'ward': '1', 'gender': 'মহিলা', 'date_of_birth': '০২/০২/১৯৯০'},
+    {'id': '3', 'union': 'বাবরা', 'ward': '2', 'gender': 'মহিলা', 'date_of_birth': None},
+]
+
+
+def test_summary():
+    summary = VoterStatistics.from_table(VoterTable.from_records(VOTERS)).summary()
+    assert summary['total_voters'] == 3
+    assert list(summary['by_union']) == ['বাবরা', 'হাচলা']
+    assert summary['unions'] == ['হাচলা', 'বাবরা']
+    assert summary['by_birth_year'] == {1980: 1, 1990: 1}
+    assert summary['ward_gender'] == {'1': {'পুরুষ': 1, 'মহিলা': 1}, '2': {'মহিলা': 1}}
+
+
+def test_incremental_updates_match_a_recount():
+    stats = VoterStatistics.from_table(VoterTable.from_records(VOTERS[:2]))
+    stats.apply(removed=[VOTERS[0]], added=[VOTERS[2], {**VOTERS[0], 'ward': '3'}])
+    expected = VoterStatistics.from_table(VoterTable.from_records(VOTERS[1:] + [{**VOTERS[0], 'ward': '3'}]))
+
+    restored = VoterStatistics.from_dict(stats.to_dict())
+    for key in ('total_voters', 'by_ward', 'by_gender', 'by_union', 'by_birth_year', 'ward_gender'):
+        assert restored.summary()[key] == expected.summary()[key]
@@ -0,0 +1,54 @@
+"""
+Tests for Bengali text normalization and transliteration
+"""
+import unicodedata
+
+import pytest
+
+from search.phonetic import PhoneticIndex
+from utils.text import birth_year, normalize_name, phonetic_key, tokenize, transliterate_bengali
+from utils.voter_table import VoterTable
+
+
+@pytest.mark.parametrize('bengali, latin', [
+    ('মিয়া', 'miya'),
+    ('রিয়াজ', 'riyaj'),
+    ('বড়ুয়া', 'boruya'),
+    ('আষাঢ়', 'asharh'),
+    ('ঢাকা', 'dhaka'),
+])
+def test_transliteration_of_nukta_letters(bengali, latin):
+    assert transliterate_bengali(bengali) == latin
+    # Precomposed and decomposed spellings read the same
+    assert transliterate_bengali(unicodedata.normalize('NFD', bengali)) == latin
+    assert transliterate_bengali(bengali.replace('\u09af\u09bc', '\u09df')) == latin
+
+
+@pytest.mark.parametrize('bengali, english', [
+    ('মিয়া', 'Mia'),
+    ('রিয়াজ', 'Riaz'),
+    ('বড়ুয়া', 'Barua'),
+    ('আয়েশা', 'Ayesha'),
+    ('রফিকুল', 'Rofiqul'),
+])
+def test_phonetic_keys_match_across_scripts(bengali, english):
+    assert phonetic_key(bengali) == phonetic_key(english)
+
+
+def test_phonetic_index_finds_english_typed_names():
+    table = VoterTable.from_records([
+        {'id': '1', 'name': 'মোঃ রিয়াজ উদ্দিন'},
+        {'id': '2', 'name': 'অনিল বড়ুয়া'},
+        {'id': '3', 'name': 'রহিম মিয়া'},
+    ])
+    index = PhoneticIndex(table)
+    assert index.search('name', 'Riaz Uddin')[:1] == [0]
+    assert index.search('name', 'Anil Barua')[:1] == [1]
+    assert index.search('name', 'Rahim Mia')[:1] == [2]
+
+
+def test_normalization_helpers():
+    assert normalize_name('মোঃ  সাইফুল-ইসলাম') == 'সাইফুল ইসলাম'
+    assert tokenize('জন্ম: ১৯/০৪/২০০৪') == ['জন্ম', '19', '04', '2004']
+    assert birth_year('১৯/০৪/২০০৪') == 2004
+    assert birth_year('unknown') == 0
@@ -0,0 +1,89 @@
+"""
+Tests for VoterVectorStore's incremental sync and keyword index
+"""
+import os
+
+import pytest
+
+from embeddings.fake import FakeEmbeddings
+from embeddings.vector_store import VoterVectorStore
+from utils.data_loader import create_voter_documents
+
+
+NAMES = ['সাইফুল ইসলাম', 'রহিমা খাতুন', 'করিম মোল্যা', 'ফাতেমা বেগম', 'নাসরিন শেখ']
+
+
+def documents():
+    return list(create_voter_documents([
+        {'id': str(i), 'name': name, 'ward': str(i % 3 + 1), 'serial': str(i)}
+        for i, name in enumerate(NAMES, start=1)
+    ]))
+
+
+def open_store(path):
+    store = VoterVectorStore(backend='numpy')
+    store.persist_directory = str(path)
+    store.embeddings = FakeEmbeddings(dimension=32)
+    return store
+
+
+@pytest.fixture
+def built(tmp_path):
+    open_store(tmp_path).create_from_documents(documents())
+    return tmp_path
+
+
+def keyword_documents(store, name):
+    """Documents the keyword side of hybrid search returns for a name."""
+    hits = store.bm25.top(name, k=1)
+    return list(store._keyword_hits(hits, {}).values())
+
+
+def test_sync_after_reorder_keeps_keyword_hits_aligned(built):
+    store = open_store(built)
+    store.load_existing()
+    reordered = documents()[::-1]
+    report = store.update_from_documents(reordered)
+
+    assert report['updated'] == report['added'] == report['deleted'] == 0
+    assert store.bm25.ids == [doc['id'] for doc in reordered]
+    for name in NAMES:
+        (doc,) = keyword_documents(store, name)
+        assert name in doc.page_content
+
+
+def test_sync_in_same_order_reuses_keyword_index(built):
+    store = open_store(built)
+    store.load_existing()
+    loaded = store.bm25
+    store.update_from_documents(documents())
+
+    assert store.bm25 is loaded
+    (doc,) = keyword_documents(store, NAMES[1])
+    assert NAMES[1] in doc.page_content
+
+
+def test_open_existing_reads_a_built_store(built):
+    store = open_store(built)
+    store.open_existing()
+
+    assert store.vector_store.count() == len(NAMES)
+    (doc,) = keyword_documents(store, NAMES[2])
+    assert NAMES[2] in doc.page_content
+
+
+def test_open_existing_does_not_rebuild_a_missing_keyword_index(built):
+    store = open_store(built)
+    os.remove(store.bm25_path)
+
+    with pytest.raises(FileNotFoundError):
+        store.open_existing()
+    assert not os.path.exists(store.bm25_path)
+
+
+def test_open_existing_does_not_create_a_store(tmp_path):
+    store = open_store(tmp_path / 'missing')
+
+    with pytest.raises(FileNotFoundError):
+        store.open_existing()
+    assert not os.path.exists(store.persist_directory)
@@ -2,253 +2,558 @@
 Data Loader Module
 Parses voters.sql dump file and extracts voter records
 """
+import hashlib
+import io
+import json
+import mmap
+import os
 import re
-import pandas as pd
-from typing import List, Dict, Any
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional, TextIO, Tuple, Union
 
+from utils.statistics import VoterStatistics
+from utils.voter_table import VOTER_COLUMNS, VoterTable
 
-def parse_sql_dump(file_path: str) -> List[Dict[str, Any]]:
+# Characters read from the dump per chunk
+READ_CHUNK_SIZE = 1 << 20
+
+# "INSERT INTO [schema.]table [(col, ...)] VALUES"
+_INSERT_RE = re.compile(
+    r'INSERT\s+INTO\s+(?:[`"]?\w+[`"]?\.)?[`"]?(\w+)[`"]?\s*(?:\(([^)]*)\))?\s*VALUES\s*',
+    re.IGNORECASE
+)
+
+# A quoted string, matched with an unrolled loop (no nested quantifiers)
+# so a row cut off at a chunk boundary fails fast instead of backtracking
+_QUOTED = r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'"
+_FIELD = r"(?:" + _QUOTED + r"|[^\s,'()]+)"
+
+# One parenthesised row of comma-separated fields
+_TUPLE_RE = re.compile(
+    r"\(\s*(" + _FIELD + r"(?:\s*,\s*" + _FIELD + r")*)\s*\)", re.DOTALL
+)
+
+# A single value inside a row: a quoted string or a bare literal (number, NULL)
+_FIELD_RE = re.compile(r"'([^'\\]*(?:(?:\\.|'')[^'\\]*)*)'|([^\s,']+)", re.DOTALL)
+
+# The longest run of well-formed fields at the start of a row; where it
+# stops tells a row cut off at the end of the buffer from a malformed one
+_ROW_PREFIX_RE = re.compile(
+    r"\(\s*(?:" + _FIELD + r"(?:\s*,\s*" + _FIELD + r")*\s*,?\s*)?", re.DOTALL
+)
+_QUOTED_RE = re.compile(_QUOTED, re.DOTALL)
+
+# Separators between rows of a multi-row INSERT
+_ROW_SEPARATOR_RE = re.compile(r'[\s,]*')
+
+# Start of an INSERT statement at the beginning of a line, in any casing
+_STATEMENT_START_RE = re.compile(rb'\n[ \t]*INSERT\s+INTO\b', re.IGNORECASE)
+
+_UNESCAPE_RE = re.compile(r"\\(.)|''", re.DOTALL)
+_ESCAPES = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+
+# Tail of the buffer kept while searching for the next INSERT header,
+# so a header split across two chunks is still found
+_HEADER_LOOKBACK = 4096
+
+
+def _unescape(value: str) -> str:
+    """Resolve backslash escapes and doubled quotes in a quoted SQL string."""
+    if '\\' not in value and "''" not in value:
+        return value
+    return _UNESCAPE_RE.sub(
+        lambda m: "'" if m.group(1) is None else _ESCAPES.get(m.group(1), m.group(1)),
+        value
+    )
+
+
+def _split_fields(row: str) -> List[Optional[str]]:
+    """Split the inside of a parenthesised row into unescaped values."""
+    values = []
+
+    if '\\' not in row and "''" not in row:
+        # Fast path: without escapes, splitting on quotes alternates
+        # between bare text and string contents
+        quoted = False
+        for part in row.split("'"):
+            if quoted:
+                values.append(part)
+            elif part.strip(', \t\r\n'):
+                for token in part.split(','):
+                    token = token.strip()
+                    if token:
+                        values.append(None if token.upper() == 'NULL' else token)
+            quoted = not quoted
+        return values
+
+    for quoted, bare in _FIELD_RE.findall(row):
+        if bare:
+            values.append(None if bare.upper() == 'NULL' else bare)
+        else:
+            values.append(_unescape(quoted))
+    return values
+
+
+def _row_is_incomplete(buf: str, pos: int) -> bool:
+    """Whether the row starting at pos may just be cut off at the end of buf."""
+    end = _ROW_PREFIX_RE.match(buf, pos).end()
+    if end == len(buf):
+        return True
+    # An opening quote whose closing quote has not been read yet
+    return buf[end] == "'" and _QUOTED_RE.match(buf, end) is None
+
+
+def iter_insert_rows(
+    stream: TextIO,
+    table: str = 'voters',
+    chunk_size: int = READ_CHUNK_SIZE,
+    offset: int = 0
+) -> Iterator[Tuple[List[str], List[Optional[str]]]]:
+    """
+    Stream the rows of every INSERT statement for a table.
+
+    The dump is read in chunks, so memory stays bounded by the chunk size
+    and the longest single row, not by the size of the file.
+
+    Args:
+        stream: Text stream positioned at the start of the dump
+        table: Table whose INSERT statements are parsed
+        chunk_size: Characters to read per chunk
+        offset: Byte offset of the stream within the dump, for error messages
+
+    Yields:
+        (column names, row values) tuples; NULL becomes None
+
+    Raises:
+        ValueError: A row holds something other than quoted strings and
+            bare literals (e.g. NOW()), or the dump ends inside a row
+    """
+    buf = ''
+    pos = 0
+    eof = False
+    columns: Optional[List[str]] = None
+
+    while True:
+        if columns is None:
+            # Outside an INSERT: look for the next header
+            match = _INSERT_RE.search(buf, pos)
+            if match is None or (match.end() == len(buf) and not eof):
+                if eof:
+                    return
+                pos = max(pos, len(buf) - _HEADER_LOOKBACK)
+            else:
+                pos = match.end()
+                if match.group(1).lower() != table.lower():
+                    continue
+                if match.group(2):
+                    columns = [c.strip().strip('`"') for c in match.group(2).split(',')]
+                else:
+                    columns = VOTER_COLUMNS
+                continue
+        else:
+            pos = _ROW_SEPARATOR_RE.match(buf, pos).end()
+            if pos < len(buf):
+                char = buf[pos]
+                if char == '(':
+                    match = _TUPLE_RE.match(buf, pos)
+                    if match is not None:
+                        pos = match.end()
+                        yield columns, _split_fields(match.group(1))
+                        continue
+                    if eof or not _row_is_incomplete(buf, pos):
+                        where = offset + len(buf[:pos].encode('utf-8'))
+                        problem = 'Truncated' if eof else 'Malformed'
+                        raise ValueError(f"{problem} {table} row at byte {where}: {buf[pos:pos + 80]!r}")
+                else:
+                    # ';' or a trailing clause such as ON CONFLICT ends the statement
+                    columns = None
+                    continue
+            elif eof:
+                return
+
+        # Need more input
+        chunk = stream.read(chunk_size)
+        offset += len(buf[:pos].encode('utf-8'))
+        buf = buf[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+
+def _rows_to_voters(
+    rows: Iterator[Tuple[List[str], List[Optional[str]]]],
+    limit: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """Turn (columns, values) rows into voter dicts, stopping after limit."""
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    for columns, values in rows:
+        if len(values) != len(columns):
+            continue
+        if columns is VOTER_COLUMNS:
+            voter = dict(zip(columns, values))
+        else:
+            voter = dict.fromkeys(VOTER_COLUMNS)
+            voter.update(zip(columns, values))
+        yield voter
+
+        count += 1
+        if limit is not None and count >= limit:
+            return
+
+
+def iter_voters(
+    file_path: str,
+    limit: Optional[int] = None,
+    chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream voter records from the SQL dump one row at a time.
+
+    Args:
+        file_path: Path to the SQL dump file
+        limit: Stop after this many records (None for all)
+        chunk_size: Characters to read per chunk
+
+    Yields:
+        Voter dictionaries keyed by VOTER_COLUMNS
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        yield from _rows_to_voters(iter_insert_rows(f, chunk_size=chunk_size), limit)
+
+
+def _rows_to_table(
+    rows: Iterator[Tuple[List[str], List[Optional[str]]]],
+    limit: Optional[int] = None
+) -> VoterTable:
+    """Append (columns, values) rows to a new VoterTable, stopping after limit."""
+    table = VoterTable()
+    if limit is not None and limit <= 0:
+        return table
+
+    for columns, values in rows:
+        if len(values) != len(columns):
+            continue
+        if columns is VOTER_COLUMNS:
+            table.append_values(values)
+        else:
+            table.append(dict(zip(columns, values)))
+
+        if limit is not None and len(table) >= limit:
+            break
+
+    return table
+
+
+def parse_sql_dump(file_path: str, limit: Optional[int] = None) -> VoterTable:
     """
     Parse the voters.sql dump file and extract voter records.
     
     Args:
         file_path: Path to the SQL dump file
+        limit: Maximum number of records to return (None for all)
         
     Returns:
-        List of voter dictionaries
+        VoterTable holding the voter records
     """
     with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Define column names based on the CREATE TABLE statement
-    columns = [
-        'id', 'serial_bn', 'serial', 'name', 'name_normalized',
-        'voter_id_bn', 'voter_id', 'father_name', 'father_name_normalized',
-        'mother_name', 'occupation', 'date_of_birth', 'address',
-        'voter_area_no_bn', 'voter_area_no', 'union', 'ward_bn', 'ward',
-        'gender', 'created_at', 'updated_at', 'phonetic_name', 'phonetic_father_name'
-    ]
-    
-    voters = []
-    
-    # Find all INSERT statements and extract values
-    # Pattern to match each row of values in the INSERT statement
-    insert_pattern = r'\((\d+),\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*(NULL|\'[^\']*\'),\s*(NULL|\'[^\']*\'),\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*(NULL|\'[^\']*\'),\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\',\s*\'([^\']*)\'\)'
-    
-    matches = re.findall(insert_pattern, content)
-    
-    # Limit to 50 records if requested
-    matches = matches[:50]
-    
-    for match in matches:
-        voter = {}
-        for i, col in enumerate(columns):
-            if i < len(match):
-                value = match[i]
-                # Clean up NULL values and quotes
-                if value == 'NULL':
-                    voter[col] = None
-                elif value.startswith("'") and value.endswith("'"):
-                    voter[col] = value[1:-1]
-                else:
-                    voter[col] = value
-            else:
-                voter[col] = None
-        voters.append(voter)
-    
-    # If regex didn't work well, try alternative parsing
-    if len(voters) == 0:
-        voters = parse_sql_alternative(content, columns)
-    
-    # Final limit to ensure we only return 50 rows as requested
-    return voters[:50]
+        return _rows_to_table(iter_insert_rows(f), limit)
 
 
 def parse_sql_alternative(content: str, columns: List[str]) -> List[Dict[str, Any]]:
     """
-    Alternative parsing method using line-by-line approach.
+    Alternative parsing method for dump content already held in memory.
+
+    Walks every INSERT statement for the voters table once with the same
+    compiled row and field patterns as the streaming parser, so the work
+    is linear in the size of the content.
     """
     voters = []
-    
-    # Find the INSERT statement section
-    lines = content.split('\n')
-    in_values = False
-    current_values = ""
-    
-    for line in lines:
-        if 'INSERT INTO' in line and 'voters' in line:
-            in_values = True
-            continue
-        
-        if in_values:
-            current_values += line
-    
-    # Parse individual records
-    # Split by "),\n(" pattern to get individual records
-    records = re.split(r'\),\s*\n?\(', current_values)
-    
-    for record in records:
-        # Clean up the record
-        record = record.strip()
-        if record.startswith('('):
-            record = record[1:]
-        if record.endswith(');'):
-            record = record[:-2]
-        if record.endswith(')'):
-            record = record[:-1]
-        
-        if not record:
+
+    for header in _INSERT_RE.finditer(content):
+        if header.group(1).lower() != 'voters':
             continue
-            
-        # Parse values from the record
-        values = parse_record_values(record)
-        
-        if len(values) >= len(columns):
-            voter = {}
-            for i, col in enumerate(columns):
-                value = values[i] if i < len(values) else None
-                if value == 'NULL' or value is None:
-                    voter[col] = None
-                else:
-                    voter[col] = str(value).strip("'")
-            voters.append(voter)
-    
+
+        pos = header.end()
+        while True:
+            match = _TUPLE_RE.match(content, pos)
+            if match is None:
+                break
+            values = _split_fields(match.group(1))
+            if len(values) >= len(columns):
+                voters.append(dict(zip(columns, values)))
+
+            # Step over the separator to the next row, if any
+            pos = _ROW_SEPARATOR_RE.match(content, match.end()).end()
+
     return voters
 
 
 def parse_record_values(record: str) -> List[str]:
     """
     Parse comma-separated values, handling quoted strings properly.
+
+    Quoted values are unescaped ('' and backslash escapes) and NULL
+    becomes None.
     """
-    values = []
-    current = ""
-    in_quotes = False
+    return _split_fields(record)
+
+
+def build_voter_document(voter: Mapping) -> Dict[str, Any]:
+    """
+    Create the searchable text document for one voter record.
     
-    for char in record:
-        if char == "'" and not in_quotes:
-            in_quotes = True
-            current += char
-        elif char == "'" and in_quotes:
-            in_quotes = False
-            current += char
-        elif char == ',' and not in_quotes:
-            values.append(current.strip())
-            current = ""
-        else:
-            current += char
+    Args:
+        voter: Voter dictionary or VoterRow
+        
+    Returns:
+        Document with text content and metadata
+    """
+    # Create a rich text representation for semantic search
+    text_parts = []
+    
+    # Name variations for better search
+    if voter.get('name'):
+        text_parts.append(f"নাম (Name): {voter['name']}")
+    if voter.get('phonetic_name'):
+        text_parts.append(f"Phonetic Name: {voter['phonetic_name']}")
+    
+    # Father's name
+    if voter.get('father_name'):
+        text_parts.append(f"পিতার নাম (Father's Name): {voter['father_name']}")
+    if voter.get('phonetic_father_name'):
+        text_parts.append(f"Phonetic Father: {voter['phonetic_father_name']}")
     
-    if current:
-        values.append(current.strip())
+    # Mother's name
+    if voter.get('mother_name'):
+        text_parts.append(f"মাতার নাম (Mother's Name): {voter['mother_name']}")
     
-    # Clean values
-    cleaned = []
-    for v in values:
-        v = v.strip()
-        if v.startswith("'") and v.endswith("'"):
-            v = v[1:-1]
-        elif v == 'NULL':
-            v = None
-        cleaned.append(v)
+    # Occupation
+    if voter.get('occupation'):
+        text_parts.append(f"পেশা (Occupation): {voter['occupation']}")
     
-    return cleaned
+    # Date of birth
+    if voter.get('date_of_birth'):
+        text_parts.append(f"জন্ম তারিখ (Date of Birth): {voter['date_of_birth']}")
+    
+    # Address
+    if voter.get('address'):
+        text_parts.append(f"ঠিকানা (Address): {voter['address']}")
+    
+    # Ward and Union
+    if voter.get('ward'):
+        text_parts.append(f"ওয়ার্ড নং (Ward No): {voter['ward']}")
+    if voter.get('ward_bn'):
+        text_parts.append(f"ওয়ার্ড (বাংলা): {voter['ward_bn']}")
+    if voter.get('union'):
+        text_parts.append(f"ইউনিয়ন (Union): {voter['union']}")
+    
+    # Gender
+    if voter.get('gender'):
+        text_parts.append(f"লিঙ্গ (Gender): {voter['gender']}")
+    
+    # Serial number
+    if voter.get('serial'):
+        text_parts.append(f"ক্রমিক নং (Serial): {voter['serial']}")
+    
+    # Create the document
+    return {
+        'id': str(voter.get('id', '')),
+        'content': '\n'.join(text_parts),
+        'metadata': voter_metadata(voter)
+    }
+
+
+def voter_metadata(voter: Mapping) -> Dict[str, Any]:
+    """Metadata stored with a voter's document (used for filters and source cards)."""
+    return {
+        'id': str(voter.get('id', '')),
+        'name': voter.get('name', ''),
+        'father_name': voter.get('father_name', ''),
+        'mother_name': voter.get('mother_name', ''),
+        'occupation': voter.get('occupation', ''),
+        'ward': voter.get('ward', ''),
+        'union': voter.get('union', ''),
+        'gender': voter.get('gender', ''),
+        'date_of_birth': voter.get('date_of_birth', ''),
+        'address': voter.get('address', ''),
+        'serial': voter.get('serial', '')
+    }
+
+
+def document_hash(doc: Dict[str, Any]) -> str:
+    """Fingerprint of everything that ends up in the vector store for a document."""
+    payload = json.dumps([doc['content'], doc['metadata']], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+def prebuild_documents(documents: Iterable[Dict[str, Any]]) -> VoterTable:
+    """
+    Document text and fingerprint of every voter, packed into a table.
+
+    Args:
+        documents: Voter documents, in table order
+
+    Returns:
+        VoterTable with 'content' and 'hash' columns
+    """
+    prebuilt = VoterTable(columns=('content', 'hash'), categorical=())
+    for doc in documents:
+        prebuilt.append_values((doc['content'], document_hash(doc)))
+    return prebuilt
+
+
+class VoterDocuments(Sequence):
+    """
+    Read-only list of voter documents backed by a VoterTable.
+
+    Documents are built from the table when accessed instead of being
+    held in memory alongside it. With a prebuilt table (see
+    prebuild_documents, and the snapshot) the text and fingerprint of
+    each document are read from it instead of being recomputed.
+    """
+
+    def __init__(self, table: VoterTable, prebuilt: Optional[VoterTable] = None):
+        self.table = table
+        self.prebuilt = prebuilt
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def _document(self, row) -> Dict[str, Any]:
+        if self.prebuilt is None:
+            return build_voter_document(row)
+        metadata = voter_metadata(row)
+        return {
+            'id': metadata['id'],
+            'content': self.prebuilt.value(row.index, 'content'),
+            'metadata': metadata
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._document(row) for row in self.table[index]]
+        return self._document(self.table[index])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in self.table:
+            yield self._document(row)
+
+    def ids(self) -> List[str]:
+        """Document id of every voter, without building the documents."""
+        return [str(value) for value in self.table.column('id')]
+
+    def hashes(self) -> List[str]:
+        """document_hash() of every document; free when prebuilt."""
+        if self.prebuilt is not None:
+            return self.prebuilt.column('hash')
+        return [document_hash(doc) for doc in self]
 
 
-def create_voter_documents(voters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def create_voter_documents(voters: Union[VoterTable, Iterable[Mapping]]) -> VoterDocuments:
     """
     Create searchable text documents from voter records.
     
     Args:
-        voters: List of voter dictionaries
+        voters: VoterTable (or an iterable of voter dictionaries)
         
     Returns:
-        List of documents with text content and metadata
+        Sequence of documents with text content and metadata
     """
-    documents = []
-    
-    for voter in voters:
-        # Create a rich text representation for semantic search
-        text_parts = []
-        
-        # Name variations for better search
-        if voter.get('name'):
-            text_parts.append(f"নাম (Name): {voter['name']}")
-        if voter.get('phonetic_name'):
-            text_parts.append(f"Phonetic Name: {voter['phonetic_name']}")
-        
-        # Father's name
-        if voter.get('father_name'):
-            text_parts.append(f"পিতার নাম (Father's Name): {voter['father_name']}")
-        if voter.get('phonetic_father_name'):
-            text_parts.append(f"Phonetic Father: {voter['phonetic_father_name']}")
-        
-        # Mother's name
-        if voter.get('mother_name'):
-            text_parts.append(f"মাতার নাম (Mother's Name): {voter['mother_name']}")
-        
-        # Occupation
-        if voter.get('occupation'):
-            text_parts.append(f"পেশা (Occupation): {voter['occupation']}")
-        
-        # Date of birth
-        if voter.get('date_of_birth'):
-            text_parts.append(f"জন্ম তারিখ (Date of Birth): {voter['date_of_birth']}")
-        
-        # Address
-        if voter.get('address'):
-            text_parts.append(f"ঠিকানা (Address): {voter['address']}")
-        
-        # Ward and Union
-        if voter.get('ward'):
-            text_parts.append(f"ওয়ার্ড নং (Ward No): {voter['ward']}")
-        if voter.get('ward_bn'):
-            text_parts.append(f"ওয়ার্ড (বাংলা): {voter['ward_bn']}")
-        if voter.get('union'):
-            text_parts.append(f"ইউনিয়ন (Union): {voter['union']}")
-        
-        # Gender
-        if voter.get('gender'):
-            text_parts.append(f"লিঙ্গ (Gender): {voter['gender']}")
-        
-        # Serial number
-        if voter.get('serial'):
-            text_parts.append(f"ক্রমিক নং (Serial): {voter['serial']}")
-        
-        # Create the document
-        doc = {
-            'id': str(voter.get('id', '')),
-            'content': '\n'.join(text_parts),
-            'metadata': {
-                'id': str(voter.get('id', '')),
-                'name': voter.get('name', ''),
-                'father_name': voter.get('father_name', ''),
-                'mother_name': voter.get('mother_name', ''),
-                'occupation': voter.get('occupation', ''),
-                'ward': voter.get('ward', ''),
-                'union': voter.get('union', ''),
-                'gender': voter.get('gender', ''),
-                'date_of_birth': voter.get('date_of_birth', ''),
-                'address': voter.get('address', ''),
-                'serial': voter.get('serial', '')
-            }
-        }
-        documents.append(doc)
-    
-    return documents
+    if not isinstance(voters, VoterTable):
+        voters = VoterTable.from_records(voters)
+    return VoterDocuments(voters)
+
+
+def split_statement_ranges(file_path: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split the dump into byte ranges that start at INSERT statement boundaries.
+
+    Args:
+        file_path: Path to the SQL dump file
+        parts: Desired number of ranges (fewer are returned for small dumps)
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file, in order
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bounds = [0]
+            for i in range(1, parts):
+                target = max(size * i // parts, bounds[-1])
+                match = _STATEMENT_START_RE.search(mm, target)
+                if match is None:
+                    break
+                if match.start() + 1 > bounds[-1]:
+                    bounds.append(match.start() + 1)
+            bounds.append(size)
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def _load_range(task: Tuple[str, int, int]) -> VoterTable:
+    """Process pool worker: parse one byte range into a VoterTable."""
+    file_path, start, end = task
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = mm[start:end].decode('utf-8')
+
+    return _rows_to_table(iter_insert_rows(io.StringIO(content), offset=start))
 
 
-def load_voters_from_sql(file_path: str) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+def load_voters_parallel(file_path: str, workers: int) -> VoterTable:
+    """
+    Parse the dump on a process pool.
+
+    The dump is cut at INSERT statement boundaries and each worker parses
+    its own byte range of the memory-mapped file into a VoterTable. The
+    compact tables are shipped back and concatenated in file order, so
+    the result matches the serial path exactly.
+
+    Args:
+        file_path: Path to the SQL dump file
+        workers: Number of worker processes
+
+    Returns:
+        VoterTable holding the voter records
+    """
+    # A few ranges per worker keeps the pool busy when statements vary in size
+    ranges = split_statement_ranges(file_path, workers * 4)
+    tasks = [(file_path, start, end) for start, end in ranges]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return VoterTable.concat(pool.map(_load_range, tasks))
+
+
+def load_voters_from_sql(
+    file_path: str,
+    limit: Optional[int] = None,
+    workers: int = 1
+) -> tuple[VoterTable, VoterDocuments]:
     """
     Main function to load voters from SQL dump and create documents.
     
     Args:
         file_path: Path to the SQL dump file
+        limit: Maximum number of voters to load (None for all)
+        workers: Worker processes for parsing; 1 parses serially
         
     Returns:
-        Tuple of (raw voters list, documents list)
+        Tuple of (voter table, documents built from it)
     """
     print(f"Loading voters from {file_path}...")
-    voters = parse_sql_dump(file_path)
-    print(f"Parsed {len(voters)} voter records")
+    if workers > 1 and limit is None:
+        voters = load_voters_parallel(file_path, workers)
+        print(f"Parsed {len(voters)} voter records with {workers} workers")
+    else:
+        voters = parse_sql_dump(file_path, limit=limit)
+        print(f"Parsed {len(voters)} voter records")
     
     documents = create_voter_documents(voters)
     print(f"Created {len(documents)} searchable documents")
@@ -256,28 +561,25 @@ def load_voters_from_sql(file_path: str) -> tuple[List[Dict[str, Any]], List[Dic
     return voters, documents
 
 
-def get_statistics(voters: List[Dict[str, Any]]) -> Dict[str, Any]:
+def get_statistics(voters: Union[VoterTable, Iterable[Mapping]]) -> Dict[str, Any]:
     """
     Calculate statistics from voter data.
+
+    Counts come from one pass over the table's interned column codes
+    (see VoterStatistics), without copying the data into a DataFrame.
     """
-    df = pd.DataFrame(voters)
-    
-    stats = {
-        'total_voters': len(voters),
-        'by_occupation': df['occupation'].value_counts().to_dict() if 'occupation' in df.columns else {},
-        'by_ward': df['ward'].value_counts().to_dict() if 'ward' in df.columns else {},
-        'by_gender': df['gender'].value_counts().to_dict() if 'gender' in df.columns else {},
-        'unions': df['union'].unique().tolist() if 'union' in df.columns else []
-    }
-    
-    return stats
+    if not isinstance(voters, VoterTable):
+        voters = VoterTable.from_records(voters)
+    return VoterStatistics.from_table(voters).summary()
 
 
 if __name__ == "__main__":
     # Test the data loader
-    from config import SQL_DUMP_PATH
+    from config import SQL_DUMP_PATH, SQL_ROW_LIMIT, INGEST_WORKERS
     
-    voters, documents = load_voters_from_sql(SQL_DUMP_PATH)
+    voters, documents = load_voters_from_sql(
+        SQL_DUMP_PATH, limit=SQL_ROW_LIMIT, workers=INGEST_WORKERS
+    )
     stats = get_statistics(voters)
     
     print("\n--- Statistics ---")
@@ -0,0 +1,295 @@
+"""
+Snapshot Module
+Memory-mapped binary snapshot of the parsed dump, its documents and statistics
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from utils.data_loader import VoterDocuments, load_voters_from_sql, prebuild_documents
+from utils.statistics import VoterStatistics
+from utils.voter_table import VoterTable
+
+
+# Bumped whenever the layout, the documents or the statistics change shape
+FORMAT_VERSION = 2
+
+_MAGIC = b"VOTERSNP"
+_HEADER = struct.Struct('<8sII')  # magic, format version, metadata length
+_ALIGN = 8
+# Trailing spaces after the JSON block, so the source key can be rewritten
+# in place when it grows a little (JSON ignores the padding)
+_META_SLACK = 64
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file's contents, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dump_signature(dump_path: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    """What a snapshot of the dump is keyed by, apart from the content hash."""
+    stat = os.stat(dump_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'limit': limit}
+
+
+def save_snapshot(
+    path: str,
+    source: Dict[str, Any],
+    voters: VoterTable,
+    documents: VoterDocuments,
+    statistics: VoterStatistics
+):
+    """
+    Write the voter table, prebuilt documents and statistics to one file.
+
+    The file is a small header, a JSON block (source key, statistics,
+    table layouts and buffer offsets) and then every column buffer,
+    8-byte aligned so it can be memory-mapped and used in place.
+
+    Args:
+        path: Snapshot file to (atomically) replace
+        source: dump_signature() of the dump plus its 'sha256'
+        voters: Parsed voter table
+        documents: Documents of that table; built and hashed here unless prebuilt
+        statistics: Statistics of the table
+    """
+    prebuilt = documents.prebuilt if documents.prebuilt is not None else prebuild_documents(documents)
+    tables, buffers = {}, []
+    for name, table in (('voters', voters), ('documents', prebuilt)):
+        tables[name], table_buffers = table.buffers()
+        buffers.extend(table_buffers)
+
+    views = [memoryview(buffer) for buffer in buffers]
+    layout, offset = [], 0
+    for view in views:
+        offset = _aligned(offset)
+        layout.append([offset, view.nbytes, view.format])
+        offset += view.nbytes
+
+    meta = json.dumps({
+        'source': source,
+        'statistics': statistics.to_dict(),
+        'tables': tables,
+        'buffers': layout,
+    }, ensure_ascii=False).encode('utf-8') + b' ' * _META_SLACK
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, len(meta)))
+        f.write(meta)
+        start = _aligned(f.tell())
+        for view, (offset, _, _) in zip(views, layout):
+            f.write(b'\0' * (start + offset - f.tell()))
+            f.write(view.cast('B'))
+    os.replace(tmp_path, path)
+
+
+def open_snapshot(path: str) -> Optional[Tuple[Dict[str, Any], VoterTable, VoterDocuments, VoterStatistics]]:
+    """
+    Memory-map a snapshot, whatever dump it was taken from.
+
+    The table and documents read their columns straight from the mapping,
+    so pages are only loaded when used.
+
+    Returns:
+        (source key, voters, documents, statistics), or None if the file
+        is missing or from another FORMAT_VERSION
+    """
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return None
+    with f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return None
+        magic, version, meta_length = _HEADER.unpack(header)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            return None
+        meta = json.loads(f.read(meta_length).decode('utf-8'))
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    data = memoryview(mapping)[_aligned(_HEADER.size + meta_length):]
+    buffers = [data[offset:offset + length].cast(typecode) for offset, length, typecode in meta['buffers']]
+    voter_buffers = sum(layout['buffers'] for layout in meta['tables']['voters']['layouts'])
+    voters = VoterTable.from_buffers(meta['tables']['voters'], buffers[:voter_buffers])
+    prebuilt = VoterTable.from_buffers(meta['tables']['documents'], buffers[voter_buffers:])
+    statistics = VoterStatistics.from_dict(meta['statistics'])
+    return meta['source'], voters, VoterDocuments(voters, prebuilt), statistics
+
+
+def update_source(path: str, source: Dict[str, Any]) -> bool:
+    """
+    Rewrite a snapshot's source key in place, leaving its buffers untouched.
+
+    Returns:
+        True if it was rewritten; False if the file is unreadable, not
+        writable or the new key does not fit in the metadata block
+    """
+    try:
+        with open(path, 'r+b') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return False
+            magic, version, meta_length = _HEADER.unpack(header)
+            if magic != _MAGIC or version != FORMAT_VERSION:
+                return False
+            meta = json.loads(f.read(meta_length).decode('utf-8'))
+            meta['source'] = source
+            encoded = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+            if len(encoded) > meta_length:
+                return False
+            f.seek(_HEADER.size)
+            f.write(encoded + b' ' * (meta_length - len(encoded)))
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def is_current(
+    source: Dict[str, Any],
+    dump_path: str,
+    limit: Optional[int] = None,
+    snapshot_path: Optional[str] = None
+) -> bool:
+    """
+    Whether a snapshot's source key still matches the dump.
+
+    It matches for the same row limit and a dump of the same size whose
+    mtime is unchanged or, after a touch or copy, whose SHA-256 is. In
+    the second case the new mtime is written back to the snapshot at
+    snapshot_path, so the next start does not hash the dump again.
+    """
+    signature = dump_signature(dump_path, limit)
+    if source['size'] != signature['size'] or source['limit'] != limit:
+        return False
+    if source['mtime_ns'] == signature['mtime_ns']:
+        return True
+    if source['sha256'] != file_sha256(dump_path):
+        return False
+    if snapshot_path is not None:
+        source['mtime_ns'] = signature['mtime_ns']
+        update_source(snapshot_path, source)
+    return True
+
+
+def load_snapshot(
+    path: str,
+    dump_path: str,
+    limit: Optional[int] = None
+) -> Optional[Tuple[VoterTable, VoterDocuments, VoterStatistics]]:
+    """
+    Open a snapshot if it still matches the dump.
+
+    Returns:
+        (voters, documents, statistics), or None if missing or stale
+    """
+    snapshot = open_snapshot(path)
+    if snapshot is None or not is_current(snapshot[0], dump_path, limit, path):
+        return None
+    return snapshot[1:]
+
+
+def sync_statistics(
+    statistics: VoterStatistics,
+    old_documents: VoterDocuments,
+    documents: VoterDocuments
+) -> Optional[Tuple[int, int]]:
+    """
+    Update statistics in place from one version of the voters to the next.
+
+    Voters are matched by document id and compared by document hash,
+    the way the vector store syncs: only those that were removed, added
+    or changed are uncounted and recounted.
+
+    Args:
+        statistics: Counts over old_documents' voters, updated in place
+        old_documents: Previous voters (from the previous snapshot)
+        documents: Current voters
+
+    Returns:
+        (uncounted, counted) voters, or None when ids are not unique and
+        the statistics should be recounted instead
+    """
+    old = {doc_id: (digest, row) for row, (doc_id, digest)
+           in enumerate(zip(old_documents.ids(), old_documents.hashes()))}
+    new = {doc_id: (digest, row) for row, (doc_id, digest)
+           in enumerate(zip(documents.ids(), documents.hashes()))}
+    if len(old) != len(old_documents) or len(new) != len(documents):
+        return None
+
+    removed = [old_documents.table[row] for doc_id, (digest, row) in old.items()
+               if new.get(doc_id, (None,))[0] != digest]
+    added = [documents.table[row] for doc_id, (digest, row) in new.items()
+             if old.get(doc_id, (None,))[0] != digest]
+    statistics.apply(removed, added)
+    return len(removed), len(added)
+
+
+def load_voter_data(
+    dump_path: str,
+    snapshot_path: Optional[str] = None,
+    limit: Optional[int] = None,
+    workers: int = 1
+) -> Tuple[VoterTable, VoterDocuments, VoterStatistics]:
+    """
+    Voters, documents and statistics, from the snapshot when it is fresh.
+
+    Otherwise the dump is parsed and its documents built and
+    fingerprinted. The previous snapshot's statistics are synced with the
+    voters that changed (or, without one, counted in one pass) and a new
+    snapshot is written for the next start.
+
+    Args:
+        dump_path: Path to the SQL dump file
+        snapshot_path: Snapshot file (None always parses the dump)
+        limit: Maximum number of voters to load (None for all)
+        workers: Worker processes for parsing; 1 parses serially
+
+    Returns:
+        Tuple of (voter table, documents, statistics)
+    """
+    if snapshot_path is None:
+        voters, documents = load_voters_from_sql(dump_path, limit=limit, workers=workers)
+        return voters, documents, VoterStatistics.from_table(voters)
+
+    start = time.perf_counter()
+    previous = open_snapshot(snapshot_path)
+    if previous is not None and is_current(previous[0], dump_path, limit, snapshot_path):
+        print(f"Loaded {len(previous[1])} voters from snapshot {snapshot_path} "
+              f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+        return previous[1:]
+
+    # Keyed by the dump as it was before parsing, in case it changes meanwhile
+    source = dump_signature(dump_path, limit)
+    source['sha256'] = file_sha256(dump_path)
+    voters, documents = load_voters_from_sql(dump_path, limit=limit, workers=workers)
+
+    start = time.perf_counter()
+    documents = VoterDocuments(voters, prebuild_documents(documents))
+    synced = None
+    if previous is not None:
+        statistics = previous[3]
+        synced = sync_statistics(statistics, previous[2], documents)
+    if synced is None:
+        statistics = VoterStatistics.from_table(voters)
+    else:
+        print(f"Synced statistics: {synced[0]} voters uncounted, {synced[1]} counted")
+    save_snapshot(snapshot_path, source, voters, documents, statistics)
+    print(f"Wrote snapshot {snapshot_path} ({os.path.getsize(snapshot_path) / 1e6:.1f} MB, "
+          f"{time.perf_counter() - start:.1f}s)")
+    return voters, documents, statistics
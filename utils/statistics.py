@@ -0,0 +1,155 @@
+"""
+Statistics Module
+Incrementally maintained voter counts for the sidebar and stats endpoints
+"""
+from collections.abc import Mapping
+from typing import Dict, Any, Iterable, Optional
+
+from utils.text import birth_year
+from utils.voter_table import VoterTable
+
+
+# Columns counted value by value
+COUNTED_COLUMNS = ('occupation', 'ward', 'gender', 'union')
+
+
+def _bump(counts: Dict, key, delta: int):
+    count = counts.get(key, 0) + delta
+    if count > 0:
+        counts[key] = count
+    else:
+        counts.pop(key, None)
+
+
+def _descending(counts: Dict[str, int]) -> Dict[str, int]:
+    return dict(sorted(counts.items(), key=lambda pair: -pair[1]))
+
+
+class VoterStatistics:
+    """
+    Running counts over a set of voters.
+
+    Holds the total, counts by occupation, ward, gender and union, a
+    birth-year histogram and a ward x gender cross-tab. Built in one pass
+    over a table (from_table) and then kept current with add() and
+    remove() as voters change, instead of being recounted. summary() is
+    cached between changes, so readers get it in O(1); to_dict() and
+    from_dict() round-trip through JSON.
+
+    Records may be voter rows or document metadata; both carry the
+    counted columns and date_of_birth.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.counts: Dict[str, Dict[str, int]] = {column: {} for column in COUNTED_COLUMNS}
+        self.birth_years: Dict[int, int] = {}
+        self.ward_gender: Dict[str, Dict[str, int]] = {}
+        self._summary: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_table(cls, table: VoterTable) -> 'VoterStatistics':
+        """Count a whole table in one pass over its interned column codes."""
+        stats = cls()
+        stats.total = len(table)
+        for column in COUNTED_COLUMNS:
+            categories = table.categories(column)
+            tally = [0] * len(categories)
+            for code in table.codes(column):
+                tally[code] += 1
+            counts = stats.counts[column]
+            for code in range(1, len(categories)):
+                if tally[code] and categories[code]:
+                    _bump(counts, categories[code], tally[code])
+
+        years: Dict[Optional[str], int] = {}
+        for value in table.column('date_of_birth'):
+            # Many voters share a date of birth; parse each distinct one once
+            year = years.get(value)
+            if year is None:
+                year = years[value] = birth_year(value)
+            if year:
+                stats.birth_years[year] = stats.birth_years.get(year, 0) + 1
+
+        wards, genders = table.categories('ward'), table.categories('gender')
+        pairs: Dict[tuple, int] = {}
+        for pair in zip(table.codes('ward'), table.codes('gender')):
+            pairs[pair] = pairs.get(pair, 0) + 1
+        for (ward, gender), count in pairs.items():
+            if wards[ward] and genders[gender]:
+                _bump(stats.ward_gender.setdefault(wards[ward], {}), genders[gender], count)
+        return stats
+
+    def add(self, record: Mapping, delta: int = 1):
+        """Count one voter (delta=-1 uncounts it)."""
+        self.total += delta
+        for column in COUNTED_COLUMNS:
+            value = record.get(column)
+            if value:
+                _bump(self.counts[column], value, delta)
+
+        year = birth_year(record.get('date_of_birth'))
+        if year:
+            _bump(self.birth_years, year, delta)
+
+        ward, gender = record.get('ward'), record.get('gender')
+        if ward and gender:
+            genders = self.ward_gender.setdefault(ward, {})
+            _bump(genders, gender, delta)
+            if not genders:
+                del self.ward_gender[ward]
+        self._summary = None
+
+    def remove(self, record: Mapping):
+        """Uncount one voter, e.g. the old version of an updated one."""
+        self.add(record, delta=-1)
+
+    def apply(self, removed: Iterable[Mapping] = (), added: Iterable[Mapping] = ()):
+        """Apply a sync: uncount deleted/old records, count new/updated ones."""
+        for record in removed:
+            self.remove(record)
+        for record in added:
+            self.add(record)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Read-only view for display, recomputed only after a change.
+
+        Returns:
+            Dictionary with total_voters, by_occupation, by_ward,
+            by_gender and by_union (most frequent first), unions (in
+            first-appearance order),
+            by_birth_year (by year) and ward_gender ({ward: {gender: n}})
+        """
+        if self._summary is None:
+            self._summary = {
+                'total_voters': self.total,
+                'by_occupation': _descending(self.counts['occupation']),
+                'by_ward': _descending(self.counts['ward']),
+                'by_gender': _descending(self.counts['gender']),
+                'by_union': _descending(self.counts['union']),
+                # Counts keep the order values were first seen in
+                'unions': list(self.counts['union']),
+                'by_birth_year': dict(sorted(self.birth_years.items())),
+                'ward_gender': {ward: dict(genders) for ward, genders in self.ward_gender.items()},
+            }
+        return self._summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form."""
+        return {
+            'total': self.total,
+            'counts': self.counts,
+            'birth_years': {str(year): count for year, count in self.birth_years.items()},
+            'ward_gender': self.ward_gender,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'VoterStatistics':
+        """Inverse of to_dict()."""
+        stats = cls()
+        stats.total = data['total']
+        stats.counts = {column: dict(data['counts'].get(column, {})) for column in COUNTED_COLUMNS}
+        stats.birth_years = {int(year): count for year, count in data['birth_years'].items()}
+        stats.ward_gender = {ward: dict(genders) for ward, genders in data['ward_gender'].items()}
+        return stats
@@ -0,0 +1,195 @@
+"""
+Text Normalization Module
+Helpers for matching Bengali and English voter text
+"""
+import re
+import unicodedata
+from typing import List, Optional
+
+
+BENGALI_DIGITS = str.maketrans('০১২৩৪৫৬৭৮৯', '0123456789')
+_BENGALI_DIGIT_RE = re.compile('[০-৯]+')
+
+# Punctuation, the Bengali visarga used as an abbreviation mark (মোঃ)
+# and the danda
+_NAME_PUNCTUATION_RE = re.compile("[\\s.,:;'\"`()\\[\\]\\-_/\\\\ঃ।]+")
+
+# Zero-width (non-)joiners only change glyph shaping
+_ZERO_WIDTH = dict.fromkeys((0x200C, 0x200D))
+
+# Word characters: ASCII letters and digits plus the whole Bengali block,
+# whose vowel signs and hasanta are combining marks that \w does not match
+_TOKEN_RE = re.compile('[0-9a-z\u0980-\u09ff]+')
+
+# Honorifics that are written inconsistently and carry no identity
+NAME_TITLES = {'মো', 'মোছা', 'মোসা', 'মোসাম্মৎ', 'md', 'mst', 'mr', 'mrs', 'dr'}
+
+# A plausible birth year, not part of a longer number
+YEAR_RE = re.compile(r'(?<!\d)(1[89]\d\d|20\d\d)(?!\d)')
+
+
+def _ascii_digits(match: re.Match) -> str:
+    return match.group(0).translate(BENGALI_DIGITS)
+
+
+def normalize_digits(text: str) -> str:
+    """Replace Bengali digits (০-৯) with ASCII digits."""
+    # Translating only the digit runs is much cheaper than str.translate
+    # over a whole document
+    return _BENGALI_DIGIT_RE.sub(_ascii_digits, text)
+
+
+def normalize_text(text: str) -> str:
+    """Unicode NFC, ASCII digits, no zero-width joiners, lowercase."""
+    text = unicodedata.normalize('NFC', normalize_digits(text))
+    if '\u200c' in text or '\u200d' in text:
+        text = text.translate(_ZERO_WIDTH)
+    return text.lower()
+
+
+def normalize_value(value: str) -> str:
+    """Comparable form of a category value: '০১', '01' and '1' compare equal."""
+    value = normalize_text(value).strip()
+    if value.isdigit():
+        return str(int(value))
+    return value
+
+
+def birth_year(date_of_birth: Optional[str]) -> int:
+    """
+    Year from a date of birth like 19/04/2004 or 2004-04-19.
+
+    Returns:
+        The year, or 0 when it cannot be read
+    """
+    if not date_of_birth:
+        return 0
+    match = YEAR_RE.search(normalize_digits(date_of_birth))
+    return int(match.group(1)) if match else 0
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split Bengali/English text into search tokens.
+
+    Digits are made ASCII, zero-width joiners removed and case folded;
+    dates and ids split on their separators (19/04/2004 -> 19, 04, 2004).
+    """
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+def normalize_name(text: str) -> str:
+    """
+    Canonical form of a person's name for exact matching.
+
+    Unicode NFC, ASCII digits, lowercase, punctuation collapsed to single
+    spaces and honorifics such as মোঃ / Md. dropped.
+    """
+    text = normalize_text(text)
+    tokens = [t for t in _NAME_PUNCTUATION_RE.split(text) if t and t not in NAME_TITLES]
+    return ' '.join(tokens)
+
+
+# Bengali -> Latin transliteration tables (a phonetic approximation, not a
+# reversible scheme: it only has to land close to how people type names)
+_INDEPENDENT_VOWELS = {
+    'অ': 'o', 'আ': 'a', 'ই': 'i', 'ঈ': 'i', 'উ': 'u', 'ঊ': 'u', 'ঋ': 'ri',
+    'এ': 'e', 'ঐ': 'oi', 'ও': 'o', 'ঔ': 'ou',
+}
+_VOWEL_SIGNS = {
+    'া': 'a', 'ি': 'i', 'ী': 'i', 'ু': 'u', 'ূ': 'u', 'ৃ': 'ri',
+    'ে': 'e', 'ৈ': 'oi', 'ো': 'o', 'ৌ': 'ou',
+}
+_CONSONANTS = {
+    'ক': 'k', 'খ': 'kh', 'গ': 'g', 'ঘ': 'gh', 'ঙ': 'ng',
+    'চ': 'ch', 'ছ': 'chh', 'জ': 'j', 'ঝ': 'jh', 'ঞ': 'n',
+    'ট': 't', 'ঠ': 'th', 'ড': 'd', 'ঢ': 'dh', 'ণ': 'n',
+    'ত': 't', 'থ': 'th', 'দ': 'd', 'ধ': 'dh', 'ন': 'n',
+    'প': 'p', 'ফ': 'f', 'ব': 'b', 'ভ': 'bh', 'ম': 'm',
+    'য': 'j', 'র': 'r', 'ল': 'l', 'শ': 'sh', 'ষ': 'sh', 'স': 's', 'হ': 'h',
+    '\u09dc': 'r', '\u09dd': 'rh', '\u09df': 'y',  # ড় ঢ় য়
+}
+_OTHER_SIGNS = {'ৎ': 't', 'ং': 'ng', 'ঃ': 'h', 'ঁ': ''}
+_HASANTA = '্'
+# NFC leaves these as base letter + nukta; fold them back to the
+# precomposed letters used as _CONSONANTS keys (escaped, since an editor
+# or normalizer may silently decompose the literals)
+_NUKTA_FORMS = (
+    ('\u09a1\u09bc', '\u09dc'),  # ড় (ড + nukta)
+    ('\u09a2\u09bc', '\u09dd'),  # ঢ় (ঢ + nukta)
+    ('\u09af\u09bc', '\u09df'),  # য় (য + nukta)
+)
+
+# Spelling variants that sound the same in romanized Bengali names
+_PHONETIC_RULES = [
+    (re.compile(pattern), replacement) for pattern, replacement in (
+        (r'[^a-z ]+', ''),
+        (r'(.)\1+', r'\1'),
+        (r'ph', 'f'), (r'q', 'k'), (r'z', 'j'), (r'v', 'b'), (r'w', 'o'),
+        (r'([kgcjtdb])h', r'\1'), (r'sh', 's'),
+        (r'ee', 'i'), (r'oo', 'u'), (r'y', 'i'),
+        # A glide between vowels is usually not typed: মিয়া/Mia, বড়ুয়া/Barua
+        (r'([aeiou])i(?=[aeiou])', r'\1'),
+        (r'o', 'a'),
+        (r'(.)\1+', r'\1'),
+    )
+]
+
+
+def is_latin(text: str) -> bool:
+    """Whether the text contains ASCII letters and no Bengali characters."""
+    has_latin = False
+    for char in text:
+        if 'ঀ' <= char <= '৿':
+            return False
+        if 'a' <= char.lower() <= 'z':
+            has_latin = True
+    return has_latin
+
+
+def transliterate_bengali(text: str) -> str:
+    """
+    Romanize Bengali text the way names are commonly typed in English.
+
+    Consonants carry an inherent 'o' unless followed by a vowel sign or a
+    hasanta, and word-final inherent vowels are dropped (রফিকুল -> rofikul).
+    Non-Bengali characters pass through unchanged.
+    """
+    text = unicodedata.normalize('NFC', text)
+    for decomposed, composed in _NUKTA_FORMS:
+        text = text.replace(decomposed, composed)
+
+    out = []
+    length = len(text)
+    for i, char in enumerate(text):
+        if char in _CONSONANTS:
+            out.append(_CONSONANTS[char])
+            following = text[i + 1] if i + 1 < length else ''
+            if following and following not in _VOWEL_SIGNS and following != _HASANTA \
+                    and ('ঀ' <= following <= '৿') and following not in _OTHER_SIGNS:
+                out.append('o')
+        elif char in _VOWEL_SIGNS:
+            out.append(_VOWEL_SIGNS[char])
+        elif char in _INDEPENDENT_VOWELS:
+            out.append(_INDEPENDENT_VOWELS[char])
+        elif char in _OTHER_SIGNS:
+            out.append(_OTHER_SIGNS[char])
+        elif char == _HASANTA or char in '‌‍':
+            continue
+        else:
+            out.append(char)
+    return ''.join(out)
+
+
+def phonetic_key(text: str) -> str:
+    """
+    Script-independent sound key of a name.
+
+    Bengali is transliterated first, then common romanization variants are
+    folded together (ph/f, q/k, aspirates, doubled letters, o/a), so
+    "Rafiqul Hossain", "Rofikul Hosain" and রফিকুল হোসেন land close together.
+    """
+    key = transliterate_bengali(normalize_name(text))
+    for pattern, replacement in _PHONETIC_RULES:
+        key = pattern.sub(replacement, key)
+    return ' '.join(word for word in key.split(' ') if word)
@@ -0,0 +1,333 @@
+"""
+Voter Table Module
+Column-oriented in-memory storage for parsed voter records
+"""
+from array import array
+from collections.abc import Mapping
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+
+# Column names based on the CREATE TABLE statement
+VOTER_COLUMNS = [
+    'id', 'serial_bn', 'serial', 'name', 'name_normalized',
+    'voter_id_bn', 'voter_id', 'father_name', 'father_name_normalized',
+    'mother_name', 'occupation', 'date_of_birth', 'address',
+    'voter_area_no_bn', 'voter_area_no', 'union', 'ward_bn', 'ward',
+    'gender', 'created_at', 'updated_at', 'phonetic_name', 'phonetic_father_name'
+]
+
+# Low-cardinality columns stored as codes into a list of distinct values
+CATEGORICAL_COLUMNS = (
+    'occupation', 'voter_area_no_bn', 'voter_area_no',
+    'union', 'ward_bn', 'ward', 'gender'
+)
+
+
+class _StringColumn:
+    """Strings packed into one UTF-8 buffer, addressed by an offsets array."""
+
+    __slots__ = ('data', 'offsets', 'nulls')
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array('Q', [0])
+        self.nulls = bytearray()
+
+    def append(self, value: Optional[str]):
+        if value is None:
+            self.nulls.append(1)
+        else:
+            self.nulls.append(0)
+            self.data += value.encode('utf-8')
+        self.offsets.append(len(self.data))
+
+    def get(self, index: int) -> Optional[str]:
+        if self.nulls[index]:
+            return None
+        return str(self.data[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def extend_from(self, other: '_StringColumn'):
+        base = len(self.data)
+        self.data += other.data
+        self.offsets.extend(base + offset for offset in other.offsets[1:])
+        self.nulls += other.nulls
+
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.itemsize * len(self.offsets) + len(self.nulls)
+
+    def buffers(self) -> Tuple[Dict[str, Any], list]:
+        return {'kind': 'string'}, [self.data, self.offsets, self.nulls]
+
+    @classmethod
+    def from_buffers(cls, layout: Dict[str, Any], buffers: List[memoryview]) -> '_StringColumn':
+        column = cls.__new__(cls)
+        column.data, column.offsets, column.nulls = buffers
+        return column
+
+
+class _CategoryColumn:
+    """Interned values: one small integer code per row, code 0 is NULL."""
+
+    __slots__ = ('codes', 'categories', 'lookup')
+
+    def __init__(self):
+        self.codes = array('H')
+        self.categories: List[Optional[str]] = [None]
+        self.lookup: Dict[Optional[str], int] = {None: 0}
+
+    def code_for(self, value: Optional[str]) -> int:
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            self.lookup[value] = code
+            if code > 0xFFFF and self.codes.typecode == 'H':
+                self.codes = array('I', self.codes)
+        return code
+
+    def append(self, value: Optional[str]):
+        self.codes.append(self.code_for(value))
+
+    def get(self, index: int) -> Optional[str]:
+        return self.categories[self.codes[index]]
+
+    def extend_from(self, other: '_CategoryColumn'):
+        remap = [self.code_for(value) for value in other.categories]
+        self.codes.extend(remap[code] for code in other.codes)
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+    def buffers(self) -> Tuple[Dict[str, Any], list]:
+        return {'kind': 'category', 'categories': self.categories}, [self.codes]
+
+    @classmethod
+    def from_buffers(cls, layout: Dict[str, Any], buffers: List[memoryview]) -> '_CategoryColumn':
+        column = cls.__new__(cls)
+        column.codes = buffers[0]
+        column.categories = layout['categories']
+        column.lookup = {value: code for code, value in enumerate(column.categories)}
+        return column
+
+
+class VoterRow(Mapping):
+    """
+    Lazy, read-only view of one row of a VoterTable.
+
+    Behaves like the voter dict the loader used to return; values are
+    decoded from the table only when accessed.
+    """
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'VoterTable', index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str) -> Optional[str]:
+        return self._table.value(self._index, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.columns)
+
+    def __len__(self) -> int:
+        return len(self._table.columns)
+
+    @property
+    def index(self) -> int:
+        """Row position in the table."""
+        return self._index
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Materialize the row as a plain dict."""
+        return {column: self[column] for column in self._table.columns}
+
+    def __repr__(self) -> str:
+        return f"VoterRow({self.to_dict()!r})"
+
+
+class VoterTable:
+    """
+    Column-oriented store for voter records.
+
+    Text columns are packed into UTF-8 buffers and low-cardinality columns
+    (ward, union, gender, occupation, ...) are stored as integer codes, so
+    each value is held exactly once. Rows are handed out as lazy VoterRow
+    views rather than dicts.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str] = VOTER_COLUMNS,
+        categorical: Iterable[str] = CATEGORICAL_COLUMNS
+    ):
+        """
+        Initialize an empty table.
+
+        Args:
+            columns: Column names, in row order
+            categorical: Columns to store as interned codes
+        """
+        categorical = set(categorical)
+        self.columns = list(columns)
+        self._positions = {column: i for i, column in enumerate(self.columns)}
+        self._data = [
+            _CategoryColumn() if column in categorical else _StringColumn()
+            for column in self.columns
+        ]
+        self._length = 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping]) -> 'VoterTable':
+        """Build a table from voter dicts (or other mappings)."""
+        table = cls()
+        table.extend(records)
+        return table
+
+    @classmethod
+    def concat(cls, tables: Iterable['VoterTable']) -> 'VoterTable':
+        """Join tables with the same columns, keeping their order."""
+        result = cls()
+        for table in tables:
+            for mine, theirs in zip(result._data, table._data):
+                mine.extend_from(theirs)
+            result._length += len(table)
+        return result
+
+    def append_values(self, values: Sequence[Optional[str]]):
+        """Append one row given as values in column order."""
+        for column, value in zip(self._data, values):
+            column.append(value)
+        self._length += 1
+
+    def append(self, record: Mapping):
+        """Append one row given as a mapping; missing columns become None."""
+        self.append_values([record.get(column) for column in self.columns])
+
+    def extend(self, records: Iterable[Mapping]):
+        """Append many rows given as mappings."""
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [VoterRow(self, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("voter index out of range")
+        return VoterRow(self, index)
+
+    def __iter__(self) -> Iterator[VoterRow]:
+        for i in range(self._length):
+            yield VoterRow(self, i)
+
+    def value(self, index: int, column: str) -> Optional[str]:
+        """Value of one cell."""
+        position = self._positions.get(column)
+        if position is None:
+            raise KeyError(column)
+        return self._data[position].get(index)
+
+    def column(self, column: str) -> List[Optional[str]]:
+        """All values of a column as a list."""
+        data = self._data[self._positions[column]]
+        if isinstance(data, _CategoryColumn):
+            categories = data.categories
+            return [categories[code] for code in data.codes]
+        return [data.get(i) for i in range(self._length)]
+
+    def is_categorical(self, column: str) -> bool:
+        """Whether a column is stored as interned codes."""
+        return isinstance(self._data[self._positions[column]], _CategoryColumn)
+
+    def codes(self, column: str) -> array:
+        """Per-row codes of a categorical column (0 is NULL)."""
+        return self._data[self._positions[column]].codes
+
+    def categories(self, column: str) -> List[Optional[str]]:
+        """Distinct values of a categorical column, indexed by code."""
+        return self._data[self._positions[column]].categories
+
+    def value_counts(self, column: str) -> Dict[str, int]:
+        """
+        Count non-null values of a column, most frequent first.
+
+        Ties keep first-appearance order.
+        """
+        if self.is_categorical(column):
+            categories = self.categories(column)
+            counts = [0] * len(categories)
+            for code in self.codes(column):
+                counts[code] += 1
+            pairs = [(categories[code], counts[code]) for code in range(1, len(categories))]
+        else:
+            tally: Dict[str, int] = {}
+            for value in self.column(column):
+                if value is not None:
+                    tally[value] = tally.get(value, 0) + 1
+            pairs = list(tally.items())
+
+        pairs = [pair for pair in pairs if pair[1] > 0]
+        pairs.sort(key=lambda pair: -pair[1])
+        return dict(pairs)
+
+    def unique(self, column: str) -> List[str]:
+        """Distinct non-null values of a column in first-appearance order."""
+        if self.is_categorical(column):
+            return [value for value in self.categories(column) if value is not None]
+        return list(dict.fromkeys(v for v in self.column(column) if v is not None))
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the column buffers."""
+        return sum(data.nbytes() for data in self._data)
+
+    def buffers(self) -> Tuple[Dict[str, Any], list]:
+        """
+        The table as a JSON-able layout plus its raw column buffers.
+
+        Buffers are bytearrays and arrays (typecode 'B', 'H', 'I' or 'Q')
+        that can be written to disk as they are; from_buffers() rebuilds
+        the table on top of them.
+        """
+        layouts, buffers = [], []
+        for data in self._data:
+            layout, column_buffers = data.buffers()
+            layout['buffers'] = len(column_buffers)
+            layouts.append(layout)
+            buffers.extend(column_buffers)
+        return {'columns': self.columns, 'length': self._length, 'layouts': layouts}, buffers
+
+    @classmethod
+    def from_buffers(cls, layout: Dict[str, Any], buffers: List[memoryview]) -> 'VoterTable':
+        """
+        Rebuild a table from buffers() output, without copying the buffers.
+
+        With memoryviews over a memory-mapped file the table is read-only
+        and its pages are only read from disk when accessed.
+
+        Args:
+            layout: Layout dict returned by buffers()
+            buffers: The buffers, as memoryviews cast to their typecodes
+        """
+        table = cls.__new__(cls)
+        table.columns = list(layout['columns'])
+        table._positions = {column: i for i, column in enumerate(table.columns)}
+        table._data = []
+        position = 0
+        for column_layout in layout['layouts']:
+            column_type = _CategoryColumn if column_layout['kind'] == 'category' else _StringColumn
+            count = column_layout['buffers']
+            table._data.append(column_type.from_buffers(column_layout, buffers[position:position + count]))
+            position += count
+        table._length = layout['length']
+        return table
+
+    def to_dataframe(self):
+        """Copy the table into a pandas DataFrame (imports pandas on demand)."""
+        import pandas as pd
+
+        return pd.DataFrame({column: self.column(column) for column in self.columns})